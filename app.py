@@ -7,11 +7,13 @@ Clean Taipy implementation
 import os
 import json
 import logging
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Any, List
 import pandas as pd
-from taipy.gui import Gui, navigate, notify
+from taipy.gui import Gui, navigate, notify, get_state_id
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -49,6 +51,7 @@ flat_material = ""
 flat_area = 0.0
 flat_perimeter = 0.0
 flat_weight = 0.0
+flat_bends_json = ""  # flatExtract flanges + bend list (JSON)
 
 # Dynamic Rules Engine state variables
 rules_validation_status = "Ready"
@@ -246,6 +249,9 @@ operations_page = """
 <|{flat_width}|input|label=Width (inches)|type=number|step=0.001|on_change=update_flat_calculations|>
 <|{flat_height}|input|label=Height (inches)|type=number|step=0.001|on_change=update_flat_calculations|>
 <|{flat_material}|selector|label=Material|lov={material_options}|dropdown|on_change=update_flat_calculations|>
+
+### Bend List
+<|{flat_bends_json}|input|label=Flanges + bends (flatExtract JSON)|multiline|on_change=update_flat_pattern|>
 |part|>
 
 <|part|
@@ -823,6 +829,9 @@ def reset_flat_extract(state):
         state.flat_area = 0.0
         state.flat_perimeter = 0.0
         state.flat_weight = 0.0
+        state.flat_bends_json = ""
+        with _flat_patterns_lock:
+            _flat_patterns.pop(get_state_id(state), None)
 
         notify(state, "Flat extract values reset", "info")
 
@@ -872,6 +881,57 @@ def update_flat_calculations(state):
     except Exception as e:
         logger.error(f"Error updating flat calculations: {str(e)}")
 
+# Flat pattern per client session, so a bend edit only re-derives that bend.
+# Bounded LRU: sessions that never reset their flat extract are evicted.
+MAX_FLAT_PATTERNS = 64
+_flat_patterns = OrderedDict()
+_flat_patterns_lock = threading.Lock()
+
+def update_flat_pattern(state):
+    """Develop flat width/height from the flatExtract bend list on every edit"""
+    from src.logic.flat_pattern import AXES, BendAngleError, FlatPattern, parse_flat_extract
+    try:
+        spec = parse_flat_extract(state.flat_bends_json)
+        if not spec['bends'] and not any(spec['flanges'].values()):
+            return
+        thickness = float(spec['thickness_in'] or getattr(state.quote_data, 'thickness_in', None) or 0.125)
+        material = spec['material'] or state.flat_material or None
+
+        key = get_state_id(state)
+        with _flat_patterns_lock:
+            pattern = _flat_patterns.get(key)
+            if pattern is None:
+                pattern = FlatPattern(spec['flanges'], spec['bends'], thickness, material)
+                _flat_patterns[key] = pattern
+                while len(_flat_patterns) > MAX_FLAT_PATTERNS:
+                    _flat_patterns.popitem(last=False)
+            else:
+                _flat_patterns.move_to_end(key)
+                if (thickness, material) != (pattern.thickness_in, pattern.material):
+                    pattern.set_stock(thickness, material)
+                for axis in AXES:
+                    if spec['flanges'][axis] != pattern.flanges[axis]:
+                        pattern.set_flanges(axis, spec['flanges'][axis])
+                pattern.sync(spec['bends'])
+            width, height = pattern.width, pattern.height
+
+        # Only axes with flanges are developed; the other keeps its entered size
+        for axis, size in (('width', width), ('height', height)):
+            if not spec['flanges'][axis]:
+                continue
+            if size <= 0:
+                notify(state, f"Developed {axis} is {size:.4f} in; check the {axis} flanges and bends", "warning")
+                continue
+            setattr(state, f"flat_{axis}", round(size, 4))
+        update_flat_calculations(state)
+
+    except BendAngleError as e:
+        notify(state, str(e), "warning")
+    except ValueError:
+        pass  # incomplete JSON while typing
+    except Exception as e:
+        logger.error(f"Error developing flat pattern: {str(e)}")
+
 # ── Global Rates Functions
 def apply_global_rates(state, setup_rate, labor_rate, machine_rate):
     """Apply global rates to the application"""
@@ -1214,4 +1274,14 @@ if __name__ == "__main__":
             print(f"Invalid port number: {sys.argv[1]}")
             sys.exit(1)
 
+    # Hot-reload changed reference tables in the background unless disabled
+    if os.environ.get("SHOPQUOTE_WATCH_REFERENCE", "1") != "0":
+        from src.core.catalog_watcher import start_catalog_watcher
+        start_catalog_watcher()
+
+    # Re-price saved sessions in the background when Rates/Operations data changes
+    if os.environ.get("SHOPQUOTE_AUTO_REPRICE", "1") != "0":
+        from src.logic.repricing_job import start_repricing_on_change
+        start_repricing_on_change()
+
     gui.run(title="ShopQuote - Integrated", host="0.0.0.0", port=port, debug=True)
\ No newline at end of file
@@ -0,0 +1,274 @@
+# logic/assembly_pricing.py
+"""
+Assembly (BOM) pricing over a DAG of parts and sub-assemblies.
+
+Each node has its own ops and quote fields (material, thickness, flat size,
+hardware, outside processes) and a list of (child, qty per parent) edges.
+A node's cost is memoized and rolled up from its children:
+- per-unit run seconds and per-unit dollars for each material, hardware
+  and outside-process line (keyed by its compute_pricing_table row label),
+  each scaled by the child quantity;
+- setups keyed by (op, material, thickness). A part's own setups under one
+  key add up. A key that appears on several parts is set up once per job,
+  at the longest setup among them;
+- the parts count per assembly.
+
+The pricing table has one row per line label, rounded per cell like
+compute_pricing_table, so a single-part assembly prices exactly like the
+part. In a multi-part assembly, hardware rows are merged by type and
+labelled with the total pieces per assembly (HW-[PEM(8)]), not the
+per-part count.
+
+Run time is stored in seconds, so changing rates, markup or quantities
+never invalidates the memo. Updating one node recomputes only that node and
+its ancestors.
+"""
+from __future__ import annotations
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+from logic.pricing import _line_items, _safe_num, rates_at
+
+SetupKey = Tuple[str, str, float]
+_HW_LABEL = re.compile(r"^HW-\[(.*)\((\d+)\)\]$")
+
+@dataclass
+class AssemblyNode:
+    name: str
+    ops: List[Dict[str, Any]] = field(default_factory=list)
+    quote: Dict[str, Any] = field(default_factory=dict)
+    children: List[Tuple[str, int]] = field(default_factory=list)  # (child name, qty per parent)
+
+@dataclass(frozen=True)
+class NodeCost:
+    """Rolled-up cost of one unit of a node (including everything below it)."""
+    run_sec: float
+    lines: Dict[str, float]           # $ per unit by row label (MAT-[..], HW-[..], OP-[..])
+    setups: Dict[SetupKey, float]     # shared setup minutes per (op, material, thickness)
+    part_setups: Dict[str, float]     # own setup minutes per distinct node below (unshared basis)
+    counts: Dict[str, int]            # units of each node per one of this node
+    op_secs: Tuple[float, ...] = ()   # the node's own op run seconds (own cost only)
+    pieces: Dict[str, int] = field(default_factory=dict)  # items per unit by row label
+
+    def _kind(self, prefix: str) -> float:
+        return sum((v for l, v in self.lines.items() if l.startswith(prefix)), 0.0)
+
+    @property
+    def material(self) -> float:
+        return self._kind("MAT-[")
+
+    @property
+    def hardware(self) -> float:
+        return self._kind("HW-[")
+
+    @property
+    def outside(self) -> float:
+        return self._kind("OP-[")
+
+def setup_key(op: Dict[str, Any], quote: Dict[str, Any]) -> SetupKey:
+    """Setups with the same op on the same material/thickness are shared."""
+    return (str(op.get("operation", "")).strip().lower(),
+            str(quote.get("material") or "").strip().upper(),
+            round(_safe_num(quote.get("thickness_in")), 4))
+
+def _own_cost(node: AssemblyNode) -> NodeCost:
+    """Cost of the node's own ops and adders, without children. Rates-free."""
+    _, _, hw_items, op_items = _line_items(node.ops, node.quote, {"labor": 0.0, "machine": 0.0})
+    # Repeated labels keep the last value, as rows do in compute_pricing_table
+    lines = {label: ppq * unit for label, ppq, unit in hw_items}
+    lines.update((label, unit) for label, unit in op_items)
+    pieces = {label: ppq for label, ppq, _ in hw_items}
+    pieces.update((label, 1) for label, _ in op_items)
+    setups: Dict[SetupKey, float] = {}
+    own_setup = 0.0
+    for r in node.ops:
+        m = _safe_num(r.get("setup_min"))
+        own_setup += m
+        if m > 0:
+            k = setup_key(r, node.quote)
+            setups[k] = setups.get(k, 0.0) + m
+    op_secs = tuple(_safe_num(r.get("time_sec")) for r in node.ops)
+    return NodeCost(
+        run_sec=sum(op_secs, 0.0),
+        lines=lines,
+        setups=setups,
+        part_setups={node.name: own_setup},
+        counts={node.name: 1},
+        op_secs=op_secs,
+        pieces=pieces,
+    )
+
+class AssemblyPricer:
+    """Memoized roll-up pricing of an assembly DAG."""
+
+    def __init__(self, nodes: Optional[List[AssemblyNode]] = None, root: Optional[str] = None):
+        self.nodes: Dict[str, AssemblyNode] = {}
+        self.parents: Dict[str, Set[str]] = {}
+        self.root = root
+        self._own: Dict[str, NodeCost] = {}
+        self._memo: Dict[str, NodeCost] = {}
+        self.recomputed: List[str] = []   # nodes re-rolled by the last pricing pass
+        for n in nodes or []:
+            self.set_node(n)
+
+    # ── Structure
+    def set_node(self, node: AssemblyNode) -> None:
+        """Add or replace a node; invalidates it and its ancestors."""
+        old = self.nodes.get(node.name)
+        for child, _ in (old.children if old else []):
+            self.parents.get(child, set()).discard(node.name)
+        self.nodes[node.name] = node
+        self.parents.setdefault(node.name, set())
+        for child, _ in node.children:
+            self.parents.setdefault(child, set()).add(node.name)
+        self._own.pop(node.name, None)
+        self._invalidate(node.name)
+        if self.root is None:
+            self.root = node.name
+
+    def update(self, name: str, ops: Optional[List[Dict[str, Any]]] = None,
+               quote: Optional[Dict[str, Any]] = None,
+               children: Optional[List[Tuple[str, int]]] = None) -> None:
+        """Change one node's ops, quote fields or children."""
+        n = self.nodes[name]
+        self.set_node(AssemblyNode(name=name,
+                                   ops=n.ops if ops is None else ops,
+                                   quote=n.quote if quote is None else quote,
+                                   children=n.children if children is None else children))
+
+    def ancestors(self, name: str) -> Set[str]:
+        seen: Set[str] = set()
+        stack = list(self.parents.get(name, ()))
+        while stack:
+            p = stack.pop()
+            if p not in seen:
+                seen.add(p)
+                stack.extend(self.parents.get(p, ()))
+        return seen
+
+    def _invalidate(self, name: str) -> None:
+        self._memo.pop(name, None)
+        for a in self.ancestors(name):
+            self._memo.pop(a, None)
+
+    # ── Roll-up
+    def cost(self, name: Optional[str] = None) -> NodeCost:
+        """Rolled-up unit cost of `name` (default: the root), recomputing only stale nodes."""
+        self.recomputed = []
+        return self._cost(name or self.root, ())
+
+    def _cost(self, name: str, path: Tuple[str, ...]) -> NodeCost:
+        memo = self._memo.get(name)
+        if memo is not None:
+            return memo
+        if name in path:
+            raise ValueError(f"Assembly cycle: {' -> '.join(path + (name,))}")
+        node = self.nodes.get(name)
+        if node is None:
+            raise KeyError(f"Unknown assembly node: {name}")
+        own = self._own.get(name)
+        if own is None:
+            own = self._own[name] = _own_cost(node)
+        run_sec, lines, pieces = own.run_sec, dict(own.lines), dict(own.pieces)
+        setups, part_setups, counts = dict(own.setups), dict(own.part_setups), dict(own.counts)
+        for child, qty in node.children:
+            c = self._cost(child, path + (name,))
+            qty = max(int(qty or 1), 1)
+            run_sec += qty * c.run_sec
+            for label, v in c.lines.items():
+                lines[label] = lines.get(label, 0.0) + qty * v
+                pieces[label] = pieces.get(label, 0) + qty * c.pieces[label]
+            for k, m in c.setups.items():
+                setups[k] = max(setups.get(k, 0.0), m)
+            part_setups.update(c.part_setups)
+            for n, cnt in c.counts.items():
+                counts[n] = counts.get(n, 0) + qty * cnt
+        result = NodeCost(run_sec=run_sec, lines=lines, setups=setups, part_setups=part_setups,
+                          counts=counts, pieces=pieces)
+        self._memo[name] = result
+        self.recomputed.append(name)
+        return result
+
+    # ── Output
+    @staticmethod
+    def _table_lines(c: NodeCost) -> Dict[str, float]:
+        """$ per assembly by table row; hardware merged by type and labelled with total pieces."""
+        if len(c.counts) == 1:
+            return dict(c.lines)  # a lone part keeps compute_pricing_table's labels
+        merged: Dict[str, List[Any]] = {}  # key -> [type or label, dollars, pieces]
+        for label, v in c.lines.items():
+            m = _HW_LABEL.match(label)
+            key = "HW:" + m.group(1) if m else label
+            row = merged.setdefault(key, [m.group(1) if m else label, 0.0, 0])
+            row[1] += v
+            row[2] += c.pieces.get(label, 0)
+        return {(f"HW-[{name}({n})]" if key.startswith("HW:") else name): v
+                for key, (name, v, n) in merged.items()}
+
+    def pricing_table(self, rates: Dict[str, float],
+                      quantities: Optional[List[int]] = None,
+                      markup_percent: float = 15.0,
+                      as_of: Any = None) -> Tuple[dict, dict]:
+        """(table_data, summary) for `quantities` assemblies, in the compute_pricing_table format.
+
+        The summary adds the setup minutes with and without sharing and the
+        setup dollars saved by sharing.
+        """
+        if as_of is not None:
+            rates = rates_at(as_of, fallback=rates)
+        quantities = [max(int(q or 1), 1) for q in (quantities or [1, 10, 25, 50])]
+        c = self.cost()
+        unshared_min = sum(c.part_setups.values(), 0.0)
+        # One part shares nothing: its setup is its own op sum, as in compute_pricing_table
+        shared_min = unshared_min if len(c.part_setups) == 1 else sum(c.setups.values(), 0.0)
+        # Each part's runtime is summed per op as _line_items does, then scaled by its count
+        rate = rates["labor"] + rates["machine"]
+        runtime_per_unit = sum(cnt * sum(((t / 60.0) * rate) for t in self._own[n].op_secs)
+                               for n, cnt in c.counts.items())
+
+        table_data = {"Setup": {q: round(shared_min * rates["setup"], 2) for q in quantities},
+                      "Runtime": {q: round(runtime_per_unit * q, 2) for q in quantities}}
+        for label, per_unit in self._table_lines(c).items():
+            table_data[label] = {q: round(per_unit * q, 2) for q in quantities}
+
+        subtotal = {q: 0.0 for q in quantities}
+        for vals in table_data.values():
+            for q, amt in vals.items():
+                subtotal[q] += amt
+        table_data["Subtotal"] = {q: round(subtotal[q], 2) for q in quantities}
+        markup_vals = {q: round(subtotal[q] * (markup_percent / 100.0), 2) for q in quantities}
+        table_data[f"Markup ({markup_percent:.0f}%)"] = markup_vals
+        total_vals = {q: round(subtotal[q] + markup_vals[q], 2) for q in quantities}
+        table_data["Total"] = total_vals
+
+        summary = {
+            "quantities": quantities,
+            "per_qty_ext_subtotal": {q: round(subtotal[q], 2) for q in quantities},
+            "markup_percent": round(markup_percent, 2),
+            "per_qty_markup": dict(markup_vals),
+            "per_qty_grand": dict(total_vals),
+            "adders_breakdown": {"Material": round(c.material, 4), "Hardware": round(c.hardware, 4),
+                                 "Outside Process": round(c.outside, 4)},
+            "setup_min_shared": round(shared_min, 4),
+            "setup_min_unshared": round(unshared_min, 4),
+            "setup_saved": round((unshared_min - shared_min) * rates["setup"], 2),
+            "parts_per_assembly": dict(c.counts),
+        }
+        return table_data, summary
+
+def assembly_from_dict(data: Dict[str, Any]) -> AssemblyPricer:
+    """Build a pricer from {"root": name, "nodes": {name: {"ops", "quote", "children": [{"name", "qty"}]}}}."""
+    nodes = []
+    for name, spec in (data.get("nodes") or {}).items():
+        children = [(str(c.get("name")), int(_safe_num(c.get("qty") or 1, as_int=True) or 1))
+                    for c in (spec.get("children") or []) if isinstance(c, dict)]
+        nodes.append(AssemblyNode(name=name, ops=list(spec.get("ops") or []),
+                                  quote=dict(spec.get("quote") or {}), children=children))
+    return AssemblyPricer(nodes, root=data.get("root"))
+
+def assembly_to_dict(pricer: AssemblyPricer) -> Dict[str, Any]:
+    """Inverse of assembly_from_dict (JSON-ready)."""
+    return {"root": pricer.root,
+            "nodes": {name: {"ops": [dict(r) for r in n.ops], "quote": dict(n.quote),
+                             "children": [{"name": c, "qty": q} for c, q in n.children]}
+                      for name, n in pricer.nodes.items()}}
@@ -0,0 +1,32 @@
+"""
+Benchmark: time a full streaming import of a synthetic vendor file.
+
+Run with the core/logic packages importable, e.g.
+    PYTHONPATH=src python bench/hardware_import_bench.py
+"""
+from __future__ import annotations
+import csv, json, os, random, tempfile
+from typing import Optional
+from core.catalog import TABLE_FILES
+from core.hardware_import import ImportReport, import_hardware
+
+def benchmark_import(rows: int = 200_000, workdir: Optional[str] = None) -> ImportReport:
+    """Generate a synthetic vendor file and time a full import (rows/sec)."""
+    workdir = workdir or tempfile.mkdtemp(prefix="hw-import-")
+    src = os.path.join(workdir, "vendor.csv")
+    rnd = random.Random(7)
+    prefixes = ["PEM CLS-", "PEM S-", "PEM SO-", "FH-", "KFH-", "BSO-"]
+    with open(src, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["SKU", "Description", "Each", "Pack Qty"])
+        for i in range(rows):
+            sku = f"{rnd.choice(prefixes)}{rnd.randint(0, rows // 2):06d}"
+            cost = "" if i % 997 == 0 else f"${rnd.uniform(0.02, 3.0):.4f}"
+            w.writerow([sku, "fastener", cost, rnd.choice(["1", "1", "1", "100"])])
+    return import_hardware(src, dest=os.path.join(workdir, TABLE_FILES["Hardware"]), merge_existing=False)
+
+if __name__ == "__main__":
+    r = benchmark_import()
+    print(json.dumps({"rows": r.rows_read, "accepted": r.accepted, "duplicates": r.duplicates,
+                      "rejected": r.rejected, "seconds": round(r.seconds, 3),
+                      "rows_per_sec": round(r.rows_per_sec)}, indent=2))
@@ -0,0 +1,50 @@
+"""
+Benchmark: quotes/sec for a per-quote compute_pricing_table loop vs batch
+pricing, columnar and sharded across a process pool.
+
+Run with the core/logic packages importable, e.g.
+    PYTHONPATH=src python bench/pricing_batch_bench.py
+"""
+from __future__ import annotations
+import json, os, random, time
+from typing import Any, Dict, List, Sequence
+from logic.pricing import compute_pricing_table
+from logic.pricing_batch import Job, price_batch, price_batch_columnar
+
+def sample_jobs(n: int = 20_000, seed: int = 12) -> List[Job]:
+    """Synthetic shop quotes: a few ops, ad-hoc hardware, common breaks."""
+    rnd = random.Random(seed)
+    names = ["Laser", "Form", "Deburr", "PEM", "Weld", "Tapping"]
+    rates = {"setup": 75.0, "labor": 80.0, "machine": 275.0}
+    jobs: List[Job] = []
+    for _ in range(n):
+        ops = [{"operation": rnd.choice(names), "setup_min": round(rnd.uniform(0, 45), 1),
+                "time_sec": round(rnd.uniform(5, 240), 1)} for _ in range(rnd.randint(1, 8))]
+        quote = {"material": rnd.choice(["CRS", "SS", "AL"]), "thickness_in": rnd.choice([0.0598, 0.125]),
+                 "flat_size_width": rnd.uniform(2, 30), "flat_size_height": rnd.uniform(2, 30),
+                 "hardware": [{"type": "PEM-XYZ", "qty": rnd.randint(1, 6), "unit_cost": 0.18}]}
+        jobs.append((ops, quote, rates, [1, 10, 25, 50], 15.0))
+    return jobs
+
+def benchmark_price_batch(jobs: Sequence[Job], processes: Sequence[int] = (1, os.cpu_count() or 1)) -> Dict[str, Any]:
+    """Quotes/sec for the per-quote loop vs batch pricing (serial and sharded)."""
+    jobs = list(jobs)
+    t0 = time.perf_counter()
+    for job in jobs:
+        ops, quote, rates, quantities, pct = job[:5]
+        compute_pricing_table(ops, quote, rates, quantities, pct, *job[5:6])
+    loop_s = time.perf_counter() - t0
+    report: Dict[str, Any] = {"jobs": len(jobs), "loop_quotes_per_sec": len(jobs) / loop_s if loop_s else 0.0}
+    t0 = time.perf_counter()
+    price_batch_columnar(jobs)  # arrays only, no per-quote dicts
+    s = time.perf_counter() - t0
+    report["columnar_quotes_per_sec"] = len(jobs) / s if s else 0.0
+    for p in dict.fromkeys(processes):
+        t0 = time.perf_counter()
+        price_batch(jobs, processes=p)
+        s = time.perf_counter() - t0
+        report[f"batch_p{p}_quotes_per_sec"] = len(jobs) / s if s else 0.0
+    return report
+
+if __name__ == "__main__":
+    print(json.dumps(benchmark_price_batch(sample_jobs()), indent=2))
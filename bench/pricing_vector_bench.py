@@ -0,0 +1,48 @@
+"""
+Benchmark: one price curve through the per-quantity dict path
+(compute_pricing_table) vs the vectorized engine, per curve size.
+
+Run with the core/logic packages importable, e.g.
+    PYTHONPATH=src python bench/pricing_vector_bench.py
+"""
+from __future__ import annotations
+import json, time
+from typing import Any, Dict, List, Sequence
+import numpy as np
+from logic.pricing import compute_pricing_table
+from logic.pricing_vector import price_curve
+
+OPS = [{"operation": "Laser", "setup_min": 12.0, "time_sec": 42.5},
+       {"operation": "Form", "setup_min": 18.5, "time_sec": 36.0},
+       {"operation": "Deburr", "setup_min": 0.0, "time_sec": 20.0}]
+QUOTE = {"material": "CRS", "thickness_in": 0.0598, "flat_size_width": 14.25, "flat_size_height": 9.5,
+         "hardware": [{"type": "PEM-XYZ", "qty": 4, "unit_cost": 0.18}],
+         "outside_processes": [{"name": "Powder Coat", "unit_cost_per_sqin": 0.012}]}
+RATES = {"setup": 75.0, "labor": 80.0, "machine": 275.0}
+
+def benchmark_price_curve(ops: List[Dict[str, Any]],
+                          quote: Dict[str, Any],
+                          rates: Dict[str, float],
+                          markup_percent: float = 25.0,
+                          sizes: Sequence[int] = (4, 100, 1_000, 10_000, 100_000),
+                          repeats: int = 5) -> List[Dict[str, Any]]:
+    """Best-of-`repeats` seconds for the dict path vs the vectorized path per curve size."""
+    out = []
+    for n in sizes:
+        qs = list(range(1, n + 1))
+        arr = np.arange(1, n + 1, dtype=np.int64)
+        timings = {}
+        for mode, fn in (("dict", lambda: compute_pricing_table(ops, quote, rates, qs, markup_percent)),
+                         ("vector", lambda: price_curve(ops, quote, rates, arr, markup_percent))):
+            best = float("inf")
+            for _ in range(repeats):
+                t0 = time.perf_counter()
+                fn()
+                best = min(best, time.perf_counter() - t0)
+            timings[mode] = best
+        out.append({"quantities": n, "dict_seconds": timings["dict"], "vector_seconds": timings["vector"],
+                    "speedup": timings["dict"] / timings["vector"] if timings["vector"] else 0.0})
+    return out
+
+if __name__ == "__main__":
+    print(json.dumps(benchmark_price_curve(OPS, QUOTE, RATES), indent=2))
@@ -0,0 +1,66 @@
+"""
+Benchmark: per-worker catalog load time and RSS growth, parsing the CSVs
+in every worker vs attaching to one shared-memory segment.
+
+Run with the core/logic packages importable, e.g.
+    PYTHONPATH=src python bench/shared_catalog_bench.py
+"""
+from __future__ import annotations
+import json, os, time
+from typing import Any, Dict
+import numpy as np
+from core.catalog import TABLE_FILES, ReferenceCatalog
+from core.shared_catalog import DEFAULT_SEGMENT, attach_catalog, publish_catalog
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def _bench_worker(mode: str, segment: str, out) -> None:
+    rss0 = _rss_bytes()
+    t0 = time.perf_counter()
+    if mode == "parse":
+        cat = ReferenceCatalog()
+        n = sum(len(cat.table(t).records) for t in TABLE_FILES)
+        probe = cat.hardware()[0].name if cat.hardware() else ""
+    else:
+        sc = attach_catalog(segment)
+        n = sum(len(t) for t in sc.tables.values())
+        hw = sc.table("Hardware")
+        probe = hw.string("name", 0) if len(hw) else ""
+        float(np.nansum(hw.column("unit_cost")))
+    elapsed = time.perf_counter() - t0
+    out.put({"mode": mode, "seconds": elapsed, "rss_delta_bytes": _rss_bytes() - rss0,
+             "rows": n, "probe": probe})
+    if mode == "attach":
+        sc.close()
+
+def benchmark_shared_catalog(workers: int = 4) -> Dict[str, Any]:
+    """Per-worker load time and RSS growth: CSV parsing vs shared-memory attach."""
+    import multiprocessing as mp
+    ctx = mp.get_context("spawn")
+    segment = f"{DEFAULT_SEGMENT}_bench_{os.getpid()}"
+    owner = publish_catalog(ReferenceCatalog(), name=segment)
+    report: Dict[str, Any] = {"workers": workers, "segment_bytes": owner.shm.size}
+    try:
+        for mode in ("parse", "attach"):
+            q = ctx.Queue()
+            procs = [ctx.Process(target=_bench_worker, args=(mode, segment, q)) for _ in range(workers)]
+            for p in procs: p.start()
+            results = [q.get() for _ in procs]
+            for p in procs: p.join()
+            report[mode] = {
+                "avg_seconds": sum(r["seconds"] for r in results) / len(results),
+                "avg_rss_delta_bytes": sum(r["rss_delta_bytes"] for r in results) // len(results),
+                "rows": results[0]["rows"],
+            }
+    finally:
+        owner.close()
+    return report
+
+if __name__ == "__main__":
+    print(json.dumps(benchmark_shared_catalog(), indent=2))
@@ -0,0 +1,98 @@
+# logic/bend_tables.py
+"""
+Per-material bend allowance / bend deduction lookup tables.
+
+Each table holds BA and BD precomputed over every standard thickness
+(rules.THICKNESS_BASE) × tooling radius (rules.BEND_RADII) × bend angle
+(rules.BEND_ANGLES, every half degree, so common angles are grid points),
+using the material's K-factor. Lookups accept scalars or arrays:
+- values inside the grid are trilinearly interpolated from the 8
+  surrounding grid points (grid points themselves come back as stored);
+- values outside the grid are computed exactly with calc_ba_array /
+  calc_bd_array.
+
+BA is linear in angle, radius and thickness, so interpolating it is exact.
+BD carries a tan(angle / 2) term; on the standard grid it is interpolated to
+within 0.0002".
+"""
+from __future__ import annotations
+import threading
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
+from core.rules import BEND_ANGLES, BEND_RADII, DEFAULT_K_FACTOR, K_FACTOR, THICKNESS_BASE
+from logic.estimator import calc_ba_array, calc_bd_array
+
+def k_factor_for(material: Optional[str]) -> float:
+    return K_FACTOR.get(str(material or "").upper(), DEFAULT_K_FACTOR)
+
+def _cell(grid: np.ndarray, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Lower grid index and fractional position of x within its cell."""
+    i = np.clip(np.searchsorted(grid, x, side="right") - 1, 0, len(grid) - 2)
+    f = (x - grid[i]) / (grid[i + 1] - grid[i])
+    return i, f
+
+class BendTable:
+    """BA/BD grid for one K-factor, indexed [thickness, radius, angle]."""
+
+    def __init__(self, k_factor: float,
+                 thicknesses: Optional[Sequence[float]] = None,
+                 radii: Optional[Sequence[float]] = None,
+                 angles: Optional[Sequence[float]] = None):
+        self.k_factor = float(k_factor)
+        self.thicknesses = np.unique(np.asarray(thicknesses if thicknesses is not None
+                                                else [t for t, _ in THICKNESS_BASE], dtype=np.float64))
+        self.radii = np.unique(np.asarray(radii if radii is not None else BEND_RADII, dtype=np.float64))
+        self.angles = np.unique(np.asarray(angles if angles is not None else BEND_ANGLES, dtype=np.float64))
+        t, r, a = np.meshgrid(self.thicknesses, self.radii, self.angles, indexing="ij")
+        self.ba = calc_ba_array(a, r, self.k_factor, t)
+        self.bd = calc_bd_array(a, r, t, self.ba)
+
+    def _in_grid(self, t: np.ndarray, r: np.ndarray, a: np.ndarray) -> np.ndarray:
+        return ((t >= self.thicknesses[0]) & (t <= self.thicknesses[-1]) &
+                (r >= self.radii[0]) & (r <= self.radii[-1]) &
+                (a >= self.angles[0]) & (a <= self.angles[-1]))
+
+    def _interp(self, table: np.ndarray, t: np.ndarray, r: np.ndarray, a: np.ndarray) -> np.ndarray:
+        (it, ft), (ir, fr), (ia, fa) = _cell(self.thicknesses, t), _cell(self.radii, r), _cell(self.angles, a)
+        out = np.zeros(t.shape)
+        for dt, wt in ((0, 1.0 - ft), (1, ft)):
+            for dr, wr in ((0, 1.0 - fr), (1, fr)):
+                for da, wa in ((0, 1.0 - fa), (1, fa)):
+                    out = out + wt * wr * wa * table[it + dt, ir + dr, ia + da]
+        return out
+
+    def lookup(self, angle_deg, r_in, t_in) -> Tuple[np.ndarray, np.ndarray]:
+        """(BA, BD) for broadcast arrays of angle, inside radius and thickness."""
+        a, r, t = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (angle_deg, r_in, t_in)))
+        inside = self._in_grid(t, r, a)
+        ba, bd = np.empty(t.shape), np.empty(t.shape)
+        if inside.any():
+            ti, ri, ai = t[inside], r[inside], a[inside]
+            ba[inside] = self._interp(self.ba, ti, ri, ai)
+            bd[inside] = self._interp(self.bd, ti, ri, ai)
+        outside = ~inside
+        if outside.any():
+            to, ro, ao = t[outside], r[outside], a[outside]
+            ba[outside] = calc_ba_array(ao, ro, self.k_factor, to)
+            bd[outside] = calc_bd_array(ao, ro, to, ba[outside])
+        return ba, bd
+
+# Bend tables per K-factor (materials sharing a K-factor share a table)
+_tables: Dict[float, BendTable] = {}
+_tables_lock = threading.Lock()
+
+def get_bend_table(material: Optional[str] = None, k_factor: Optional[float] = None) -> BendTable:
+    """Get the bend table for a material (or an explicit K-factor)"""
+    k = float(k_factor) if k_factor is not None else k_factor_for(material)
+    table = _tables.get(k)
+    if table is None:
+        with _tables_lock:
+            table = _tables.get(k)
+            if table is None:
+                table = _tables[k] = BendTable(k)
+    return table
+
+def bend_allowance(angle_deg, r_in, t_in, material: Optional[str] = None,
+                   k_factor: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """(BA, BD) arrays from the material's lookup table."""
+    return get_bend_table(material, k_factor).lookup(angle_deg, r_in, t_in)
@@ -0,0 +1,558 @@
+# core/catalog.py
+"""
+Process-wide reference-data catalog for the [UFG]_sQL.csv tables.
+
+Each table is parsed once into typed records (header aliases resolved once)
+and served from memory. A table is re-parsed only when its file's
+(mtime, size) signature changes.
+"""
+from __future__ import annotations
+import bisect, contextvars, csv, os, threading, time, weakref
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from contextlib import contextmanager
+from types import MappingProxyType
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+from core.io_files import candidate_paths_first
+
+# ── Header aliases (first match wins, compared lower-case)
+OPS_NAME_COLS = ["operation", "opname", "name", "operation_name", "op_name", "label"]
+OPS_SETUP_COLS = ["setup_min", "setup", "setup_time_min", "setup_minutes"]
+OPS_SEC_PER_OP_COLS = ["sec_per_op", "time_sec_per_op", "runtime_per_op_sec", "sec_per_bend"]
+OPS_TIME_COLS = ["time_sec", "runtime_sec", "time_seconds"]
+
+HW_NAME_COLS = ["part", "part_number", "hardware", "hardware_name", "type", "name", "description", "label"]
+HW_COST_COLS = ["unit_cost", "cost", "price", "unit_price"]
+HW_QTY_COLS = ["default_qty", "qty", "qty_per_part"]
+
+OSP_NAME_COLS = ["label", "name", "process", "process_name", "operation", "op", "outside_process"]
+OSP_SPEC_COLS = ["spec", "specification"]
+OSP_SQIN_COLS = ["unit_cost_per_sqin", "cost_per_sqin"]
+OSP_PART_COLS = ["unit_cost_per_part", "cost_per_part", "unit_cost", "price", "unit_price"]
+
+MAT_NAME_COLS = ["material_name", "material", "name", "label"]
+MAT_PRICE_COLS = ["unit_price_lb", "price_lb", "cost_per_lb"]
+MAT_DENSITY_COLS = ["density_lb_in3", "density"]
+
+# Per-minute columns are taken as-is; per-hour columns are divided by 60.
+RATE_SETUP_COLS = ["SetupRatePerMin", "setup_rate_per_min", "setup_rate"]
+RATE_LABOR_COLS = ["LaborRatePerMin", "labor_rate_per_min", "labor_rate"]
+RATE_MACHINE_COLS = ["MachineRatePerMin", "machine_rate_per_min", "machine_rate"]
+RATE_SETUP_HR_COLS = ["setup_rate_hr", "setup_rate_per_hr"]
+RATE_LABOR_HR_COLS = ["labor_rate_hr", "labor_rate_per_hr"]
+RATE_MACHINE_HR_COLS = ["machine_rate_hr", "machine_rate_per_hr"]
+RATE_DATE_COLS = ["effective_date", "effective_from", "effective", "as_of", "date"]
+
+TABLE_FILES: Dict[str, str] = {
+    "Materials": "Materials[UFG]_sQL.csv",
+    "Operations": "Operations[UFG]_sQL.csv",
+    "Hardware": "Hardware[UFG]_sQL.csv",
+    "OutsideProcess": "OutsideProcess[UFG]_sQL.csv",
+    "Rates": "Rates[UFG]_sQL.csv",
+}
+
+# ── Typed records
+@dataclass(frozen=True)
+class OperationRecord:
+    name: str
+    setup_min: Optional[float]
+    sec_per_op: Optional[float]
+    time_sec: Optional[float]
+
+@dataclass(frozen=True)
+class HardwareRecord:
+    name: str
+    unit_cost: Optional[float]
+    default_qty: Optional[int]
+
+@dataclass(frozen=True)
+class OutsideProcessRecord:
+    name: str
+    spec: str
+    unit_cost_per_sqin: Optional[float]
+    unit_cost_per_part: Optional[float]
+
+@dataclass(frozen=True)
+class MaterialRecord:
+    name: str
+    unit_price_lb: Optional[float]
+    density_lb_in3: Optional[float]
+
+@dataclass(frozen=True)
+class RatesRecord:
+    """Rates in $/min; None where the table does not provide a value.
+
+    `effective_date` is an ISO date ("" = undated baseline row).
+    """
+    setup: Optional[float]
+    labor: Optional[float]
+    machine: Optional[float]
+    effective_date: str = ""
+
+@dataclass(frozen=True)
+class CatalogChange:
+    """Emitted to subscribers whenever a table version is swapped in."""
+    table: str
+    old_version: Optional[int]
+    new_version: int
+
+@dataclass(frozen=True)
+class CatalogTable:
+    """One parsed table. Treated as immutable; changes produce a new instance."""
+    name: str
+    path: Optional[str]
+    fieldnames: List[str]
+    rows: Sequence[Dict[str, str]]
+    records: Sequence[Any]
+    columns: Dict[str, Optional[str]]
+    signature: Optional[Tuple[float, int]]
+    version: int = 0
+    loaded_at: float = field(default_factory=time.time)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+# ── Parsing helpers
+def _to_float(v: Any) -> Optional[float]:
+    try:
+        s = str(v).strip()
+        return float(s) if s != "" else None
+    except Exception:
+        return None
+
+def _to_int(v: Any) -> Optional[int]:
+    f = _to_float(v)
+    return int(f) if f is not None else None
+
+def _pick(header_map: Dict[str, str], options: List[str]) -> Optional[str]:
+    return next((header_map[o.lower()] for o in options if o.lower() in header_map), None)
+
+def _cell(row: Dict[str, str], col: Optional[str]) -> str:
+    return str(row.get(col, "") if col else "").strip()
+
+def _parse_operations(rows, hm):
+    cols = {"name": _pick(hm, OPS_NAME_COLS), "setup_min": _pick(hm, OPS_SETUP_COLS),
+            "sec_per_op": _pick(hm, OPS_SEC_PER_OP_COLS), "time_sec": _pick(hm, OPS_TIME_COLS)}
+    recs = [OperationRecord(name=_cell(r, cols["name"]),
+                            setup_min=_to_float(_cell(r, cols["setup_min"])),
+                            sec_per_op=_to_float(_cell(r, cols["sec_per_op"])),
+                            time_sec=_to_float(_cell(r, cols["time_sec"])))
+            for r in rows]
+    return cols, recs
+
+def _parse_hardware(rows, hm):
+    cols = {"name": _pick(hm, HW_NAME_COLS), "unit_cost": _pick(hm, HW_COST_COLS),
+            "default_qty": _pick(hm, HW_QTY_COLS)}
+    recs = [HardwareRecord(name=_cell(r, cols["name"]),
+                           unit_cost=_to_float(_cell(r, cols["unit_cost"])),
+                           default_qty=_to_int(_cell(r, cols["default_qty"])))
+            for r in rows]
+    return cols, recs
+
+def _parse_outside_process(rows, hm):
+    cols = {"name": _pick(hm, OSP_NAME_COLS), "spec": _pick(hm, OSP_SPEC_COLS),
+            "unit_cost_per_sqin": _pick(hm, OSP_SQIN_COLS),
+            "unit_cost_per_part": _pick(hm, OSP_PART_COLS)}
+    recs = [OutsideProcessRecord(name=_cell(r, cols["name"]),
+                                 spec=_cell(r, cols["spec"]),
+                                 unit_cost_per_sqin=_to_float(_cell(r, cols["unit_cost_per_sqin"])),
+                                 unit_cost_per_part=_to_float(_cell(r, cols["unit_cost_per_part"])))
+            for r in rows]
+    return cols, recs
+
+def _parse_materials(rows, hm):
+    cols = {"name": _pick(hm, MAT_NAME_COLS), "unit_price_lb": _pick(hm, MAT_PRICE_COLS),
+            "density_lb_in3": _pick(hm, MAT_DENSITY_COLS)}
+    recs = [MaterialRecord(name=_cell(r, cols["name"]),
+                           unit_price_lb=_to_float(_cell(r, cols["unit_price_lb"])),
+                           density_lb_in3=_to_float(_cell(r, cols["density_lb_in3"])))
+            for r in rows]
+    return cols, recs
+
+def _to_iso_date(v: Any) -> Optional[str]:
+    """Normalize a date cell/value to YYYY-MM-DD (None if unparsable)."""
+    if isinstance(v, datetime):
+        return v.date().isoformat()
+    if isinstance(v, date):
+        return v.isoformat()
+    s = str(v or "").strip()
+    for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%Y%m%d", "%Y-%m-%dT%H:%M:%S"):
+        try:
+            return datetime.strptime(s[:19] if "T" in s else s, fmt).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+def _parse_rates(rows, hm):
+    """RatesRecords sorted by effective date.
+
+    Without an effective-date column this is a single record: first parsable
+    value per column, else type/value rows. With one, each dated row is a
+    record and blank cells carry forward from the previous effective row.
+    """
+    cols = {"setup": _pick(hm, RATE_SETUP_COLS), "labor": _pick(hm, RATE_LABOR_COLS),
+            "machine": _pick(hm, RATE_MACHINE_COLS), "setup_hr": _pick(hm, RATE_SETUP_HR_COLS),
+            "labor_hr": _pick(hm, RATE_LABOR_HR_COLS), "machine_hr": _pick(hm, RATE_MACHINE_HR_COLS),
+            "effective_date": _pick(hm, RATE_DATE_COLS)}
+
+    def row_float(r, k):
+        v = _to_float(r.get(cols[k], "")) if cols[k] else None
+        if v is None and cols[k + "_hr"]:
+            v = _to_float(r.get(cols[k + "_hr"], ""))
+            v = v / 60.0 if v is not None else None
+        return v
+
+    if cols["effective_date"]:
+        dated = []
+        for r in rows:
+            d = _cell(r, cols["effective_date"])
+            iso = _to_iso_date(d) if d else ""
+            if iso is not None:
+                dated.append((iso, r))
+        dated.sort(key=lambda x: x[0])  # stable: file order within a date
+        out: List[RatesRecord] = []
+        prev = {"setup": None, "labor": None, "machine": None}
+        for iso, r in dated:
+            vals = {k: row_float(r, k) for k in prev}
+            vals = {k: (v if v is not None else prev[k]) for k, v in vals.items()}
+            out.append(RatesRecord(effective_date=iso, **vals))
+            prev = vals
+        return cols, out
+
+    vals = {}
+    for k in ("setup", "labor", "machine"):
+        vals[k] = next((v for v in (row_float(r, k) for r in rows) if v is not None), None)
+    if None in vals.values():
+        for r in rows:
+            low = {str(k).lower(): str(v).strip() for k, v in r.items()}
+            key = low.get("type") or low.get("name") or low.get("rate_type")
+            fv = _to_float(low.get("value") or low.get("rate") or low.get("amount") or "")
+            if not key or fv is None: continue
+            key = key.lower()
+            for k in ("setup", "labor", "machine"):
+                if k in key:
+                    if vals[k] is None: vals[k] = fv
+                    break
+    return cols, [RatesRecord(**vals)]
+
+_PARSERS: Dict[str, Callable] = {
+    "Materials": _parse_materials,
+    "Operations": _parse_operations,
+    "Hardware": _parse_hardware,
+    "OutsideProcess": _parse_outside_process,
+    "Rates": _parse_rates,
+}
+
+def build_table(name: str, fieldnames: List[str], rows: List[Dict[str, str]],
+                path: Optional[str] = None, signature: Optional[Tuple[float, int]] = None,
+                version: int = 0) -> CatalogTable:
+    """Build a CatalogTable from raw rows (header aliases resolved once here)."""
+    header_map = {str(k).lower(): k for k in fieldnames}
+    columns, records = _PARSERS[name](rows, header_map)
+    return CatalogTable(name=name, path=path, fieldnames=list(fieldnames), rows=rows,
+                        records=records, columns=columns, signature=signature, version=version)
+
+def parse_records(name: str, fieldnames: List[str], rows: List[Dict[str, str]]) -> List[Any]:
+    """Typed records for `rows` of table `name` (used for single-row updates)."""
+    header_map = {str(k).lower(): k for k in fieldnames}
+    return _PARSERS[name](rows, header_map)[1]
+
+def file_signature(path: str) -> Optional[Tuple[float, int]]:
+    try:
+        st = os.stat(path)
+        return (st.st_mtime, st.st_size)
+    except OSError:
+        return None
+
+# ── Snapshots
+class _RecordAccess(ABC):
+    """Typed record accessors shared by the catalog and its snapshots."""
+
+    @abstractmethod
+    def view(self, name: str) -> CatalogTable:
+        """The table `name` as this accessor sees it."""
+
+    def records(self, name: str) -> List[Any]:
+        return self.view(name).records
+
+    def operations(self) -> List[OperationRecord]:
+        return self.view("Operations").records
+
+    def hardware(self) -> List[HardwareRecord]:
+        return self.view("Hardware").records
+
+    def outside_processes(self) -> List[OutsideProcessRecord]:
+        return self.view("OutsideProcess").records
+
+    def materials(self) -> List[MaterialRecord]:
+        return self.view("Materials").records
+
+    def rates(self) -> RatesRecord:
+        """Rates in effect today."""
+        return self.rates_at(date.today())
+
+    def rates_at(self, as_of: Any) -> RatesRecord:
+        """Rates in effect on `as_of` (date, datetime or ISO string); O(log n).
+
+        Dates before the first effective row get the earliest rates.
+        """
+        recs = self.view("Rates").records
+        if not recs:
+            return RatesRecord(None, None, None)
+        iso = _to_iso_date(as_of) or date.today().isoformat()
+        i = bisect.bisect_right(recs, iso, key=lambda r: r.effective_date)
+        return recs[max(i - 1, 0)]
+
+class CatalogSnapshot(_RecordAccess):
+    """Immutable view of every reference table at one catalog version.
+
+    Pins are counted with a token list (list.append/remove are atomic), so
+    acquiring and releasing a snapshot never takes a lock. An unpinned,
+    superseded snapshot is simply dropped by Python's own refcounting.
+    """
+
+    def __init__(self, version: int, tables: Mapping[str, CatalogTable], owner: int):
+        self.version = version
+        self.tables = tables
+        self.owner = owner
+        self.created_at = time.time()
+        self._pins: List[object] = []
+
+    def view(self, name: str) -> CatalogTable:
+        return self.tables[name]
+
+    table = view
+
+    @property
+    def refcount(self) -> int:
+        return len(self._pins)
+
+    def acquire(self) -> object:
+        token = object()
+        self._pins.append(token)
+        return token
+
+    def release(self, token: object) -> None:
+        self._pins.remove(token)
+
+# Snapshot pinned by the current pricing pass (per thread / task)
+_PINNED: contextvars.ContextVar[Optional[CatalogSnapshot]] = contextvars.ContextVar("catalog_snapshot", default=None)
+
+# ── Catalog
+class ReferenceCatalog(_RecordAccess):
+    """Caches parsed reference tables; revalidates each against its file signature.
+
+    `check_interval` (seconds) bounds how often a table's file is stat'ed, so
+    repeated lookups inside one pricing pass are served purely from memory.
+
+    The table map is copy-on-write: every reload or edit installs a new dict,
+    so `snapshot()` can hand out a consistent, immutable view without locking.
+    Record accessors read from the snapshot pinned via `pinned()` when there
+    is one, so a quote prices against a single version end to end.
+    """
+
+    def __init__(self, check_interval: float = 1.0, store: Any = None):
+        self.check_interval = check_interval
+        self.store = store  # optional core.reference_store.ReferenceStore
+        self._tables: Dict[str, CatalogTable] = {}  # replaced, never mutated
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._live: "weakref.WeakValueDictionary[int, CatalogSnapshot]" = weakref.WeakValueDictionary()
+        self._checked_at: Dict[str, float] = {}
+        self._listeners: List[Callable[[CatalogChange], None]] = []
+        self._lock = threading.RLock()
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+
+    def table(self, name: str) -> CatalogTable:
+        if name not in TABLE_FILES:
+            raise KeyError(f"Unknown reference table: {name}")
+        cached = self._tables.get(name)
+        now = time.monotonic()
+        if cached is not None and now - self._checked_at.get(name, 0.0) < self.check_interval:
+            self.hits += 1
+            return cached
+        path, sig = self._source(name)
+        if cached is not None and cached.path == path and cached.signature == sig:
+            self._checked_at[name] = now
+            self.hits += 1
+            return cached
+        with self._lock:
+            cached = self._tables.get(name)
+            if cached is not None and cached.path == path and cached.signature == sig:
+                self.hits += 1
+                return cached
+            tbl = self._load(name, path, sig)
+            self.misses += 1
+            if cached is not None:
+                self.reloads += 1
+            self._install(tbl)
+        self._emit(name, cached, tbl)
+        return tbl
+
+    def refresh(self, name: str) -> Optional[CatalogTable]:
+        """Revalidate one table now; returns the new table if it was reloaded."""
+        old = self._tables.get(name)
+        self._checked_at.pop(name, None)
+        new = self.table(name)
+        return new if old is not None and new is not old else None
+
+    def _source(self, name: str) -> Tuple[Optional[str], Any]:
+        """(location, signature) of the current source for a table."""
+        store = self.store
+        if store is not None:
+            sig = store.signature(name)
+            if sig is not None:
+                return store.location, sig
+        path = candidate_paths_first(TABLE_FILES[name])
+        return path, (file_signature(path) if path else None)
+
+    def use_store(self, store: Any) -> None:
+        """Serve tables from a ReferenceStore (None reverts to the CSV files)."""
+        with self._lock:
+            self.store = store
+            self._tables = {}
+            self._checked_at.clear()
+
+    def _load(self, name: str, path: Optional[str], sig) -> CatalogTable:
+        fieldnames: List[str] = []
+        rows: List[Dict[str, str]] = []
+        if self.store is not None and path == self.store.location:
+            fieldnames, rows = self.store.load_rows(name)
+            self._version += 1
+            return build_table(name, fieldnames, rows, path=path, signature=sig, version=self._version)
+        if path:
+            try:
+                with open(path, newline="", encoding="utf-8") as f:
+                    reader = csv.DictReader(f)
+                    rows = list(reader)
+                    fieldnames = list(reader.fieldnames or [])
+            except Exception:
+                fieldnames, rows = [], []
+        self._version += 1
+        tbl = build_table(name, fieldnames, rows, path=path, signature=sig, version=self._version)
+        if path:
+            from core.catalog_journal import replay_journal  # local import to avoid cycles
+            tbl = replay_journal(tbl)
+        return tbl
+
+    def next_version(self) -> int:
+        with self._lock:
+            self._version += 1
+            return self._version
+
+    def _install(self, table: CatalogTable) -> None:
+        tables = dict(self._tables)
+        tables[table.name] = table
+        self._tables = tables
+        self._checked_at[table.name] = time.monotonic()
+
+    def publish(self, table: CatalogTable) -> CatalogTable:
+        """Swap in a new in-memory table (e.g. after a journaled edit)."""
+        with self._lock:
+            old = self._tables.get(table.name)
+            self._install(table)
+        if old is None or old.version != table.version:
+            self._emit(table.name, old, table)
+        return table
+
+    # ── Change events
+    def subscribe(self, callback: Callable[[CatalogChange], None]) -> None:
+        """Call `callback(CatalogChange)` after any table version is swapped in."""
+        if callback not in self._listeners:
+            self._listeners = self._listeners + [callback]
+
+    def unsubscribe(self, callback: Callable[[CatalogChange], None]) -> None:
+        self._listeners = [c for c in self._listeners if c is not callback]
+
+    def _emit(self, name: str, old: Optional[CatalogTable], new: CatalogTable) -> None:
+        change = CatalogChange(name, old.version if old else None, new.version)
+        for cb in self._listeners:
+            try:
+                cb(change)
+            except Exception:
+                pass
+
+    # ── Snapshots
+    def snapshot(self) -> CatalogSnapshot:
+        """Current immutable snapshot of all tables (revalidated first)."""
+        for name in TABLE_FILES:
+            self.table(name)
+        tables = self._tables
+        snap = self._snapshot
+        if snap is None or snap.tables is not tables:
+            snap = CatalogSnapshot(max(t.version for t in tables.values()), tables, id(self))
+            self._snapshot = snap
+            self._live[snap.version] = snap
+        return snap
+
+    @contextmanager
+    def pinned(self) -> Iterator[CatalogSnapshot]:
+        """Pin one snapshot for a pricing pass; nested pins reuse it."""
+        cur = _PINNED.get()
+        if cur is not None and cur.owner == id(self):
+            yield cur
+            return
+        snap = self.snapshot()
+        token = snap.acquire()
+        reset = _PINNED.set(snap)
+        try:
+            yield snap
+        finally:
+            _PINNED.reset(reset)
+            snap.release(token)
+
+    def view(self, name: str) -> CatalogTable:
+        """Table from the pinned snapshot if any, else the latest version."""
+        snap = _PINNED.get()
+        if snap is not None and snap.owner == id(self):
+            return snap.tables[name]
+        return self.table(name)
+
+    @property
+    def lock(self) -> threading.RLock:
+        return self._lock
+
+    def peek(self, name: str) -> Optional[CatalogTable]:
+        """Cached table without revalidation (None if not loaded)."""
+        return self._tables.get(name)
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop one table (or all) so the next lookup re-parses from disk."""
+        with self._lock:
+            self._tables = {n: t for n, t in self._tables.items() if name and n != name}
+            for n in ([name] if name else list(self._checked_at)):
+                self._checked_at.pop(n, None)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "reloads": self.reloads,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "tables": {n: {"rows": len(t), "version": t.version, "path": t.path}
+                       for n, t in self._tables.items()},
+            "snapshots": {v: s.refcount for v, s in list(self._live.items())},
+        }
+
+    def reset_stats(self) -> None:
+        self.hits = self.misses = self.reloads = 0
+
+# Global catalog instance
+_catalog: Optional[ReferenceCatalog] = None
+_catalog_lock = threading.Lock()
+
+def get_catalog() -> ReferenceCatalog:
+    """Get the process-wide reference catalog"""
+    global _catalog
+    cat = _catalog
+    if cat is None:
+        with _catalog_lock:
+            if _catalog is None:
+                from core.reference_store import store_from_env  # local import to avoid cycles
+                _catalog = ReferenceCatalog(store=store_from_env())
+            cat = _catalog
+    return cat
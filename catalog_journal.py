@@ -0,0 +1,313 @@
+# core/catalog_journal.py
+"""
+Append-only journal for reference-table edits.
+
+Each Add/Edit/Delete is appended as one JSON line to "<table>.csv.journal"
+and applied to the in-memory catalog table at once. A background thread
+later compacts the journal into the CSV (temp file + atomic os.replace).
+On load, the catalog replays any journal left over from a previous run.
+
+Edit and delete entries name their row by index and also carry the row's
+contents as the editor saw them ("row"). If another session has inserted
+or deleted rows in the meantime, the row is re-located by those contents.
+If it was changed or removed, the write is rejected.
+
+Edited tables keep their rows and records in copy-on-write chunks
+(ChunkedRows). An edit copies one chunk and the chunk index, not the whole
+table, while readers of the previous version keep an unchanged view.
+"""
+from __future__ import annotations
+import bisect, csv, dataclasses, itertools, json, logging, os, tempfile, threading, time
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator, List, Optional
+from core.catalog import CatalogTable, ReferenceCatalog, get_catalog, parse_records, file_signature
+
+logger = logging.getLogger(__name__)
+
+def journal_path(csv_path: str) -> str:
+    return csv_path + ".journal"
+
+def _read_entries(path: str) -> List[Dict[str, Any]]:
+    out: List[Dict[str, Any]] = []
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line: continue
+                try: out.append(json.loads(line))
+                except Exception: break  # torn final write; ignore the tail
+    except FileNotFoundError:
+        pass
+    return out
+
+class ChunkedRows(Sequence):
+    """Immutable list split into chunks; each edit returns a new list sharing untouched chunks.
+
+    An edit costs O(len / CHUNK + CHUNK) instead of a full copy.
+    """
+    CHUNK = 512
+    __slots__ = ("_chunks", "_starts", "_n")
+
+    def __init__(self, items: Any = (), _chunks: Optional[List[list]] = None):
+        if _chunks is None:
+            items = list(items)
+            _chunks = [items[i:i + self.CHUNK] for i in range(0, len(items), self.CHUNK)]
+        self._chunks = _chunks
+        self._starts = list(itertools.accumulate((len(c) for c in _chunks[:-1]), initial=0)) if _chunks else []
+        self._n = sum(len(c) for c in _chunks[-1:]) + (self._starts[-1] if _chunks else 0)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __iter__(self) -> Iterator[Any]:
+        return itertools.chain.from_iterable(self._chunks)
+
+    def _locate(self, i: int) -> tuple:
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError("row index out of range")
+        c = bisect.bisect_right(self._starts, i) - 1
+        return c, i - self._starts[c]
+
+    def __getitem__(self, i: Any) -> Any:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._n))]
+        c, k = self._locate(i)
+        return self._chunks[c][k]
+
+    def __repr__(self) -> str:
+        return f"ChunkedRows({list(self)!r})"
+
+    def replaced(self, i: int, value: Any) -> "ChunkedRows":
+        c, k = self._locate(i)
+        chunk = list(self._chunks[c])
+        chunk[k] = value
+        chunks = list(self._chunks)
+        chunks[c] = chunk
+        return ChunkedRows(_chunks=chunks)
+
+    def appended(self, value: Any) -> "ChunkedRows":
+        chunks = list(self._chunks)
+        if chunks and len(chunks[-1]) < self.CHUNK:
+            chunks[-1] = chunks[-1] + [value]
+        else:
+            chunks.append([value])
+        return ChunkedRows(_chunks=chunks)
+
+    def deleted(self, i: int) -> "ChunkedRows":
+        c, k = self._locate(i)
+        chunk = self._chunks[c][:k] + self._chunks[c][k + 1:]
+        chunks = list(self._chunks)
+        if chunk:
+            chunks[c] = chunk
+        else:
+            del chunks[c]
+        return ChunkedRows(_chunks=chunks)
+
+def _chunked(items: Any) -> ChunkedRows:
+    return items if isinstance(items, ChunkedRows) else ChunkedRows(items)
+
+def apply_entries(tbl: CatalogTable, entries: List[Dict[str, Any]], version: int) -> CatalogTable:
+    """New table with `entries` applied in order; only the touched chunks are copied."""
+    if not entries:
+        return tbl
+    rows = _chunked(tbl.rows)
+    per_row = tbl.name != "Rates"  # Rates is a single aggregate record
+    records = _chunked(tbl.records) if per_row else tbl.records
+    for e in entries:
+        op = e.get("op")
+        if op == "add":
+            row = {c: str(e.get("values", {}).get(c, "")) for c in tbl.fieldnames}
+            rows = rows.appended(row)
+            if per_row: records = records.appended(parse_records(tbl.name, tbl.fieldnames, [row])[0])
+        elif op == "edit":
+            i = int(e["index"])
+            row = dict(rows[i])
+            row.update({c: str(v) for c, v in e.get("values", {}).items() if c in row})
+            rows = rows.replaced(i, row)
+            if per_row: records = records.replaced(i, parse_records(tbl.name, tbl.fieldnames, [row])[0])
+        elif op == "delete":
+            i = int(e["index"])
+            rows = rows.deleted(i)
+            if per_row: records = records.deleted(i)
+    if not per_row:
+        records = parse_records(tbl.name, tbl.fieldnames, list(rows))
+    return dataclasses.replace(tbl, rows=rows, records=records, version=version, loaded_at=time.time())
+
+def replay_journal(tbl: CatalogTable) -> CatalogTable:
+    """Apply a leftover journal on top of a freshly parsed CSV table."""
+    if not tbl.path:
+        return tbl
+    entries = _read_entries(journal_path(tbl.path))
+    if not entries:
+        return tbl
+    try:
+        return apply_entries(tbl, entries, tbl.version)
+    except Exception as e:
+        logger.error(f"Journal replay failed for {tbl.name}: {str(e)}")
+        return tbl
+
+class ReferenceWriter:
+    """Journaled write path for the reference tables.
+
+    A write costs one appended line plus an in-memory swap; the CSV is only
+    rewritten by the background compactor, `compact_delay` seconds after the
+    last change (or sooner once `compact_threshold` entries are pending).
+    """
+
+    def __init__(self, catalog: Optional[ReferenceCatalog] = None,
+                 compact_delay: float = 2.0, compact_threshold: int = 500, durable: bool = False):
+        self.catalog = catalog or get_catalog()
+        self.compact_delay = compact_delay
+        self.compact_threshold = compact_threshold
+        self.durable = durable
+        self._lock = threading.Lock()
+        self._pending: Dict[str, int] = {}
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.compactions = 0
+
+    # ── Public write API
+    def add_row(self, table: str, values: Dict[str, Any]) -> int:
+        """Append a row; returns its index."""
+        tbl = self._commit(table, {"op": "add", "values": dict(values or {})})
+        return len(tbl.rows) - 1
+
+    def edit_row(self, table: str, index: int, values: Dict[str, Any],
+                 expect: Optional[Dict[str, Any]] = None) -> None:
+        """Edit a row; `expect` is the row as the caller last saw it."""
+        self._commit(table, {"op": "edit", "index": int(index), "values": dict(values or {})}, expect)
+
+    def delete_row(self, table: str, index: int, expect: Optional[Dict[str, Any]] = None) -> None:
+        """Delete a row; `expect` is the row as the caller last saw it."""
+        self._commit(table, {"op": "delete", "index": int(index)}, expect)
+
+    @staticmethod
+    def _locate(tbl: CatalogTable, index: int, expect: Dict[str, Any]) -> int:
+        """Current index of the row the caller saw at `index`, nearest first."""
+        key = lambda r: [str(r.get(c) if r.get(c) is not None else "") for c in tbl.fieldnames]
+        want = key(expect)
+        if 0 <= index < len(tbl.rows) and key(tbl.rows[index]) == want:
+            return index
+        found = [i for i, r in enumerate(tbl.rows) if key(r) == want]
+        if not found:
+            raise ValueError(f"Row {index} of {tbl.name} was changed or removed by another edit; reload and retry")
+        return min(found, key=lambda i: abs(i - index))
+
+    def _commit(self, table: str, entry: Dict[str, Any],
+                expect: Optional[Dict[str, Any]] = None) -> CatalogTable:
+        with self._lock:
+            tbl = self.catalog.table(table)
+            if not tbl.path:
+                raise ValueError(f"No data file found for {table}")
+            if expect is not None:
+                entry["index"] = self._locate(tbl, entry["index"], expect)
+            if "index" in entry:
+                if not 0 <= entry["index"] < len(tbl.rows):
+                    raise IndexError(f"Row {entry['index']} out of range for {table}")
+                entry["row"] = dict(tbl.rows[entry["index"]])
+            if entry["op"] != "delete":
+                unknown = set(entry["values"]) - set(tbl.fieldnames)
+                if unknown:
+                    raise ValueError(f"Unknown column(s) for {table}: {', '.join(sorted(unknown))}")
+            entry["ts"] = time.time()
+            store = self.catalog.store
+            if store is not None and tbl.path == store.location:
+                # SQLite store: the row write is already O(1); no journal needed
+                store.apply_entry(table, entry)
+                new_tbl = apply_entries(tbl, [entry], self.catalog.next_version())
+                return self.catalog.publish(dataclasses.replace(new_tbl, signature=store.signature(table)))
+            with open(journal_path(tbl.path), "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+                f.flush()
+                if self.durable:
+                    os.fsync(f.fileno())
+            new_tbl = self.catalog.publish(apply_entries(tbl, [entry], self.catalog.next_version()))
+            self._pending[table] = self._pending.get(table, 0) + 1
+        self._schedule()
+        return new_tbl
+
+    # ── Background compaction
+    def _schedule(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._compact_loop, name="catalog-compactor", daemon=True)
+            self._thread.start()
+        self._wake.set()
+
+    def _compact_loop(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            # Debounce: wait for a quiet period unless the backlog is large
+            while self._backlog() < self.compact_threshold:
+                if not self._wake.wait(self.compact_delay):
+                    break
+                self._wake.clear()
+            self.flush()
+
+    def _backlog(self) -> int:
+        with self._lock:
+            return max(self._pending.values(), default=0)
+
+    def flush(self) -> None:
+        """Compact every table with pending journal entries."""
+        with self._lock:
+            names = [n for n, c in self._pending.items() if c]
+        for name in names:
+            try:
+                self.compact(name)
+            except Exception as e:
+                logger.error(f"Compaction failed for {name}: {str(e)}")
+
+    def compact(self, table: str) -> None:
+        with self._lock:
+            tbl = self.catalog.table(table)
+            if not tbl.path or not os.path.isfile(tbl.path):
+                return
+            jpath = journal_path(tbl.path)
+            n_applied = len(_read_entries(jpath))
+            if not n_applied:
+                self._pending[table] = 0
+                return
+
+        # Write the snapshot outside the lock so edits keep flowing
+        dirname = os.path.dirname(os.path.abspath(tbl.path))
+        fd, tmp = tempfile.mkstemp(prefix=".compact-", suffix=".csv", dir=dirname)
+        try:
+            with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+                w = csv.DictWriter(f, fieldnames=tbl.fieldnames, extrasaction="ignore", lineterminator="\n")
+                w.writeheader()
+                w.writerows(tbl.rows)
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception:
+            os.unlink(tmp)
+            raise
+
+        with self._lock, self.catalog.lock:
+            os.replace(tmp, tbl.path)
+            remaining = _read_entries(jpath)[n_applied:]
+            if remaining:
+                jtmp = jpath + ".tmp"
+                with open(jtmp, "w", encoding="utf-8") as f:
+                    for e in remaining:
+                        f.write(json.dumps(e, separators=(",", ":")) + "\n")
+                os.replace(jtmp, jpath)
+            else:
+                os.unlink(jpath)
+            current = self.catalog.peek(table)
+            if current is not None:
+                self.catalog.publish(dataclasses.replace(current, signature=file_signature(tbl.path)))
+            self._pending[table] = len(remaining)
+            self.compactions += 1
+
+# Global reference writer instance
+_writer: Optional[ReferenceWriter] = None
+
+def get_reference_writer() -> ReferenceWriter:
+    """Get the global reference writer instance"""
+    global _writer
+    if _writer is None:
+        _writer = ReferenceWriter()
+    return _writer
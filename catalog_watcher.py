@@ -0,0 +1,159 @@
+# core/catalog_watcher.py
+"""
+Background hot-reload of reference tables.
+
+Watches the data directories with inotify (Linux, via ctypes) and falls back
+to polling file signatures elsewhere or when a SQLite store is active.
+Changed tables are re-parsed on the watcher thread and swapped into the
+catalog atomically; subscribers get a CatalogChange event per swap.
+
+The app starts the global watcher once at startup (start_catalog_watcher).
+Looking up the catalog never starts one, so pool workers and scripts don't
+each spawn a watcher thread.
+"""
+from __future__ import annotations
+import ctypes, ctypes.util, logging, os, select, struct, threading, time
+from typing import Dict, List, Optional, Set
+from core.catalog import TABLE_FILES, ReferenceCatalog, get_catalog
+from core.io_files import candidate_paths
+
+logger = logging.getLogger(__name__)
+
+# inotify event masks (linux/inotify.h)
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+_EVENT = struct.Struct("iIII")
+
+FILE_TABLES: Dict[str, str] = {fn: name for name, fn in TABLE_FILES.items()}
+
+class _Inotify:
+    """Minimal inotify wrapper; raises OSError where unavailable."""
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name or not hasattr(os, "O_NONBLOCK"):
+            raise OSError("inotify unavailable")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("inotify unavailable")
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | getattr(os, "O_CLOEXEC", 0))
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def add_watch(self, path: str) -> None:
+        if self._libc.inotify_add_watch(self.fd, os.fsencode(path), _WATCH_MASK) < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+
+    def read_names(self, timeout: float) -> List[str]:
+        r, _, _ = select.select([self.fd], [], [], timeout)
+        if not r:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        names, pos = [], 0
+        while pos + _EVENT.size <= len(data):
+            _wd, _mask, _cookie, length = _EVENT.unpack_from(data, pos)
+            pos += _EVENT.size
+            names.append(data[pos:pos + length].rstrip(b"\0").decode("utf-8", "replace"))
+            pos += length
+        return names
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+class CatalogWatcher:
+    """Watches reference data and hot-swaps changed tables into the catalog."""
+
+    def __init__(self, catalog: Optional[ReferenceCatalog] = None,
+                 poll_interval: float = 1.0, debounce: float = 0.1, use_inotify: bool = True):
+        self.catalog = catalog or get_catalog()
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.use_inotify = use_inotify
+        self.mode: Optional[str] = None
+        self.swaps = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch_dirs(self) -> List[str]:
+        dirs: List[str] = []
+        for fn in TABLE_FILES.values():
+            for p in candidate_paths(fn):
+                d = os.path.dirname(os.path.abspath(os.path.normpath(p)))
+                if os.path.isdir(d) and d not in dirs:
+                    dirs.append(d)
+        return dirs
+
+    def start(self) -> "CatalogWatcher":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="catalog-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _reload(self, names: Set[str]) -> None:
+        for name in names:
+            try:
+                if self.catalog.refresh(name) is not None:
+                    self.swaps += 1
+                    logger.info(f"Reference table {name} reloaded")
+            except Exception as e:
+                logger.error(f"Reloading {name} failed: {str(e)}")
+
+    def _run(self) -> None:
+        notifier = None
+        if self.use_inotify and self.catalog.store is None:
+            try:
+                notifier = _Inotify()
+                for d in self.watch_dirs():
+                    notifier.add_watch(d)
+            except OSError as e:
+                logger.info(f"inotify unavailable ({e}); polling reference data")
+                if notifier is not None:
+                    notifier.close()
+                notifier = None
+        self.mode = "inotify" if notifier else "poll"
+        try:
+            if notifier:
+                self._run_inotify(notifier)
+            else:
+                self._run_poll()
+        finally:
+            if notifier:
+                notifier.close()
+
+    def _run_inotify(self, notifier: _Inotify) -> None:
+        while not self._stop.is_set():
+            changed = {FILE_TABLES[n] for n in notifier.read_names(0.5) if n in FILE_TABLES}
+            if not changed:
+                continue
+            # Coalesce bursts (editors often write + rename)
+            deadline = time.monotonic() + self.debounce
+            while time.monotonic() < deadline:
+                changed |= {FILE_TABLES[n] for n in notifier.read_names(self.debounce) if n in FILE_TABLES}
+            self._reload(changed)
+
+    def _run_poll(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            self._reload(set(TABLE_FILES))
+
+# Global watcher instance
+_watcher: Optional[CatalogWatcher] = None
+
+def start_catalog_watcher(poll_interval: float = 1.0) -> CatalogWatcher:
+    """Start (once) the background watcher for the global catalog"""
+    global _watcher
+    if _watcher is None:
+        _watcher = CatalogWatcher(poll_interval=poll_interval)
+    return _watcher.start()
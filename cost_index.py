@@ -0,0 +1,89 @@
+# core/cost_index.py
+"""
+Hash-join index from quote items to Hardware, OutsideProcess and Materials
+catalog costs.
+
+Quote hardware and outside-process entries, and the quote material, are
+matched to catalog rows by a normalized name key. The dicts are rebuilt only
+when one of the tables' version changes, so pricing a BOM with hundreds of
+lines is one dict probe per line.
+"""
+from __future__ import annotations
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+from core.catalog import HardwareRecord, MaterialRecord, OutsideProcessRecord, get_catalog
+from core.rules import MATERIAL_CATALOG_NAMES
+
+def join_key(raw: Any) -> str:
+    """Collapse whitespace and upper-case a catalog or quote item name."""
+    return " ".join(str(raw or "").split()).upper()
+
+class CostIndex:
+    """Immutable name -> record dicts for one (Hardware, OutsideProcess, Materials) version triple."""
+
+    def __init__(self, hardware: Iterable[HardwareRecord], outside: Iterable[OutsideProcessRecord],
+                 materials: Iterable[MaterialRecord] = (), versions: Tuple[int, ...] = (0, 0, 0)):
+        self.versions = versions
+        self.hardware: Dict[str, HardwareRecord] = {}
+        for r in hardware:
+            # First row wins, like the catalog's own name lookups
+            self.hardware.setdefault(join_key(r.name), r)
+        self.outside: Dict[str, OutsideProcessRecord] = {}
+        for r in outside:
+            if r.spec:
+                self.outside.setdefault(join_key(f"{r.name} {r.spec}"), r)
+            self.outside.setdefault(join_key(r.name), r)
+        self.materials: Dict[str, MaterialRecord] = {}
+        for r in materials:
+            self.materials.setdefault(join_key(r.name), r)
+        # Short codes (CRS, SS, ...) resolve to their catalog alloy
+        for code, name in MATERIAL_CATALOG_NAMES.items():
+            rec = self.materials.get(join_key(name))
+            if rec is not None:
+                self.materials.setdefault(join_key(code), rec)
+
+    def hardware_for(self, item: Dict[str, Any]) -> Optional[HardwareRecord]:
+        """Catalog row for a quote hardware entry (by part, then type)."""
+        for k in ("part", "type", "hardware_name", "name"):
+            rec = self.hardware.get(join_key(item.get(k)))
+            if rec is not None:
+                return rec
+        return None
+
+    def outside_for(self, item: Dict[str, Any]) -> Optional[OutsideProcessRecord]:
+        """Catalog row for a quote outside-process entry (name + spec first)."""
+        spec = item.get("spec")
+        for k in ("process", "name", "label"):
+            raw = item.get(k)
+            if not raw:
+                continue
+            if spec:
+                rec = self.outside.get(join_key(f"{raw} {spec}"))
+                if rec is not None:
+                    return rec
+            rec = self.outside.get(join_key(raw))
+            if rec is not None:
+                return rec
+        return None
+
+    def material_for(self, material: Any) -> Optional[MaterialRecord]:
+        """Catalog row for a quote material (catalog name or short code)."""
+        return self.materials.get(join_key(material))
+
+# Global cost index (rebuilt per catalog version)
+_index: Optional[CostIndex] = None
+_index_lock = threading.Lock()
+
+def get_cost_index() -> CostIndex:
+    """Get the cost index for the current Hardware/OutsideProcess/Materials catalog tables"""
+    global _index
+    cat = get_catalog()
+    hw, osp, mat = cat.view("Hardware"), cat.view("OutsideProcess"), cat.view("Materials")
+    versions = (hw.version, osp.version, mat.version)
+    idx = _index
+    if idx is None or idx.versions != versions:
+        with _index_lock:
+            if _index is None or _index.versions != versions:
+                _index = CostIndex(hw.records, osp.records, mat.records, versions=versions)
+            idx = _index
+    return idx
@@ -7,6 +7,7 @@ Handles add, edit, delete, and reorder operations with validation
 from typing import List, Dict, Any, Optional
 from .ops import resequenced
 from src.core.io_files import load_ops_name_options
+from core.catalog import get_catalog  # same singleton the watcher and journal publish to
 
 class EditModeManager:
     """Manages edit mode operations for quotes"""
@@ -15,6 +16,12 @@ class EditModeManager:
         self.operation_options = load_ops_name_options()
         self.edit_buffer = []
         self.is_active = False
+        get_catalog().subscribe(self._on_catalog_change)
+
+    def _on_catalog_change(self, change) -> None:
+        """Refresh operation options when the Operations table is reloaded"""
+        if change.table == "Operations":
+            self.operation_options = load_ops_name_options()
 
     def start_edit_mode(self, current_operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Start edit mode with current operations"""
@@ -1,9 +1,11 @@
 # logic/estimator.py
 from __future__ import annotations
-import math, csv
+import math
 from typing import Optional, Tuple, List, Dict
+import numpy as np
 from core.rules import DENSITY
-from core.io_files import candidate_paths_first
+from core.catalog import get_catalog
+from core.cost_index import get_cost_index
 
 def mm_to_in(x: Optional[float]) -> Optional[float]:
     if x in (None, ""): return None
@@ -26,13 +28,36 @@ def calc_bd(angle_deg: float, r_in: float, t_in: float, ba: float) -> float:
     sb = (r_in + t_in) * math.tan((angle_deg / 2.0) * (math.pi / 180.0))
     return 2.0 * sb - ba
 
+def calc_ba_array(angle_deg, r_in, k_factor, t_in) -> np.ndarray:
+    """calc_ba over NumPy arrays (inputs broadcast together)."""
+    angle_deg, r_in, k_factor, t_in = (np.asarray(x, dtype=np.float64) for x in (angle_deg, r_in, k_factor, t_in))
+    return (math.pi / 180.0) * angle_deg * (r_in + k_factor * t_in)
+
+def calc_bd_array(angle_deg, r_in, t_in, ba) -> np.ndarray:
+    """calc_bd over NumPy arrays (inputs broadcast together)."""
+    angle_deg, r_in, t_in, ba = (np.asarray(x, dtype=np.float64) for x in (angle_deg, r_in, t_in, ba))
+    sb = (r_in + t_in) * np.tan((angle_deg / 2.0) * (math.pi / 180.0))
+    return 2.0 * sb - ba
+
+def material_density(material: str) -> Optional[float]:
+    """lb/in^3 from the Materials catalog, else the rules.DENSITY table."""
+    if not material:
+        return None
+    try:
+        rec = get_cost_index().material_for(material)
+        if rec is not None and rec.density_lb_in3:
+            return float(rec.density_lb_in3)
+    except Exception:
+        pass
+    return DENSITY.get(material.upper())
+
 def compute_weight_lb(material: str,
                       thickness_in: Optional[float],
                       flat_w_in: Optional[float],
                       flat_h_in: Optional[float]) -> Optional[float]:
     if not material or None in (thickness_in, flat_w_in, flat_h_in):
         return None
-    dens = DENSITY.get(material.upper())
+    dens = material_density(material)
     if not dens:
         return None
     try:
@@ -45,36 +70,15 @@ def get_form_defaults_from_csv() -> Tuple[float, float]:
     """Returns (setup_min_default, sec_per_bend_default). Fallback (2.0, 10.0)."""
     setup_def = 2.0
     sec_per_bend_def = 10.0
-    path = candidate_paths_first("Operations[UFG]_sQL.csv")
-    if not path:
-        return setup_def, sec_per_bend_def
-    try:
-        with open(path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-        if not rows: return setup_def, sec_per_bend_def
-        header_map = {k.lower(): k for k in rows[0].keys()}
-        cn = next((header_map[k] for k in ["operation","opname","name","operation_name","op_name","label"] if k in header_map), None)
-        csetup = next((header_map[k] for k in ["setup_min","setup","setup_time_min","setup_minutes"] if k in header_map), None)
-        csecop = next((header_map[k] for k in ["sec_per_op","time_sec_per_op","runtime_per_op_sec","sec_per_bend"] if k in header_map), None)
-        ctime = next((header_map[k] for k in ["time_sec","runtime_sec","time_seconds"] if k in header_map), None)
-        for r in rows:
-            name = str(r.get(cn, "") if cn else "").strip().lower()
-            if name == "form":
-                if csetup:
-                    try: setup_def = float(str(r.get(csetup,"")).strip() or setup_def)
-                    except Exception: pass
-                if csecop:
-                    try: sec_per_bend_def = float(str(r.get(csecop,"")).strip() or sec_per_bend_def)
-                    except Exception: pass
-                elif ctime:
-                    try:
-                        val = float(str(r.get(ctime,"")).strip())
-                        if val > 0: sec_per_bend_def = val
-                    except Exception: pass
-                break
-    except Exception:
-        return setup_def, sec_per_bend_def
+    for r in get_catalog().operations():
+        if r.name.lower() == "form":
+            if r.setup_min is not None:
+                setup_def = r.setup_min
+            if r.sec_per_op is not None:
+                sec_per_bend_def = r.sec_per_op
+            elif r.time_sec is not None and r.time_sec > 0:
+                sec_per_bend_def = r.time_sec
+            break
     return setup_def, sec_per_bend_def
 
 def ensure_form_op_with_bends(rows: List[Dict], bends: int) -> List[Dict]:
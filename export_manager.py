@@ -280,6 +280,14 @@ class ExportManager:
 
         return html
 
+    def pricing_data(self, operations: List[Dict[str, Any]], quote_data: Dict[str, Any],
+                     rates: Dict[str, float], quantities: Optional[List[int]] = None,
+                     markup_percent: float = 15.0, as_of: Any = None) -> Dict[str, Any]:
+        """Pricing summary for an export, shared with the quote pages via the pricing cache"""
+        from logic.pricing_cache import get_pricing_cache
+        _, summary = get_pricing_cache().pricing_table(operations, quote_data, rates, quantities, markup_percent, as_of)
+        return summary
+
     def list_exports(self) -> List[str]:
         """List all exported files"""
         try:
@@ -0,0 +1,178 @@
+# logic/flat_pattern.py
+"""
+Flat-pattern developer from flange lengths and a bend list.
+
+Flanges are measured to the outside mold line. Along each axis (width,
+height) the developed length is the sum of the flange lengths minus one
+bend deduction per bend on that axis:
+
+    developed = Σ flanges − Σ BD
+
+BD comes from the material's bend table (bend_tables), in one vectorized
+lookup for the whole bend list. Hems (type HEM or angle ≥ 179.5°) have no
+finite setback; their deduction is 2·(r + t) − BA, with the flanges
+measured to the outside of the fold. Other bends must stay within the bend
+table (≤ 150°): between the grid and the hem threshold the setback grows
+without bound (BD ≈ 51" at 179.4°), so those angles raise BendAngleError.
+
+Editing one bend re-derives only that bend's deduction. The axis totals are
+then re-summed from the cached deductions, which needs no trig, so the
+developer can run on every keystroke.
+"""
+from __future__ import annotations
+import json
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Dict, List, Optional
+import numpy as np
+from core.rules import BEND_ANGLES
+from logic.bend_tables import get_bend_table
+
+AXES = ("width", "height")
+HEM_ANGLE = 179.5
+MAX_BEND_ANGLE = max(BEND_ANGLES)
+
+class BendAngleError(ValueError):
+    """A non-hem bend angle beyond the bend table."""
+
+@dataclass(frozen=True)
+class Bend:
+    angle: float              # bend angle, degrees (90 = right angle)
+    radius: float             # inside radius, inches
+    axis: str = "width"       # developed dimension the bend shortens
+    type: str = "BEND"        # BEND, HEM, JOG, OFFSET, Z-BEND
+    id: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Bend":
+        axis = str(d.get("axis") or "width").lower()
+        return cls(angle=float(d.get("angle") or 90.0), radius=float(d.get("radius") or 0.0),
+                   axis=axis if axis in AXES else "width", type=str(d.get("type") or "BEND").upper(),
+                   id=d.get("id"))
+
+def _is_hem(b: Bend) -> bool:
+    return b.type == "HEM" or b.angle >= HEM_ANGLE
+
+def _check_angles(bends: List[Bend]) -> None:
+    bad = [b for b in bends if not _is_hem(b) and b.angle > MAX_BEND_ANGLE]
+    if bad:
+        b = bad[0]
+        name = f"Bend {b.id}" if b.id is not None else "Bend"
+        raise BendAngleError(f"{name}: {b.angle:g}° is above the {MAX_BEND_ANGLE:g}° bend table; "
+                             f"enter ≤ {MAX_BEND_ANGLE:g}° or mark it as a HEM")
+
+class FlatPattern:
+    """Developed flat size for one part, updated per edited bend."""
+
+    def __init__(self, flanges: Optional[Dict[str, List[float]]] = None,
+                 bends: Optional[List[Bend]] = None,
+                 thickness_in: float = 0.125, material: Optional[str] = None,
+                 k_factor: Optional[float] = None):
+        self.thickness_in = float(thickness_in)
+        self.material = material
+        self.k_factor = k_factor
+        self.flanges: Dict[str, List[float]] = {a: [float(x) for x in (flanges or {}).get(a, [])] for a in AXES}
+        self.bends: List[Bend] = list(bends or [])
+        self.deductions = np.zeros(0)
+        self.recomputed = 0     # bend deductions derived by the last update
+        self._develop_all()
+
+    # ── Deductions
+    def _deductions(self, bends: List[Bend]) -> np.ndarray:
+        if not bends:
+            return np.zeros(0)
+        _check_angles(bends)
+        table = get_bend_table(self.material, self.k_factor)
+        angle = np.array([b.angle for b in bends], dtype=np.float64)
+        radius = np.array([b.radius for b in bends], dtype=np.float64)
+        hem = np.array([_is_hem(b) for b in bends])
+        ba, bd = table.lookup(np.where(hem, 180.0, angle), radius, self.thickness_in)
+        # Hems: flanges to the outside of the fold, so the setback is r + t per side
+        return np.where(hem, 2.0 * (radius + self.thickness_in) - ba, bd)
+
+    def _develop_all(self) -> None:
+        self.deductions = self._deductions(self.bends)
+        self.recomputed = len(self.bends)
+
+    # ── Edits
+    def set_bend(self, index: int, bend: Optional[Bend] = None, **changes: Any) -> None:
+        """Replace (or patch fields of) one bend; only its deduction is re-derived."""
+        bend = bend if bend is not None else replace(self.bends[index], **changes)
+        self.deductions[index] = self._deductions([bend])[0]
+        self.bends[index] = bend
+        self.recomputed = 1
+
+    def add_bend(self, bend: Bend) -> None:
+        self.deductions = np.append(self.deductions, self._deductions([bend]))
+        self.bends.append(bend)
+        self.recomputed = 1
+
+    def remove_bend(self, index: int) -> None:
+        self.bends.pop(index)
+        self.deductions = np.delete(self.deductions, index)
+        self.recomputed = 0
+
+    def set_flanges(self, axis: str, lengths: List[float]) -> None:
+        self.flanges[axis] = [float(x) for x in lengths]
+        self.recomputed = 0
+
+    def set_stock(self, thickness_in: float, material: Optional[str] = None) -> None:
+        """Thickness or material changes every deduction."""
+        self.thickness_in = float(thickness_in)
+        self.material = material
+        self._develop_all()
+
+    def sync(self, bends: List[Bend]) -> int:
+        """Apply a full bend list, re-deriving only bends that differ. Returns the count re-derived.
+
+        A rejected bend (BendAngleError) leaves the pattern unchanged.
+        """
+        if len(bends) != len(self.bends):
+            self.deductions = self._deductions(list(bends))
+            self.bends = list(bends)
+            self.recomputed = len(self.bends)
+            return self.recomputed
+        changed = [i for i, (a, b) in enumerate(zip(self.bends, bends)) if a != b]
+        if changed:
+            self.deductions[changed] = self._deductions([bends[i] for i in changed])
+            for i in changed:
+                self.bends[i] = bends[i]
+        self.recomputed = len(changed)
+        return self.recomputed
+
+    # ── Output
+    def developed(self, axis: str) -> float:
+        mask = np.array([b.axis == axis for b in self.bends], dtype=bool)
+        return float(sum(self.flanges[axis]) - self.deductions[mask].sum())
+
+    @property
+    def width(self) -> float:
+        return self.developed("width")
+
+    @property
+    def height(self) -> float:
+        return self.developed("height")
+
+    def to_flat_extract(self) -> Dict[str, Any]:
+        """flatExtract JSON (dimensions + bend list) for saving with a quote."""
+        return {"dimensions": {"width": round(self.width, 4), "height": round(self.height, 4)},
+                "material": self.material, "thickness_in": self.thickness_in,
+                "flanges": {a: list(v) for a, v in self.flanges.items()},
+                "bends": [dict(asdict(b), deduction=round(float(d), 4))
+                          for b, d in zip(self.bends, self.deductions)]}
+
+def parse_flat_extract(data: Any) -> Dict[str, Any]:
+    """{flanges, bends, thickness_in, material} from flatExtract JSON text or dict."""
+    if isinstance(data, str):
+        data = json.loads(data) if data.strip() else {}
+    data = data.get("flatExtract", data) if isinstance(data, dict) else {}
+    flanges = data.get("flanges") or {}
+    return {"flanges": {a: [float(x) for x in (flanges.get(a) or [])] for a in AXES},
+            "bends": [Bend.from_dict(b) for b in (data.get("bends") or []) if isinstance(b, dict)],
+            "thickness_in": data.get("thickness_in"),
+            "material": data.get("material")}
+
+def develop(flanges: Dict[str, List[float]], bends: List[Bend], thickness_in: float,
+            material: Optional[str] = None) -> Dict[str, float]:
+    """One-shot developed {width, height}."""
+    fp = FlatPattern(flanges, bends, thickness_in, material)
+    return {"width": fp.width, "height": fp.height}
@@ -0,0 +1,189 @@
+# core/hardware_import.py
+"""
+Streaming bulk importer for vendor hardware price files.
+
+Rows are read, validated, normalized and de-duplicated one at a time and
+streamed into a new Hardware[UFG]_sQL.csv (temp file + atomic rename), so
+memory stays flat regardless of file size. Rejected rows go to a side file
+with a reason column. The only per-row state kept is a 64-bit hash per
+accepted part name for de-duplication.
+"""
+from __future__ import annotations
+import csv, hashlib, logging, os, tempfile, time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from core.catalog import HW_COST_COLS, HW_NAME_COLS, HW_QTY_COLS, TABLE_FILES, get_catalog
+from core.io_files import candidate_paths_first
+
+logger = logging.getLogger(__name__)
+
+HARDWARE_FIELDS = ["hardware_name", "unit_cost", "default_qty"]
+
+# Extra vendor header spellings on top of the catalog aliases
+# Part-number columns win over free-text descriptions
+VENDOR_NAME_COLS = ["hardware_name", "sku", "item_number", "mfr_part_number", "mfr_part", "pn", "item"] + HW_NAME_COLS
+VENDOR_COST_COLS = HW_COST_COLS + ["each", "unit_price_usd", "list_price", "net_price"]
+VENDOR_QTY_COLS = HW_QTY_COLS + ["pack_qty", "min_qty"]
+
+@dataclass
+class ImportReport:
+    rows_read: int = 0
+    accepted: int = 0
+    duplicates: int = 0
+    rejected: int = 0
+    seconds: float = 0.0
+    output_path: Optional[str] = None
+    rejects_path: Optional[str] = None
+    reasons: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows_read / self.seconds if self.seconds else 0.0
+
+def _name_key(name: str) -> bytes:
+    return hashlib.blake2b(name.upper().encode("utf-8"), digest_size=8).digest()
+
+def normalize_name(raw: str) -> str:
+    """Collapse whitespace and upper-case a vendor part name."""
+    return " ".join(str(raw or "").split()).upper()
+
+def normalize_cost(raw: str) -> Optional[float]:
+    s = str(raw or "").strip().replace("$", "").replace(",", "")
+    if not s:
+        return None
+    try:
+        v = float(s)
+    except ValueError:
+        return None
+    return round(v, 5) if v >= 0 else None
+
+def normalize_qty(raw: str) -> Optional[int]:
+    s = str(raw or "").strip()
+    if not s:
+        return 1
+    try:
+        v = float(s)
+    except ValueError:
+        return None
+    return int(v) if v >= 1 and v == int(v) else None
+
+def _format_cost(v: float) -> str:
+    return f"{v:.5f}".rstrip("0").rstrip(".") or "0"
+
+def _resolve(header: List[str]) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    low = {h.strip().lower(): i for i, h in enumerate(header)}
+    pick = lambda opts: next((low[o] for o in opts if o in low), None)
+    return pick(VENDOR_NAME_COLS), pick(VENDOR_COST_COLS), pick(VENDOR_QTY_COLS)
+
+def iter_vendor_rows(path: str, encoding: str = "utf-8-sig") -> Iterator[List[str]]:
+    with open(path, newline="", encoding=encoding, errors="replace") as f:
+        yield from csv.reader(f)
+
+def import_hardware(source: str,
+                    dest: Optional[str] = None,
+                    rejects: Optional[str] = None,
+                    merge_existing: bool = True,
+                    on_duplicate: str = "keep_first",
+                    progress: Optional[Callable[[ImportReport], None]] = None,
+                    progress_every: int = 50_000) -> ImportReport:
+    """Stream `source` into the hardware catalog CSV.
+
+    merge_existing: start from the current Hardware table (existing names win
+        when on_duplicate="keep_first").
+    on_duplicate: "keep_first" drops later rows for a name already accepted;
+        "reject" also writes them to the rejects file.
+    """
+    catalog = get_catalog()
+    dest = dest or candidate_paths_first(TABLE_FILES["Hardware"]) or TABLE_FILES["Hardware"]
+    if os.path.isfile(dest) and os.path.abspath(dest) == os.path.abspath(catalog.table("Hardware").path or ""):
+        # Fold pending journaled edits into the CSV before it is rewritten
+        from core.catalog_journal import get_reference_writer  # local import to avoid cycles
+        get_reference_writer().compact("Hardware")
+    rejects = rejects or os.path.splitext(source)[0] + ".rejects.csv"
+    report = ImportReport(output_path=dest, rejects_path=rejects)
+    seen: set = set()
+    start = time.perf_counter()
+
+    def reject(row: List[str], reason: str) -> None:
+        report.rejected += 1
+        report.reasons[reason] = report.reasons.get(reason, 0) + 1
+        rej_writer.writerow(row + [reason])
+
+    dirname = os.path.dirname(os.path.abspath(dest))
+    fd, tmp = tempfile.mkstemp(prefix=".import-", suffix=".csv", dir=dirname)
+    try:
+        with os.fdopen(fd, "w", newline="", encoding="utf-8") as out, \
+             open(rejects, "w", newline="", encoding="utf-8") as rej:
+            writer = csv.writer(out, lineterminator="\n")
+            rej_writer = csv.writer(rej, lineterminator="\n")
+            writer.writerow(HARDWARE_FIELDS)
+
+            if merge_existing and os.path.isfile(dest):
+                rows = iter_vendor_rows(dest, encoding="utf-8")
+                header = next(rows, [])
+                ni, ci, qi = _resolve(header)
+                if ni is None and (header or next(rows, None) is not None):
+                    raise ValueError(f"{dest}: existing Hardware file has no part-name column, got {header}; "
+                                     f"import with merge_existing=False to replace it")
+                for r in rows:
+                    # Existing rows are kept verbatim; only their names are registered
+                    name = normalize_name(r[ni]) if ni < len(r) else ""
+                    if name:
+                        seen.add(_name_key(name))
+                    writer.writerow(r[:3] if (ni, ci, qi) == (0, 1, 2) else
+                                    [r[ni] if ni < len(r) else "", r[ci] if ci is not None and ci < len(r) else "",
+                                     r[qi] if qi is not None and qi < len(r) else ""])
+
+            rows = iter_vendor_rows(source)
+            header = next(rows, [])
+            ni, ci, qi = _resolve(header)
+            rej_writer.writerow(header + ["reject_reason"])
+            if ni is None or ci is None:
+                raise ValueError(f"{source}: need a part-name and a cost column, got {header}")
+
+            width = len(header)
+            for r in rows:
+                report.rows_read += 1
+                if len(r) < width:
+                    reject(r, "short_row")
+                else:
+                    name = normalize_name(r[ni])
+                    cost = normalize_cost(r[ci])
+                    qty = normalize_qty(r[qi]) if qi is not None else 1
+                    if not name:
+                        reject(r, "missing_name")
+                    elif cost is None:
+                        reject(r, "bad_cost")
+                    elif qty is None:
+                        reject(r, "bad_qty")
+                    else:
+                        key = _name_key(name)
+                        if key in seen:
+                            report.duplicates += 1
+                            if on_duplicate == "reject":
+                                reject(r, "duplicate")
+                        else:
+                            seen.add(key)
+                            writer.writerow([name, _format_cost(cost), qty])
+                            report.accepted += 1
+                if progress and report.rows_read % progress_every == 0:
+                    report.seconds = time.perf_counter() - start
+                    progress(report)
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp, dest)
+    except Exception:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+    if catalog.store is not None and os.path.abspath(dest) == os.path.abspath(
+            candidate_paths_first(TABLE_FILES["Hardware"]) or ""):
+        catalog.store.import_csv("Hardware", dest)
+    catalog.refresh("Hardware")
+    report.seconds = time.perf_counter() - start
+    logger.info(f"Hardware import: {report.accepted} accepted, {report.duplicates} duplicates, "
+                f"{report.rejected} rejected ({report.rows_per_sec:,.0f} rows/sec)")
+    if progress:
+        progress(report)
+    return report
@@ -0,0 +1,128 @@
+# core/hardware_index.py
+"""
+Prefix + trigram index over the Hardware catalog for typeahead search.
+
+Built once per Hardware table version; lookups never scan the full list.
+"""
+from __future__ import annotations
+import bisect, heapq, threading
+from array import array
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from core.catalog import HardwareRecord, get_catalog
+
+@dataclass(frozen=True)
+class HardwareMatch:
+    name: str
+    unit_cost: Optional[float]
+    default_qty: Optional[int]
+    score: float
+
+    def to_row(self) -> Dict[str, object]:
+        return {"hardware_name": self.name, "unit_cost": self.unit_cost, "default_qty": self.default_qty}
+
+def _norm(s: str) -> str:
+    return " ".join(str(s).lower().split())
+
+def _trigrams(s: str) -> List[str]:
+    p = f"  {s} "
+    return list({p[i:i + 3] for i in range(len(p) - 2)})
+
+class HardwareIndex:
+    """Immutable search index over a list of HardwareRecord."""
+
+    # Cap on postings examined for fuzzy (non-substring) fallback
+    FUZZY_POSTING_LIMIT = 4
+
+    def __init__(self, records: List[HardwareRecord], version: int = 0):
+        self.version = version
+        seen: Dict[str, int] = {}
+        recs: List[HardwareRecord] = []
+        for r in records:
+            if r.name and r.name not in seen:
+                seen[r.name] = len(recs)
+                recs.append(r)
+        self.records = recs
+        self._keys = [_norm(r.name) for r in recs]
+        # Sorted (key, id) pairs for prefix range lookups
+        self._sorted = sorted((k, i) for i, k in enumerate(self._keys))
+        self._sorted_keys = [k for k, _ in self._sorted]
+        post: Dict[str, List[int]] = {}
+        for i, k in enumerate(self._keys):
+            for g in _trigrams(k):
+                post.setdefault(g, []).append(i)
+        self._postings: Dict[str, array] = {g: array("i", ids) for g, ids in post.items()}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _prefix_ids(self, q: str, limit: int) -> List[int]:
+        lo = bisect.bisect_left(self._sorted_keys, q)
+        out: List[int] = []
+        for j in range(lo, len(self._sorted)):
+            key, i = self._sorted[j]
+            if not key.startswith(q) or len(out) >= limit:
+                break
+            out.append(i)
+        return out
+
+    def _score(self, q: str, key: str, q_grams: int, shared: int) -> float:
+        if key == q:
+            return 4.0
+        if key.startswith(q):
+            return 3.0 + len(q) / len(key)
+        pos = key.find(q)
+        if pos >= 0:
+            return 2.0 + len(q) / len(key) - min(pos, 50) / 1000.0
+        return shared / float(q_grams + len(key) + 2 - shared)  # trigram jaccard
+
+    def search(self, query: str, k: int = 10) -> List[HardwareMatch]:
+        q = _norm(query)
+        if not q or k <= 0:
+            return []
+        scored: Dict[int, float] = {}
+        for i in self._prefix_ids(q, k):
+            scored[i] = self._score(q, self._keys[i], 0, 0)
+        if len(scored) < k:
+            keys = self._keys
+            inner = {q[i:i + 3] for i in range(len(q) - 2)}
+            if inner:
+                # Substring candidates: every match appears in the rarest inner gram's postings
+                rarest = min((self._postings.get(g, ()) for g in inner), key=len)
+                for i in rarest:
+                    if i not in scored and q in keys[i]:
+                        scored[i] = self._score(q, keys[i], 0, 0)
+            if not scored:
+                # Fuzzy fallback (typos): trigram overlap over the rarest grams only
+                grams = _trigrams(q)
+                lists = sorted((pl for pl in (self._postings.get(g) for g in grams) if pl), key=len)
+                counts: Dict[int, int] = {}
+                for pl in lists[:self.FUZZY_POSTING_LIMIT]:
+                    for i in pl:
+                        counts[i] = counts.get(i, 0) + 1
+                for i, c in counts.items():
+                    if i not in scored:
+                        scored[i] = self._score(q, keys[i], len(grams), c)
+        best: List[Tuple[float, int]] = heapq.nlargest(k, ((s, -i) for i, s in scored.items()))
+        return [HardwareMatch(self.records[-ni].name, self.records[-ni].unit_cost,
+                              self.records[-ni].default_qty, round(s, 4)) for s, ni in best]
+
+# Global index, rebuilt when the Hardware table version changes
+_index: Optional[HardwareIndex] = None
+_index_lock = threading.Lock()
+
+def get_hardware_index() -> HardwareIndex:
+    """Get the hardware index for the current Hardware catalog table"""
+    global _index
+    tbl = get_catalog().view("Hardware")
+    idx = _index
+    if idx is None or idx.version != tbl.version:
+        with _index_lock:
+            if _index is None or _index.version != tbl.version:
+                _index = HardwareIndex(tbl.records, version=tbl.version)
+            idx = _index
+    return idx
+
+def search_hardware(query: str, k: int = 10) -> List[HardwareMatch]:
+    """Ranked top-k hardware matches for a typeahead query."""
+    return get_hardware_index().search(query, k)
@@ -0,0 +1,107 @@
+# logic/material_alternatives.py
+"""
+Material × thickness alternatives explorer.
+
+Prices every Materials catalog alloy at every standard thickness
+(rules.THICKNESS_BASE) for the quote's current flat size in one broadcast
+pass. Everything except the material row (setup, runtime, hardware, outside
+processes) is shared, so only an (M, T) matrix of per-part material costs
+changes between alternatives. Cells, subtotal and markup are rounded and
+summed in the same order as compute_pricing_table, so any (material,
+thickness) cell equals pricing the quote with that material and thickness.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
+from core.rules import THICKNESS_BASE
+from logic.pricing import (_cost_index, _flat_area, _line_items, _material_utilization,
+                           _safe_num, rates_at)
+from logic.pricing_vector import as_quantities, round2
+
+@dataclass
+class MaterialAlternatives:
+    materials: List[str]
+    thicknesses: np.ndarray      # (T,) inches
+    quantities: np.ndarray       # (Q,)
+    weight_lb: np.ndarray        # (M, T) blank weight per part
+    material_cost: np.ndarray    # (M, T) material $ per part
+    totals: np.ndarray           # (M, T, Q) quote total
+
+    @property
+    def combinations(self) -> int:
+        return self.weight_lb.size
+
+    def unit_prices(self) -> np.ndarray:
+        """Total ÷ quantity, shape (M, T, Q)."""
+        return self.totals / self.quantities
+
+    def ranked(self, qty: Optional[int] = None) -> List[Dict[str, Any]]:
+        """One dict per combination, cheapest total first at `qty` (default: first quantity)."""
+        j = 0 if qty is None else int(np.flatnonzero(self.quantities == qty)[0])
+        order = np.argsort(self.totals[:, :, j], axis=None, kind="stable")
+        rows = []
+        for flat in order:
+            m, t = divmod(int(flat), len(self.thicknesses))
+            rows.append({"material": self.materials[m], "thickness_in": float(self.thicknesses[t]),
+                         "weight_lb": round(float(self.weight_lb[m, t]), 4),
+                         "material_cost": round(float(self.material_cost[m, t]), 4),
+                         "totals": {int(q): float(v) for q, v in zip(self.quantities, self.totals[m, t])}})
+        return rows
+
+def explore_materials(ops: List[Dict[str, Any]],
+                      quote: Dict[str, Any],
+                      rates: Dict[str, float],
+                      quantities: Any = None,
+                      markup_percent: float = 15.0,
+                      materials: Optional[Sequence[str]] = None,
+                      thicknesses: Optional[Sequence[float]] = None,
+                      as_of: Any = None) -> MaterialAlternatives:
+    """Quote totals for every material × thickness at the quote's flat size.
+
+    `materials` defaults to every priced Materials catalog row; `thicknesses`
+    to rules.THICKNESS_BASE.
+    """
+    if as_of is not None:
+        rates = rates_at(as_of, fallback=rates)
+    idx = _cost_index()
+    if idx is None:
+        recs = []
+    elif materials is None:
+        recs = list(idx.materials.values())
+    else:
+        recs = [idx.material_for(m) for m in materials]
+    seen, mats = set(), []
+    for r in recs:
+        if r is not None and r.name not in seen and _safe_num(r.unit_price_lb) > 0 \
+                and _safe_num(r.density_lb_in3) > 0:
+            seen.add(r.name)
+            mats.append(r)
+    t = np.asarray(thicknesses if thicknesses is not None else [inch for inch, _ in THICKNESS_BASE],
+                   dtype=np.float64)
+    q = as_quantities(quantities).astype(np.float64)
+
+    density = np.array([float(r.density_lb_in3) for r in mats], dtype=np.float64)
+    price = np.array([float(r.unit_price_lb) for r in mats], dtype=np.float64)
+    volume = t * _flat_area(quote)                                               # (T,)
+    weight = density[:, None] * volume[None, :]                                  # (M, T)
+    # Same operation order as pricing._material_line
+    mat_cost = weight * price[:, None] / _material_utilization(quote)
+
+    # Everything but the material row is shared by all alternatives
+    total_setup_min, runtime_per_part, hw_items, op_items = _line_items(ops, dict(quote, material=None), rates)
+    subtotal = np.zeros(q.shape) + round(total_setup_min * rates["setup"], 2)
+    subtotal = subtotal + round2(runtime_per_part * q)
+    subtotal = subtotal + round2(mat_cost[..., None] * q)                       # (M, T, Q)
+    adders: Dict[str, float] = {}
+    for label, ppq, unit in hw_items:
+        adders[label] = ppq * unit
+    for label, unit in op_items:
+        adders[label] = unit
+    for factor in adders.values():
+        subtotal = subtotal + round2(factor * q)
+    markup = round2(subtotal * (markup_percent / 100.0))
+    totals = round2(subtotal + markup)
+    return MaterialAlternatives(materials=[r.name for r in mats], thicknesses=t,
+                                quantities=q.astype(np.int64), weight_lb=weight,
+                                material_cost=mat_cost, totals=totals)
@@ -2,6 +2,7 @@ from taipy.gui import notify, navigate
 from core.rules import MATERIAL_CHOICES, thickness_choices_for
 from logic.quote_utils import normalize_quote_metadata
 from logic.edit_mode import get_edit_mode_manager
+from core.hardware_index import search_hardware
 
 def format_thickness(thickness_in):
     """Format thickness according to business rules [PSX001.B]"""
@@ -44,6 +45,10 @@ Bends: {quote.bend_count or '—'}
 ### Additional Details
 <|{quote.bend_count}|number|label=Bend Count|min=0|max=20|>
 
+### Hardware
+<|{hardware_query}|input|label=Search Hardware|on_change=on_hardware_search|change_delay=150|>
+<|{hardware_matches}|table|show_all=True|>
+
 <|Save Part|button|on_action=on_save_part|class_name=success|>
 |>
 
@@ -103,6 +108,12 @@ Bends: {quote.bend_count or '—'}
     if not hasattr(state, 'operations'):
         state.operations = []
 
+    # Hardware typeahead (matches are computed server-side)
+    if not hasattr(state, 'hardware_query'):
+        state.hardware_query = ""
+    if not hasattr(state, 'hardware_matches'):
+        state.hardware_matches = []
+
     # Initialize edit mode prompt
     if not hasattr(state, 'edit_mode_prompt'):
         state.edit_mode_prompt = ""
@@ -116,6 +127,15 @@ def on_material_change(state):
     state.thickness_options = [label for label, _ in thickness_opts]
     notify(state, "info", f"Material changed to {current_material}")
 
+def on_hardware_search(state):
+    """Server-side hardware autocomplete; only the top matches reach the browser"""
+    try:
+        matches = search_hardware(state.hardware_query or "", k=10)
+        state.hardware_matches = [m.to_row() for m in matches]
+    except Exception as e:
+        state.hardware_matches = []
+        notify(state, "error", f"Hardware search failed: {str(e)}")
+
 def on_save_part(state):
     """Save part information"""
     try:
@@ -4,7 +4,7 @@ Pricing calculation logic for ShopQuote Taipy
 Migrated from original Streamlit implementation
 """
 
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional
 import math
 
 def _safe_num(v: Any, as_int: bool = False) -> float:
@@ -27,76 +27,211 @@ def _op_cost_per_part(row: Dict[str, Any], rates: Dict[str, float], qty: int) ->
     run_cpp = runtime_min * (rates["labor"] + rates["machine"])
     return round(setup_cpp + run_cpp, 4)
 
-def _collect_adders_per_part(quote: Dict[str, Any]) -> Tuple[float, Dict[str, float]]:
-    """Collect hardware and outside process costs"""
+def _flat_area(quote: Dict[str, Any]) -> float:
+    """Flat blank area in square inches (flat_size_width × flat_size_height)."""
+    return _safe_num(quote.get("flat_size_width")) * _safe_num(quote.get("flat_size_height"))
+
+def _cost_index():
+    """Catalog cost index, or None when pricing runs without the core package.
+
+    Errors loading the catalog itself (bad CSV, bugs) propagate to the caller.
+    """
+    try:
+        from core.cost_index import get_cost_index  # local import keeps pricing usable standalone
+    except ImportError:
+        return None
+    return get_cost_index()
+
+# Share of the purchased blank that ends up in the part (the rest is scrap/skeleton)
+DEFAULT_MATERIAL_UTILIZATION = 0.85
+
+def _material_utilization(quote: Dict[str, Any]) -> float:
+    """quote['material_utilization'] in (0, 1], else the default."""
+    u = _safe_num(quote.get("material_utilization"))
+    return u if 0 < u <= 1 else DEFAULT_MATERIAL_UTILIZATION
+
+def _material_line(quote: Dict[str, Any], costs: Any = None) -> Optional[Tuple[str, float]]:
+    """(label, cost per part) for the raw material of the flat blank, or None.
+
+    Blank weight is catalog density × thickness × flat area; the cost is that
+    weight × unit_price_lb ÷ utilization.
+    """
+    volume = _safe_num(quote.get("thickness_in")) * _flat_area(quote)
+    if volume <= 0:
+        return None
+    rate = _material_rate(quote, costs)
+    if rate is None:
+        return None
+    label, density, price = rate
+    return label, density * volume * price / _material_utilization(quote)
+
+def _material_rate(quote: Dict[str, Any], costs: Any = None) -> Optional[Tuple[str, float, float]]:
+    """(label, density_lb_in3, unit_price_lb) for the quote's priced catalog material, or None."""
+    material = quote.get("material")
+    if not material:
+        return None
+    idx = costs or _cost_index()
+    rec = idx.material_for(material) if idx is not None else None
+    if rec is None:
+        return None
+    price, density = _safe_num(rec.unit_price_lb), _safe_num(rec.density_lb_in3)
+    if price <= 0 or density <= 0:
+        return None
+    return f"MAT-[{rec.name}]", density, price
+
+def _hw_line(hw: Any, costs: Any = None) -> Optional[Tuple[str, int, float]]:
+    """(label, per_part_qty, unit) for a hardware entry, or None if it adds nothing.
+
+    Entries without a cost are joined to the Hardware catalog by name, which
+    also supplies default_qty when the entry has no quantity.
+    """
+    if not isinstance(hw, dict):
+        return None
+    typ = (str(hw.get("type") or hw.get("part") or "HW")).strip() or "HW"
+    raw_qty = hw.get("qty_per_part") or hw.get("qty")
+    unit = (_safe_num(hw.get("unit_cost")) or
+            _safe_num(hw.get("cost_per_part")) or
+            _safe_num(hw.get("price")) or
+            _safe_num(hw.get("unit_price")))
+    if unit <= 0:
+        idx = costs or _cost_index()
+        rec = idx.hardware_for(hw) if idx is not None else None
+        if rec is None:
+            return None
+        unit = _safe_num(rec.unit_cost)
+        if not raw_qty:
+            raw_qty = rec.default_qty
+        if unit <= 0:
+            return None
+    per_part_qty = _safe_num(raw_qty or 1, as_int=True) or 1
+    return f"HW-[{typ}({per_part_qty})]", per_part_qty, unit
+
+def _osp_area_rate(opx: Any, costs: Any = None) -> float:
+    """$/sq in for an outside-process entry priced by flat area, else 0.0."""
+    if not isinstance(opx, dict) or (_safe_num(opx.get("unit_cost_per_part")) or
+                                      _safe_num(opx.get("cost_per_part")) or
+                                      _safe_num(opx.get("price")) or
+                                      _safe_num(opx.get("unit_price"))):
+        return 0.0
+    per_sqin = _safe_num(opx.get("unit_cost_per_sqin"))
+    if per_sqin > 0:
+        return per_sqin
+    idx = costs or _cost_index()
+    rec = idx.outside_for(opx) if idx is not None else None
+    if rec is None or _safe_num(rec.unit_cost_per_part) > 0:
+        return 0.0
+    return max(_safe_num(rec.unit_cost_per_sqin), 0.0)
+
+def _osp_line(opx: Any, area: float, costs: Any = None) -> Optional[Tuple[str, float]]:
+    """(label, unit) for an outside-process entry, or None if it adds nothing.
+
+    Per-part costs on the entry win; then the entry's unit_cost_per_sqin × flat
+    area; then the OutsideProcess catalog row (per part, else per sq in × area).
+    """
+    if not isinstance(opx, dict):
+        return None
+    raw = (opx.get("label") or opx.get("name") or opx.get("process") or "Outside Process")
+    unit = (_safe_num(opx.get("unit_cost_per_part")) or
+            _safe_num(opx.get("cost_per_part")) or
+            _safe_num(opx.get("price")) or
+            _safe_num(opx.get("unit_price")))
+    if unit <= 0:
+        unit = _safe_num(opx.get("unit_cost_per_sqin")) * area
+    if unit <= 0:
+        idx = costs or _cost_index()
+        rec = idx.outside_for(opx) if idx is not None else None
+        if rec is None:
+            return None
+        unit = _safe_num(rec.unit_cost_per_part) or _safe_num(rec.unit_cost_per_sqin) * area
+    if unit <= 0:
+        return None
+    return f"OP-[{str(raw).strip()}]", unit
+
+def _collect_adders_per_part(quote: Dict[str, Any], costs: Any = None) -> Tuple[float, Dict[str, float]]:
+    """Collect material, hardware and outside process costs"""
+    mat = _material_line(quote, costs)
+    mat_sum = mat[1] if mat is not None else 0.0
+
     hw_sum = 0.0
     for hw in (quote.get("hardware") or []):
-        if not isinstance(hw, dict):
-            continue
-        qty = _safe_num(hw.get("qty_per_part") or hw.get("qty") or 1, as_int=True) or 1
-        unit = (_safe_num(hw.get("unit_cost"))
-                or _safe_num(hw.get("cost_per_part"))
-                or _safe_num(hw.get("price"))
-                or _safe_num(hw.get("unit_price")))
-        hw_sum += qty * unit
+        line = _hw_line(hw, costs)
+        if line is not None:
+            hw_sum += line[1] * line[2]
 
     op_sum = 0.0
+    area = _flat_area(quote)
     for opx in (quote.get("outside_processes") or []):
-        if not isinstance(opx, dict):
-            continue
-        unit = (_safe_num(opx.get("unit_cost_per_part"))
-                or _safe_num(opx.get("cost_per_part"))
-                or _safe_num(opx.get("price"))
-                or _safe_num(opx.get("unit_price")))
-        op_sum += unit
+        line = _osp_line(opx, area, costs)
+        if line is not None:
+            op_sum += line[1]
+
+    total = round(mat_sum + hw_sum + op_sum, 4)
+    return total, {"Material": round(mat_sum, 4), "Hardware": round(hw_sum, 4),
+                   "Outside Process": round(op_sum, 4)}
+
+def rates_at(as_of: Any, fallback: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+    """Rates dict in effect on `as_of` from the Rates history (bisect lookup).
+
+    Values missing from the history come from `fallback`.
+    """
+    from core.catalog import get_catalog  # local import keeps pricing usable standalone
+    rec = get_catalog().rates_at(as_of)
+    fallback = fallback or {}
+    return {
+        "setup": rec.setup if rec.setup is not None else fallback.get("setup", 0.0),
+        "labor": rec.labor if rec.labor is not None else fallback.get("labor", 0.0),
+        "machine": rec.machine if rec.machine is not None else fallback.get("machine", 0.0),
+    }
+
+def _line_items(ops: List[Dict[str, Any]],
+                quote: Dict[str, Any],
+                rates: Dict[str, float],
+                costs: Any = None) -> Tuple[float, float, List[tuple], List[tuple]]:
+    """Quantity-independent pricing inputs.
+
+    `costs` is a catalog cost index (core.cost_index); by default it is
+    fetched only if an item needs a catalog join.
+
+    Returns:
+        (total_setup_min, runtime_per_part, hw_items, op_items) where hw_items
+        are (label, per_part_qty, unit), led by the material row when the
+        quote's material is priced, and op_items are (label, unit)
+    """
+    # Aggregate setup and runtime
+    total_setup_min = sum((_safe_num(r.get("setup_min")) for r in ops), 0.0)
+    runtime_per_part = sum(((_safe_num(r.get("time_sec")) / 60.0) * (rates["labor"] + rates["machine"])) for r in ops)
+
+    # Material, hardware and outside process data; uncosted items join the catalog
+    mat = _material_line(quote, costs)
+    hw_items = [(mat[0], 1, mat[1])] if mat is not None else []
+    hw_items += [line for line in (_hw_line(hw, costs) for hw in (quote.get("hardware") or []))
+                if line is not None]
+    area = _flat_area(quote)
+    op_items = [line for line in (_osp_line(opx, area, costs) for opx in (quote.get("outside_processes") or []))
+                if line is not None]
 
-    total = round(hw_sum + op_sum, 4)
-    return total, {"Hardware": round(hw_sum, 4), "Outside Process": round(op_sum, 4)}
+    return total_setup_min, runtime_per_part, hw_items, op_items
 
 def compute_pricing_table(ops: List[Dict[str, Any]],
                          quote: Dict[str, Any],
                          rates: Dict[str, float],
                          quantities: List[int],
-                         markup_percent: float) -> Tuple[dict, dict]:
+                         markup_percent: float,
+                         as_of: Any = None) -> Tuple[dict, dict]:
     """
     Compute complete pricing table for quote breakdown
 
+    If `as_of` (a quote date) is given, rates come from the effective-dated
+    Rates history for that date, with `rates` as the fallback.
+
     Returns:
         (table_data, summary)
     """
-    quantities = [max(int(q or 1), 1) for q in (quantities or [1, 10, 25, 50])]
+    if as_of is not None:
+        rates = rates_at(as_of, fallback=rates)
 
-    # Aggregate setup and runtime
-    total_setup_min = sum((_safe_num(r.get("setup_min")) for r in ops), 0.0)
-    runtime_per_part = sum(((_safe_num(r.get("time_sec")) / 60.0) * (rates["labor"] + rates["machine"])) for r in ops)
-
-    # Hardware and outside process data
-    hw_items = []
-    for hw in (quote.get("hardware") or []):
-        if not isinstance(hw, dict):
-            continue
-        typ = (str(hw.get("type") or hw.get("part") or "HW")).strip() or "HW"
-        per_part_qty = _safe_num(hw.get("qty_per_part") or hw.get("qty") or 1, as_int=True) or 1
-        unit = (_safe_num(hw.get("unit_cost")) or
-                _safe_num(hw.get("cost_per_part")) or
-                _safe_num(hw.get("price")) or
-                _safe_num(hw.get("unit_price")))
-        if unit <= 0:
-            continue
-        hw_items.append((f"HW-[{typ}({per_part_qty})]", per_part_qty, unit))
-
-    op_items = []
-    for opx in (quote.get("outside_processes") or []):
-        if not isinstance(opx, dict):
-            continue
-        raw = (opx.get("label") or opx.get("name") or opx.get("process") or "Outside Process")
-        unit = (_safe_num(opx.get("unit_cost_per_part")) or
-                _safe_num(opx.get("cost_per_part")) or
-                _safe_num(opx.get("price")) or
-                _safe_num(opx.get("unit_price")))
-        if unit <= 0:
-            continue
-        op_items.append((f"OP-[{str(raw).strip()}]", unit))
+    quantities = [max(int(q or 1), 1) for q in (quantities or [1, 10, 25, 50])]
+    total_setup_min, runtime_per_part, hw_items, op_items = _line_items(ops, quote, rates)
 
     # Build table data
     table_data = {}
@@ -108,7 +243,7 @@ def compute_pricing_table(ops: List[Dict[str, Any]],
     # Runtime: per-part cost × qty
     table_data["Runtime"] = {qv: round(runtime_per_part * qv, 2) for qv in quantities}
 
-    # HW and OP rows
+    # Material, HW and OP rows
     for label, per_part_qty, unit in hw_items:
         table_data[label] = {qv: round(per_part_qty * unit * qv, 2) for qv in quantities}
 
@@ -0,0 +1,172 @@
+# logic/pricing_batch.py
+"""
+Batch pricing: many quotes in one call.
+
+Each job is (ops, quote, rates, quantities, markup_percent[, as_of]). The
+quantity-independent inputs of every job are extracted once. All price
+cells are then packed into flat columnar arrays (one entry per job ×
+quantity) and priced together with the vectorized engine. Adder rows are
+added rank by rank, so each job's subtotal is summed in the same order as
+compute_pricing_table, and results are identical to the single-quote path.
+
+Large batches can be sharded across a process pool (processes=N).
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from logic.pricing import _collect_adders_per_part, _line_items, rates_at
+from logic.pricing_vector import DEFAULT_QUANTITIES, round2
+
+Job = Tuple[Any, ...]  # (ops, quote, rates, quantities, markup_percent[, as_of])
+
+@dataclass
+class BatchResult:
+    """Columnar results. Cells of job i are offsets[i]:offsets[i + 1]."""
+    offsets: np.ndarray           # int64, len(jobs) + 1
+    quantities: np.ndarray        # int64 per cell
+    setup: np.ndarray
+    runtime: np.ndarray
+    subtotal: np.ndarray          # sum of rounded cells (unrounded)
+    markup: np.ndarray
+    total: np.ndarray
+    adder_labels: List[List[str]]         # per job, table order
+    adder_values: List[List[np.ndarray]]  # per job, rounded cells per adder row
+    markup_percent: List[float]
+    adders_breakdown: List[Dict[str, float]]
+    quantity_lists: List[List[int]]       # as passed in (after clamping), per job
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def totals(self, i: int) -> np.ndarray:
+        return self.total[self.offsets[i]:self.offsets[i + 1]]
+
+    def table(self, i: int) -> Tuple[dict, dict]:
+        """(table_data, summary) for job i, as compute_pricing_table returns it."""
+        a, b = int(self.offsets[i]), int(self.offsets[i + 1])
+        qs = self.quantity_lists[i]
+        cell_q = self.quantities[a:b].tolist()
+        table_data: Dict[str, Dict[int, float]] = {
+            "Setup": dict(zip(cell_q, self.setup[a:b].tolist())),
+            "Runtime": dict(zip(cell_q, self.runtime[a:b].tolist())),
+        }
+        for label, vals in zip(self.adder_labels[i], self.adder_values[i]):
+            table_data[label] = dict(zip(cell_q, vals.tolist()))
+        subtotal = dict(zip(cell_q, round2(self.subtotal[a:b]).tolist()))
+        markup = dict(zip(cell_q, self.markup[a:b].tolist()))
+        total = dict(zip(cell_q, self.total[a:b].tolist()))
+        pct = self.markup_percent[i]
+        table_data["Subtotal"] = subtotal
+        table_data[f"Markup ({pct:.0f}%)"] = markup
+        table_data["Total"] = total
+        summary = {
+            "quantities": qs,
+            "per_qty_ext_subtotal": dict(subtotal),
+            "markup_percent": round(pct, 2),
+            "per_qty_markup": dict(markup),
+            "per_qty_grand": dict(total),
+            "adders_breakdown": self.adders_breakdown[i],
+        }
+        return table_data, summary
+
+    def tables(self) -> List[Tuple[dict, dict]]:
+        return [self.table(i) for i in range(len(self))]
+
+def _unpack(job: Job) -> Tuple[Any, Any, Dict[str, float], Any, float]:
+    ops, quote, rates, quantities, markup_percent = job[:5]
+    as_of = job[5] if len(job) > 5 else None
+    if as_of is not None:
+        rates = rates_at(as_of, fallback=rates)
+    return ops or [], quote or {}, rates, quantities, float(markup_percent or 0.0)
+
+def price_batch_columnar(jobs: Sequence[Job]) -> BatchResult:
+    """Price every job in one vectorized pass."""
+    n = len(jobs)
+    quantity_lists: List[List[int]] = []
+    setup_ext = np.zeros(n)
+    runtime_pp = np.zeros(n)
+    mk = np.zeros(n)
+    markup_percent: List[float] = []
+    adder_labels: List[List[str]] = []
+    adder_factors: List[List[float]] = []
+    adders_breakdown: List[Dict[str, float]] = []
+    for j, job in enumerate(jobs):
+        ops, quote, rates, quantities, pct = _unpack(job)
+        quantity_lists.append([max(int(q or 1), 1) for q in (quantities or DEFAULT_QUANTITIES)])
+        total_setup_min, runtime_per_part, hw_items, op_items = _line_items(ops, quote, rates)
+        setup_ext[j] = round(total_setup_min * rates["setup"], 2)
+        runtime_pp[j] = runtime_per_part
+        mk[j] = pct / 100.0
+        markup_percent.append(pct)
+        # Same label twice: first position, last value (dict assignment semantics)
+        factors: Dict[str, float] = {}
+        for label, per_part_qty, unit in hw_items:
+            factors[label] = per_part_qty * unit
+        for label, unit in op_items:
+            factors[label] = unit
+        adder_labels.append(list(factors))
+        adder_factors.append(list(factors.values()))
+        adders_breakdown.append(_collect_adders_per_part(quote)[1])
+
+    # Table cells are keyed by quantity, so repeated breaks collapse into one cell
+    cell_qs = [list(dict.fromkeys(qs)) for qs in quantity_lists]
+    counts = np.array([len(c) for c in cell_qs], dtype=np.int64)
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    q = np.array([v for c in cell_qs for v in c], dtype=np.int64)
+    qf = q.astype(np.float64)
+    job_of = np.repeat(np.arange(n), counts)
+
+    setup = setup_ext[job_of]
+    runtime = round2(runtime_pp[job_of] * qf)
+    subtotal = setup + runtime  # 0.0 + setup is exact, so this matches the dict path
+
+    # Adder rows, one rank at a time across all jobs that have that many rows
+    adder_values: List[List[np.ndarray]] = [[] for _ in range(n)]
+    max_rank = max((len(f) for f in adder_factors), default=0)
+    for k in range(max_rank):
+        has = np.array([len(f) > k for f in adder_factors])
+        factor = np.array([f[k] if len(f) > k else 0.0 for f in adder_factors])
+        mask = has[job_of]
+        vals = round2(factor[job_of[mask]] * qf[mask])
+        subtotal[mask] = subtotal[mask] + vals
+        cell_pos = np.flatnonzero(mask)
+        starts = np.searchsorted(cell_pos, offsets[:-1])
+        for j in np.flatnonzero(has):
+            s = starts[j]
+            adder_values[j].append(vals[s:s + counts[j]])
+
+    markup = round2(subtotal * mk[job_of])
+    total = round2(subtotal + markup)
+    return BatchResult(offsets=offsets, quantities=q, setup=setup, runtime=runtime,
+                       subtotal=subtotal, markup=markup, total=total,
+                       adder_labels=adder_labels, adder_values=adder_values,
+                       markup_percent=markup_percent, adders_breakdown=adders_breakdown,
+                       quantity_lists=quantity_lists)
+
+def _price_shard(jobs: Sequence[Job]) -> List[Tuple[dict, dict]]:
+    return price_batch_columnar(jobs).tables()
+
+def price_batch(jobs: Sequence[Job],
+                processes: Optional[int] = None,
+                shard_size: int = 2000) -> List[Tuple[dict, dict]]:
+    """Price many quotes; returns compute_pricing_table results in job order.
+
+    With processes > 1, jobs are split into shards of `shard_size` and
+    priced in a spawned process pool. Jobs must be picklable in that case.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    if not processes or processes <= 1 or len(jobs) <= shard_size:
+        return _price_shard(jobs)
+    import multiprocessing as mp
+    from concurrent.futures import ProcessPoolExecutor
+    shards = [jobs[i:i + shard_size] for i in range(0, len(jobs), shard_size)]
+    out: List[Tuple[dict, dict]] = []
+    with ProcessPoolExecutor(max_workers=min(processes, len(shards)),
+                             mp_context=mp.get_context("spawn")) as pool:
+        for part in pool.map(_price_shard, shards):
+            out.extend(part)
+    return out
@@ -0,0 +1,179 @@
+# logic/pricing_breaks.py
+"""
+Quantity price-break solver.
+
+Per-part price is a closed-form function of quantity:
+
+    unit(q) = (1 + markup) * (setup / q + per_part)
+
+where setup is the one-time setup charge and per_part is runtime plus
+adders. The solver uses that form to jump straight to answers. It then
+confirms them on the exact rounded price curve (pricing_vector), falling
+back to vectorized bisection when cent rounding moves a crossing.
+"""
+from __future__ import annotations
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
+from logic.pricing import _line_items, rates_at
+from logic.pricing_vector import price_curve
+
+@dataclass(frozen=True)
+class CostModel:
+    """Closed-form cost curve of one quote."""
+    setup: float            # one-time setup charge ($)
+    per_part: float         # runtime + hardware + outside process ($/part)
+    markup_percent: float
+
+    @property
+    def factor(self) -> float:
+        return 1.0 + self.markup_percent / 100.0
+
+    @property
+    def asymptote(self) -> float:
+        """Unit price as quantity grows without bound."""
+        return self.factor * self.per_part
+
+    def unit_price(self, q: Any) -> np.ndarray:
+        q = np.maximum(np.asarray(q, dtype=np.float64), 1.0)
+        return self.factor * (self.setup / q + self.per_part)
+
+    def quantity_for(self, target: float) -> Optional[int]:
+        """Smallest q with unit_price(q) <= target, or None if unreachable."""
+        margin = target / self.factor - self.per_part
+        if self.setup <= 0:
+            return 1 if margin >= 0 else None
+        if margin <= 0:
+            return None
+        return max(1, math.ceil(self.setup / margin - 1e-9))
+
+@dataclass(frozen=True)
+class BreakLadder:
+    breaks: List[int]
+    unit_prices: List[float]    # exact rounded unit price at each break
+    max_overcharge: float       # worst u(break) / u(q) - 1 over the covered range
+
+def cost_model(ops: List[Dict[str, Any]], quote: Dict[str, Any], rates: Dict[str, float],
+               markup_percent: float, as_of: Any = None) -> CostModel:
+    if as_of is not None:
+        rates = rates_at(as_of, fallback=rates)
+    total_setup_min, runtime_per_part, hw_items, op_items = _line_items(ops, quote, rates)
+    adders = {label: ppq * unit for label, ppq, unit in hw_items}
+    adders.update({label: unit for label, unit in op_items})
+    return CostModel(setup=round(total_setup_min * rates["setup"], 2),
+                     per_part=runtime_per_part + sum(adders.values()),
+                     markup_percent=float(markup_percent or 0.0))
+
+class BreakSolver:
+    """Break quantities, target-price crossovers and N-break ladders for one quote."""
+
+    def __init__(self, ops: List[Dict[str, Any]], quote: Dict[str, Any], rates: Dict[str, float],
+                 markup_percent: float, as_of: Any = None, max_qty: int = 100_000):
+        if as_of is not None:
+            rates = rates_at(as_of, fallback=rates)
+        self.ops, self.quote, self.rates = ops, quote, rates
+        self.markup_percent = float(markup_percent or 0.0)
+        self.max_qty = int(max_qty)
+        self.model = cost_model(ops, quote, rates, self.markup_percent)
+
+    # ── Exact (rounded) curve
+    def unit_prices(self, quantities: Any) -> np.ndarray:
+        curve = price_curve(self.ops, self.quote, self.rates, quantities, self.markup_percent)
+        return curve.unit_price
+
+    def _first_at_or_below(self, target: float, lo: int, hi: int, probes: int = 64) -> Optional[int]:
+        """Vectorized bisection: evaluate `probes` points per round, keep the bracket."""
+        while hi - lo > probes:
+            qs = np.unique(np.linspace(lo, hi, probes).astype(np.int64))
+            ok = np.flatnonzero(self.unit_prices(qs) <= target)
+            if not len(ok):
+                return None
+            j = ok[0]
+            if j == 0:
+                return int(qs[0])
+            lo, hi = int(qs[j - 1]), int(qs[j])
+        qs = np.arange(lo, hi + 1, dtype=np.int64)
+        ok = np.flatnonzero(self.unit_prices(qs) <= target)
+        return int(qs[ok[0]]) if len(ok) else None
+
+    # ── Public API
+    def quantity_below(self, target: float, window: int = 32) -> Optional[int]:
+        """Smallest quantity (<= max_qty) whose unit price is at or below `target`."""
+        guess = self.model.quantity_for(target)
+        if guess is None or guess > self.max_qty + window:
+            return None
+        lo = max(1, guess - window)
+        hi = min(self.max_qty, guess + window)
+        qs = np.arange(lo, hi + 1, dtype=np.int64)
+        ok = np.flatnonzero(self.unit_prices(qs) <= target)
+        if len(ok) and (ok[0] > 0 or lo == 1):
+            return int(qs[ok[0]])
+        # Rounding moved the crossing outside the window
+        return self._first_at_or_below(target, 1, self.max_qty)
+
+    def crossovers(self, targets: Sequence[float]) -> Dict[float, Optional[int]]:
+        return {t: self.quantity_below(t) for t in targets}
+
+    def diminishing_returns(self, tolerance: float = 0.05) -> int:
+        """Quantity beyond which unit price is within `tolerance` of the asymptote."""
+        m = self.model
+        if m.per_part <= 0:
+            return self.max_qty
+        return min(self.max_qty, max(1, math.ceil(m.setup / (tolerance * m.per_part))))
+
+    def break_quantities(self, steps: int = 5, tolerance: float = 0.05) -> List[int]:
+        """Breaks where unit price has fallen evenly (geometrically) from qty 1
+        to the diminishing-returns quantity."""
+        top = self.diminishing_returns(tolerance)
+        if top <= 1 or steps <= 1:
+            return [1]
+        u0, u1 = (float(v) for v in self.model.unit_price([1, top]))
+        if u0 <= 0 or u1 <= 0:
+            return [1]      # nothing to discount (zero-cost quote)
+        targets = [u0 * (u1 / u0) ** (i / (steps - 1)) for i in range(1, steps)]
+        qs = [1] + [self.model.quantity_for(t) or top for t in targets]
+        return sorted(set(min(q, top) for q in qs))
+
+    def ladder(self, n: int, min_qty: int = 1, max_qty: Optional[int] = None,
+               iterations: int = 60) -> BreakLadder:
+        """Optimal n-break ladder over [min_qty, max_qty].
+
+        A buyer at quantity q pays the unit price of the largest break <= q.
+        The ladder minimizes the worst overcharge u(break)/u(q) - 1. It bisects
+        on the allowed overcharge and places breaks greedily from the closed form.
+        """
+        m = self.model
+        lo_q, hi_q = max(1, int(min_qty)), int(max_qty or self.max_qty)
+        if float(m.unit_price(hi_q)) <= 0:
+            # Zero-cost quote: one tier, nobody is overcharged
+            exact = self.unit_prices([lo_q])
+            return BreakLadder(breaks=[lo_q], unit_prices=[round(float(exact[0]), 4)], max_overcharge=0.0)
+
+        def greedy(eps: float) -> List[int]:
+            breaks = [lo_q]
+            while len(breaks) <= n:
+                u_b = float(m.unit_price(breaks[-1]))
+                nxt = m.quantity_for(u_b / (1.0 + eps))
+                if nxt is None or nxt > hi_q:
+                    return breaks
+                # Largest q still within eps of this break is nxt - 1; next break at nxt
+                breaks.append(max(nxt, breaks[-1] + 1))
+            return breaks
+
+        lo_eps, hi_eps = 0.0, float(m.unit_price(lo_q) / m.unit_price(hi_q)) - 1.0
+        best = greedy(hi_eps)
+        for _ in range(iterations):
+            mid = (lo_eps + hi_eps) / 2
+            b = greedy(mid)
+            if len(b) <= n:
+                hi_eps, best = mid, b
+            else:
+                lo_eps = mid
+        best = best[:n]
+        # Worst overcharge on each interval is at its right end (u decreasing)
+        ends = best[1:] + [hi_q + 1]
+        over = max(float(m.unit_price(b) / m.unit_price(e - 1)) - 1.0 for b, e in zip(best, ends))
+        exact = self.unit_prices(best)
+        return BreakLadder(breaks=best, unit_prices=[round(float(u), 4) for u in exact],
+                           max_overcharge=over)
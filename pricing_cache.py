@@ -0,0 +1,156 @@
+# logic/pricing_cache.py
+"""
+Memoized pricing results shared by the quote pages and exports.
+
+Results are keyed by a canonical hash of only the inputs that pricing
+reads: each op's setup/run time, the hardware and outside-process fields,
+the material and blank size, rates, quantities, markup and as_of date. The
+cache is a size-bounded LRU with hit/miss counters. It is cleared whenever
+the Rates, Hardware, OutsideProcess or Materials table is reloaded, because
+as_of pricing resolves rates from the first and material and uncosted items
+are joined against the others.
+
+Cached (table_data, summary) tuples are shared between callers and must
+be treated as read-only.
+"""
+from __future__ import annotations
+import hashlib, json, threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from logic.pricing import compute_pricing_table
+from logic.quote_utils import pricing_date
+
+HW_KEY_FIELDS = ("type", "part", "hardware_name", "name", "qty_per_part", "qty", "unit_cost", "cost_per_part", "price", "unit_price")
+OSP_KEY_FIELDS = ("label", "name", "process", "spec", "unit_cost_per_part", "cost_per_part", "price",
+                  "unit_price", "unit_cost_per_sqin")
+
+PricingResult = Tuple[dict, dict]
+
+def _pick(item: Any, fields: Tuple[str, ...]) -> Any:
+    if not isinstance(item, dict):
+        return None  # skipped by pricing, but keeps positions stable
+    return [item.get(f) for f in fields]
+
+def pricing_key(ops: List[Dict[str, Any]],
+                quote: Dict[str, Any],
+                rates: Dict[str, float],
+                quantities: Optional[List[int]],
+                markup_percent: float,
+                as_of: Any = None) -> str:
+    """Canonical content hash of everything compute_pricing_table reads."""
+    quote = quote or {}
+    payload = [
+        [[r.get("setup_min"), r.get("time_sec")] for r in (ops or [])],
+        [_pick(h, HW_KEY_FIELDS) for h in (quote.get("hardware") or [])],
+        [_pick(o, OSP_KEY_FIELDS) for o in (quote.get("outside_processes") or [])],
+        [quote.get("flat_size_width"), quote.get("flat_size_height"), quote.get("thickness_in"),
+         quote.get("material"), quote.get("material_utilization")],
+        [rates.get("setup"), rates.get("labor"), rates.get("machine")],
+        [max(int(q or 1), 1) for q in (quantities or [1, 10, 25, 50])],
+        float(markup_percent or 0.0),
+        as_of,
+    ]
+    raw = json.dumps(payload, separators=(",", ":"), default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+class PricingCache:
+    """Bounded LRU of pricing results keyed by pricing_key()."""
+
+    def __init__(self, max_entries: int = 512, watch_rates: bool = True):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, PricingResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        if watch_rates:
+            from core.catalog import get_catalog  # local import keeps pricing usable standalone
+            get_catalog().subscribe(self._on_catalog_change)
+
+    def _on_catalog_change(self, change) -> None:
+        if change.table in ("Rates", "Hardware", "OutsideProcess", "Materials"):
+            self.invalidate()
+
+    def get(self, key: str) -> Optional[PricingResult]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: str, result: PricingResult) -> PricingResult:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def pricing_table(self, ops: List[Dict[str, Any]],
+                      quote: Dict[str, Any],
+                      rates: Dict[str, float],
+                      quantities: Optional[List[int]],
+                      markup_percent: float,
+                      as_of: Any = None,
+                      compute: Optional[Callable[[], PricingResult]] = None) -> PricingResult:
+        """Memoized compute_pricing_table.
+
+        `compute` overrides how a miss is priced. Its entry is shared with
+        every other caller, so it must return exactly what
+        compute_pricing_table would (PricingModel does, to the cent).
+        """
+        key = pricing_key(ops, quote, rates, quantities, markup_percent, as_of)
+        result = self.get(key)
+        if result is None:
+            if compute is None:
+                result = compute_pricing_table(ops, quote, rates, quantities, markup_percent, as_of)
+            else:
+                result = compute()
+            self.put(key, result)
+        return result
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def reset_stats(self) -> None:
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+def state_pricing_args(state) -> Tuple[List[Dict[str, Any]], Dict[str, Any], Dict[str, float], List[int], float, Any]:
+    """(ops, quote, rates, quantities, markup, as_of) as the quote pages price them."""
+    rates = {
+        "setup": getattr(state, 'rates_setup_per_min', 60.0),
+        "labor": getattr(state, 'rates_labor_per_min', 1.0),
+        "machine": getattr(state, 'rates_machine_per_min', 1.5)
+    }
+    ops = list(getattr(state, 'operations', None) or [])
+    quote = dict(getattr(state, 'quote', None) or {})
+    return ops, quote, rates, [1, 10, 25, 50], getattr(state, 'pricing_markup_percent', 15.0), pricing_date(quote)
+
+# Global pricing cache instance
+_pricing_cache: Optional[PricingCache] = None
+
+def get_pricing_cache() -> PricingCache:
+    """Get the global pricing cache instance"""
+    global _pricing_cache
+    if _pricing_cache is None:
+        _pricing_cache = PricingCache()
+    return _pricing_cache
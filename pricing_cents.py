@@ -0,0 +1,136 @@
+# logic/pricing_cents.py
+"""
+Integer fixed-point pricing core.
+
+Inputs are converted once into integers:
+- times: setup in milli-minutes, run time in milliseconds;
+- rates: micro-dollars per hour (so CSV hourly rates stay exact);
+- adder prices: micro-dollars.
+
+Every table cell is then derived with integer arithmetic and a single
+round-half-up division down to cents. Subtotals are exact sums of cents,
+markup is applied in basis points, and nothing is rounded twice. Values
+are converted to dollars or display strings only at the edge, with
+to_table(), formatted_rows() and format_cents().
+
+Vectors are int64 when the largest intermediate product fits, and fall back
+to exact Python integers (object arrays) otherwise.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from logic.pricing import _collect_adders_per_part, _line_items, _safe_num, rates_at
+
+MICRO = 1_000_000          # micro-dollars per dollar
+MICRO_PER_CENT = 10_000
+MS_PER_HOUR = 3_600_000
+MMIN_PER_HOUR = 60_000     # milli-minutes per hour
+_INT64_SAFE = 2 ** 62
+
+def to_fixed(x: Any, scale: int) -> int:
+    """Round a decimal value onto an integer grid of 1/scale."""
+    return int(round(_safe_num(x) * scale))
+
+def div_round(num: Any, den: int) -> Any:
+    """Integer division rounding half away from zero (scalars or int arrays)."""
+    if isinstance(num, np.ndarray):
+        half = den // 2
+        return np.where(num >= 0, (num + half) // den, -((-num + half) // den))
+    q, r = divmod(abs(num), den)
+    q += 1 if 2 * r >= den else 0
+    return q if num >= 0 else -q
+
+def format_cents(cents: int) -> str:
+    """$1,234.56 style string from integer cents."""
+    cents = int(cents)
+    sign = "-" if cents < 0 else ""
+    d, c = divmod(abs(cents), 100)
+    return f"{sign}${d:,}.{c:02d}"
+
+def _scaled(factor: int, q: np.ndarray) -> np.ndarray:
+    """factor × q without int64 overflow (q may already be an object array)."""
+    if q.dtype != object and abs(factor) * int(np.abs(q).max(initial=1)) < _INT64_SAFE:
+        return factor * q
+    return np.array([factor * int(v) for v in q], dtype=object)
+
+@dataclass
+class CentsTable:
+    """Pricing table in integer cents. Row arrays are in table order."""
+    quantities: np.ndarray
+    rows: Dict[str, np.ndarray]
+    subtotal: np.ndarray
+    markup: np.ndarray
+    total: np.ndarray
+    markup_percent: float
+    adders_breakdown: Dict[str, float]
+
+    @property
+    def markup_label(self) -> str:
+        return f"Markup ({self.markup_percent:.0f}%)"
+
+    def all_rows(self) -> Dict[str, np.ndarray]:
+        out = dict(self.rows)
+        out["Subtotal"] = self.subtotal
+        out[self.markup_label] = self.markup
+        out["Total"] = self.total
+        return out
+
+    def to_table(self) -> Tuple[dict, dict]:
+        """(table_data, summary) in the compute_pricing_table format (dollars)."""
+        qs = [int(q) for q in self.quantities]
+        table_data = {label: {q: int(c) / 100 for q, c in zip(qs, vals)}
+                      for label, vals in self.all_rows().items()}
+        summary = {
+            "quantities": qs,
+            "per_qty_ext_subtotal": dict(table_data["Subtotal"]),
+            "markup_percent": round(self.markup_percent, 2),
+            "per_qty_markup": dict(table_data[self.markup_label]),
+            "per_qty_grand": dict(table_data["Total"]),
+            "adders_breakdown": self.adders_breakdown,
+        }
+        return table_data, summary
+
+    def formatted_rows(self) -> List[Dict[str, str]]:
+        """Display rows ({"Operation": label, "<qty>": "$x.xx"}) as the breakdown page shows them."""
+        qs = [str(int(q)) for q in self.quantities]
+        return [dict({"Operation": label}, **{q: format_cents(c) for q, c in zip(qs, vals)})
+                for label, vals in self.all_rows().items()]
+
+def price_cents(ops: List[Dict[str, Any]],
+                quote: Dict[str, Any],
+                rates: Dict[str, float],
+                quantities: Optional[List[int]] = None,
+                markup_percent: float = 0.0,
+                as_of: Any = None) -> CentsTable:
+    """Price a quote in integer cents at every quantity."""
+    if as_of is not None:
+        rates = rates_at(as_of, fallback=rates)
+    q = np.maximum(np.asarray(quantities if quantities is not None and len(quantities) else [1, 10, 25, 50])
+                   .astype(np.int64).reshape(-1), 1)
+    # Hourly rates in micro-dollars: per-minute CSV rates are hourly / 60
+    setup_rate = to_fixed(rates["setup"], 60 * MICRO)
+    run_rate = to_fixed(rates["labor"], 60 * MICRO) + to_fixed(rates["machine"], 60 * MICRO)
+    setup_mmin = sum(to_fixed(r.get("setup_min"), 1000) for r in ops)
+    run_ms = sum(to_fixed(r.get("time_sec"), 1000) for r in ops)
+    _, _, hw_items, op_items = _line_items(ops, quote, rates)
+
+    rows: Dict[str, np.ndarray] = {}
+    setup_cents = div_round(setup_mmin * setup_rate, MMIN_PER_HOUR * MICRO_PER_CENT)
+    rows["Setup"] = np.full(q.shape, setup_cents, dtype=np.int64)
+    rows["Runtime"] = div_round(_scaled(run_ms * run_rate, q), MS_PER_HOUR * MICRO_PER_CENT)
+    for label, per_part_qty, unit in hw_items:
+        rows[label] = div_round(_scaled(int(per_part_qty) * to_fixed(unit, MICRO), q), MICRO_PER_CENT)
+    for label, unit in op_items:
+        rows[label] = div_round(_scaled(to_fixed(unit, MICRO), q), MICRO_PER_CENT)
+
+    subtotal = np.zeros(q.shape, dtype=np.int64)
+    for vals in rows.values():
+        subtotal = subtotal + vals
+    markup_bp = to_fixed(markup_percent, 100)  # basis points
+    markup = div_round(_scaled(markup_bp, subtotal), 10_000)
+    total = subtotal + markup
+
+    _, adders_breakdown = _collect_adders_per_part(quote)
+    return CentsTable(quantities=q, rows=rows, subtotal=subtotal, markup=markup, total=total,
+                      markup_percent=markup_percent, adders_breakdown=adders_breakdown)
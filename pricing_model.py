@@ -0,0 +1,324 @@
+# logic/pricing_model.py
+"""
+Incremental pricing model for the quote breakdown.
+
+The model keeps each op's (setup_min, time_sec) and one per-part factor for
+the material and for each hardware and outside-process item.
+
+Changing one op row, the material, a hardware item, a rate or the markup
+re-derives only the affected rows for each quantity break. Subtotal, markup
+and total are then summed from the cached row cells in table order. The
+Setup and Runtime rows are re-summed over the op rows in op order, as
+_line_items sums them, so every cell is the same float compute_pricing_table
+rounds and the tables match to the cent.
+"""
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from logic.pricing import _flat_area, _hw_line, _material_line, _osp_line, _safe_num, rates_at
+
+def _hw_item(hw: Any) -> Optional[Tuple[str, float]]:
+    """(label, per-part cost) for a hardware entry, or None if it adds nothing."""
+    line = _hw_line(hw)
+    return (line[0], line[1] * line[2]) if line is not None else None
+
+def _osp_item(opx: Any, area: float = 0.0) -> Optional[Tuple[str, float]]:
+    """(label, per-part cost) for an outside-process entry, or None."""
+    return _osp_line(opx, area)
+
+class PricingModel:
+    """Pricing table that is updated by deltas instead of rebuilt.
+
+    table() returns (table_data, summary) in the compute_pricing_table
+    format. `changed` holds the row labels touched by the last update.
+    """
+
+    def __init__(self, ops: Optional[List[Dict[str, Any]]] = None,
+                 quote: Optional[Dict[str, Any]] = None,
+                 rates: Optional[Dict[str, float]] = None,
+                 quantities: Optional[List[int]] = None,
+                 markup_percent: float = 15.0,
+                 as_of: Any = None):
+        rates = dict(rates or {"setup": 0.0, "labor": 0.0, "machine": 0.0})
+        if as_of is not None:
+            rates = rates_at(as_of, fallback=rates)
+        self.rates = rates
+        self.markup_percent = float(markup_percent)
+        self.quantities = [max(int(q or 1), 1) for q in (quantities or [1, 10, 25, 50])]
+        # Per-row inputs
+        self._ops: List[Tuple[float, float]] = []              # (setup_min, time_sec) per op
+        self._mat: List[Optional[Tuple[str, float]]] = [None]  # single material row slot
+        self._hw: List[Optional[Tuple[str, float]]] = []
+        self._osp: List[Optional[Tuple[str, float]]] = []
+        self._area = 0.0                                       # flat area for per-sq-in processes
+        self._adder_order: List[str] = []                      # row labels, table order
+        self._adder_owner: Dict[str, Tuple[str, int]] = {}     # label -> item providing its value
+        # Derived cells
+        self._rows: Dict[str, Dict[int, float]] = {}
+        self.changed: Set[str] = set()
+        self.updates = 0
+        self.reset(ops or [], quote or {})
+
+    # ── Bulk (re)build
+    def reset(self, ops: List[Dict[str, Any]], quote: Dict[str, Any]) -> None:
+        self._ops = [self._op_key(r) for r in ops]
+        self._area = _flat_area(quote)
+        self._mat = [_material_line(quote)]
+        self._hw = [_hw_item(h) for h in (quote.get("hardware") or [])]
+        self._osp = [_osp_item(o, self._area) for o in (quote.get("outside_processes") or [])]
+        self._rebuild_adders()
+        self._rederive_all()
+
+    def _rebuild_adders(self) -> None:
+        order: List[str] = []
+        owner: Dict[str, Tuple[str, int]] = {}
+        for kind, items in (("mat", self._mat), ("hw", self._hw), ("osp", self._osp)):
+            for i, item in enumerate(items):
+                if item is None:
+                    continue
+                if item[0] not in owner:
+                    order.append(item[0])
+                owner[item[0]] = (kind, i)  # last item with a label wins, as in the dict path
+        self._adder_order, self._adder_owner = order, owner
+
+    def _rederive_all(self) -> None:
+        self._rows = {}
+        self._set_row("Setup", self._setup_cells())
+        self._set_row("Runtime", self._runtime_cells())
+        for label in self._adder_order:
+            self._set_row(label, self._adder_cells(label))
+        self.changed = set(self._rows) | {"Subtotal", "Markup", "Total"}
+
+    # ── Cell derivation
+    @staticmethod
+    def _op_key(row: Dict[str, Any]) -> Tuple[float, float]:
+        return _safe_num(row.get("setup_min")), _safe_num(row.get("time_sec"))
+
+    @property
+    def total_setup_min(self) -> float:
+        return sum((s for s, _ in self._ops), 0.0)
+
+    @property
+    def runtime_per_part(self) -> float:
+        rate = self.rates["labor"] + self.rates["machine"]
+        return sum(((t / 60.0) * rate) for _, t in self._ops)
+
+    def _adder_sum(self, kind: str) -> float:
+        """Per-part sum of one adder kind, accumulated as _collect_adders_per_part does."""
+        total = 0.0
+        for item in self._items(kind):
+            if item is not None:
+                total += item[1]
+        return total
+
+    @property
+    def adders_per_part(self) -> float:
+        return self._adder_sum("mat") + self._adder_sum("hw") + self._adder_sum("osp")
+
+    def _items(self, kind: str) -> List[Optional[Tuple[str, float]]]:
+        return {"mat": self._mat, "hw": self._hw, "osp": self._osp}[kind]
+
+    def _item(self, kind: str, i: int) -> Tuple[str, float]:
+        return self._items(kind)[i]
+
+    def _setup_cells(self) -> Dict[int, float]:
+        v = round(self.total_setup_min * self.rates["setup"], 2)
+        return {q: v for q in self.quantities}
+
+    def _runtime_cells(self) -> Dict[int, float]:
+        rpp = self.runtime_per_part
+        return {q: round(rpp * q, 2) for q in self.quantities}
+
+    def _adder_cells(self, label: str) -> Dict[int, float]:
+        factor = self._item(*self._adder_owner[label])[1]
+        return {q: round(factor * q, 2) for q in self.quantities}
+
+    def _set_row(self, label: str, cells: Optional[Dict[int, float]]) -> None:
+        """Swap one row's cells."""
+        if cells is None:
+            self._rows.pop(label, None)
+        else:
+            self._rows[label] = cells
+        self.changed.add(label)
+
+    def _begin(self) -> None:
+        self.changed = set()
+        self.updates += 1
+
+    def _end(self) -> None:
+        self.changed |= {"Subtotal", "Markup", "Total"}
+
+    # ── Operation deltas
+    def set_op(self, index: int, row: Dict[str, Any]) -> None:
+        self._begin()
+        new = self._op_key(row)
+        old = self._ops[index]
+        self._ops[index] = new
+        self._apply_op_delta(new[0] != old[0], new[1] != old[1])
+        self._end()
+
+    def add_op(self, row: Dict[str, Any], index: Optional[int] = None) -> None:
+        self._begin()
+        new = self._op_key(row)
+        self._ops.insert(len(self._ops) if index is None else index, new)
+        self._apply_op_delta(bool(new[0]), bool(new[1]))
+        self._end()
+
+    def remove_op(self, index: int) -> None:
+        self._begin()
+        old = self._ops.pop(index)
+        self._apply_op_delta(bool(old[0]), bool(old[1]))
+        self._end()
+
+    def _apply_op_delta(self, setup_moved: bool, time_moved: bool) -> None:
+        if setup_moved:
+            self._set_row("Setup", self._setup_cells())
+        if time_moved:
+            self._set_row("Runtime", self._runtime_cells())
+
+    # ── Material / hardware / outside-process deltas
+    def set_material(self, quote: Dict[str, Any]) -> None:
+        """Re-price the material row from the quote's material, thickness and flat size."""
+        self._set_adder("mat", 0, _material_line(quote))
+
+    def set_hardware(self, index: int, item: Dict[str, Any]) -> None:
+        self._set_adder("hw", index, _hw_item(item))
+
+    def add_hardware(self, item: Dict[str, Any]) -> None:
+        self._hw.append(None)
+        self._set_adder("hw", len(self._hw) - 1, _hw_item(item))
+
+    def set_outside_process(self, index: int, item: Dict[str, Any]) -> None:
+        self._set_adder("osp", index, _osp_item(item, self._area))
+
+    def add_outside_process(self, item: Dict[str, Any]) -> None:
+        self._osp.append(None)
+        self._set_adder("osp", len(self._osp) - 1, _osp_item(item, self._area))
+
+    def remove_hardware(self, index: int) -> None:
+        self._remove_adder("hw", index)
+
+    def remove_outside_process(self, index: int) -> None:
+        self._remove_adder("osp", index)
+
+    def _set_adder(self, kind: str, index: int, item: Optional[Tuple[str, float]]) -> None:
+        self._begin()
+        items = self._items(kind)
+        old = items[index]
+        items[index] = item
+        if old is not None and item is not None and old[0] == item[0] \
+                and self._adder_owner.get(item[0]) == (kind, index):
+            # Same row, new cost: one row to re-derive
+            self._set_row(item[0], self._adder_cells(item[0]))
+        else:
+            self._relabel({l for l in (old and old[0], item and item[0]) if l})
+        self._end()
+
+    def _remove_adder(self, kind: str, index: int) -> None:
+        self._begin()
+        items = self._items(kind)
+        old = items.pop(index)
+        # Later items shift down one slot; owners keep pointing at the same items
+        self._adder_owner = {l: (k, i - 1 if k == kind and i > index else i)
+                             for l, (k, i) in self._adder_owner.items() if (k, i) != (kind, index)}
+        self._relabel({old[0]} if old else set())
+        self._end()
+
+    def _relabel(self, labels: Set[str]) -> None:
+        """Re-derive the rows for `labels` after items were added/removed/renamed."""
+        before = {l: self._adder_owner.get(l) for l in labels}
+        self._rebuild_adders()
+        for l in labels:
+            owner = self._adder_owner.get(l)
+            if owner is None:
+                self._set_row(l, None)
+            elif owner != before[l] or l not in self._rows or \
+                    self._rows[l] != self._adder_cells(l):
+                self._set_row(l, self._adder_cells(l))
+        # Keep the table in the dict path's row order
+        fixed = {k: self._rows[k] for k in ("Setup", "Runtime") if k in self._rows}
+        fixed.update((l, self._rows[l]) for l in self._adder_order if l in self._rows)
+        self._rows = fixed
+
+    # ── Rates / markup / quantities
+    def set_rates(self, rates: Dict[str, float]) -> None:
+        self._begin()
+        old, self.rates = self.rates, dict(rates)
+        if self.rates.get("setup") != old.get("setup"):
+            self._set_row("Setup", self._setup_cells())
+        if (self.rates.get("labor"), self.rates.get("machine")) != (old.get("labor"), old.get("machine")):
+            self._set_row("Runtime", self._runtime_cells())
+        self._end()
+
+    def set_markup(self, markup_percent: float) -> None:
+        self._begin()
+        self.markup_percent = float(markup_percent)
+        self.changed = {"Markup", "Total"}
+
+    def set_quantities(self, quantities: Iterable[int]) -> None:
+        self._begin()
+        self.quantities = [max(int(q or 1), 1) for q in (quantities or [1, 10, 25, 50])]
+        self._rederive_all()
+
+    # ── Sync from page state
+    def sync(self, ops: List[Dict[str, Any]], quote: Dict[str, Any], rates: Dict[str, float],
+             quantities: Optional[List[int]] = None, markup_percent: Optional[float] = None) -> Set[str]:
+        """Apply whatever differs from the model's inputs; returns the changed rows.
+
+        Only rows whose inputs moved are re-derived. A changed op count or
+        reorder falls back to reset().
+        """
+        changed: Set[str] = set()
+        qs = [max(int(q or 1), 1) for q in (quantities or [1, 10, 25, 50])]
+        if qs != self.quantities:
+            self.set_quantities(qs); changed |= self.changed
+        if dict(rates) != self.rates:
+            self.set_rates(rates); changed |= self.changed
+        if markup_percent is not None and float(markup_percent) != self.markup_percent:
+            self.set_markup(markup_percent); changed |= self.changed
+        keys = [self._op_key(r) for r in ops]
+        hw = [_hw_item(h) for h in (quote.get("hardware") or [])]
+        self._area = _flat_area(quote)
+        osp = [_osp_item(o, self._area) for o in (quote.get("outside_processes") or [])]
+        if len(keys) != len(self._ops) or len(hw) != len(self._hw) or len(osp) != len(self._osp):
+            self._begin(); self.reset(ops, quote)
+            return changed | self.changed
+        for i, k in enumerate(keys):
+            if k != self._ops[i]:
+                self.set_op(i, ops[i]); changed |= self.changed
+        mat = _material_line(quote)
+        if mat != self._mat[0]:
+            self._set_adder("mat", 0, mat); changed |= self.changed
+        for i, item in enumerate(hw):
+            if item != self._hw[i]:
+                self._set_adder("hw", i, item); changed |= self.changed
+        for i, item in enumerate(osp):
+            if item != self._osp[i]:
+                self._set_adder("osp", i, item); changed |= self.changed
+        self.changed = changed
+        return changed
+
+    # ── Output
+    def table(self) -> Tuple[dict, dict]:
+        """(table_data, summary) in the compute_pricing_table format."""
+        pct = self.markup_percent
+        subtotal = {q: 0.0 for q in self.quantities}
+        for cells in self._rows.values():
+            for q in subtotal:
+                subtotal[q] += cells[q]
+        markup = {q: round(subtotal[q] * (pct / 100.0), 2) for q in self.quantities}
+        total = {q: round(subtotal[q] + markup[q], 2) for q in self.quantities}
+        table_data = {label: dict(cells) for label, cells in self._rows.items()}
+        table_data["Subtotal"] = {q: round(v, 2) for q, v in subtotal.items()}
+        table_data[f"Markup ({pct:.0f}%)"] = markup
+        table_data["Total"] = total
+        summary = {
+            "quantities": list(self.quantities),
+            "per_qty_ext_subtotal": {q: round(v, 2) for q, v in subtotal.items()},
+            "markup_percent": round(pct, 2),
+            "per_qty_markup": dict(markup),
+            "per_qty_grand": dict(total),
+            "adders_breakdown": {"Material": round(self._adder_sum("mat"), 4),
+                                 "Hardware": round(self._adder_sum("hw"), 4),
+                                 "Outside Process": round(self._adder_sum("osp"), 4)},
+        }
+        return table_data, summary
@@ -0,0 +1,149 @@
+# logic/pricing_montecarlo.py
+"""
+Monte Carlo cost uncertainty driven by extraction confidence.
+
+Extracted inputs are sampled around their extracted values. The spread
+shrinks as confidence grows: relative sigma = max_rel_sigma * (1 - confidence).
+Sampled inputs:
+- thickness: PDF confidence;
+- flat size and bend count: STEP/DXF confidence;
+- per-op runtime: a fixed estimating sigma.
+
+All samples are priced in one vectorized batch with the same cell
+rounding as compute_pricing_table. The result reports P10/P50/P90 totals
+per quantity, plus P10/P50/P90 part weight.
+
+Bend count drives the Form op's run time (time per bend × bends). Blank
+volume drives the material row, and flat area drives outside processes
+quoted per square inch (unit_cost_per_sqin on the entry or its
+OutsideProcess catalog row). Thickness and flat size drive weight.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+import numpy as np
+from logic.estimator import material_density
+from logic.pricing import (_flat_area, _line_items, _material_rate, _material_utilization,
+                           _osp_area_rate, _osp_line, _safe_num, rates_at)
+from logic.pricing_vector import as_quantities, round2
+
+PERCENTILES = (10, 50, 90)
+
+def field_confidence(confidence_scores: Dict[str, float]) -> Dict[str, float]:
+    """Per-field confidence from PriorityResolver.resolve()['confidence_scores']
+    (same source mapping the extraction summary uses)."""
+    cs = confidence_scores or {}
+    cad = max(cs.get('step', 0), cs.get('dxf', 0))
+    return {'thickness': cs.get('pdf', 0), 'flat_size': cad, 'bend_count': cad}
+
+def _sample(rng: np.random.Generator, value: float, rel_sigma: float, n: int) -> np.ndarray:
+    if rel_sigma <= 0 or not value:
+        return np.full(n, float(value or 0.0))
+    return np.clip(rng.normal(value, abs(value) * rel_sigma, n), 0.0, None)
+
+@dataclass
+class SimulationResult:
+    quantities: np.ndarray
+    totals: np.ndarray                        # (samples, qty)
+    weights_lb: Optional[np.ndarray]          # (samples,) or None without material/size
+    confidence: Dict[str, float]
+
+    @property
+    def samples(self) -> int:
+        return self.totals.shape[0]
+
+    def percentiles(self, ps=PERCENTILES) -> Dict[int, Dict[int, float]]:
+        """{qty: {10: p10, 50: p50, 90: p90}} of total price."""
+        pv = np.percentile(self.totals, ps, axis=0)
+        return {int(q): {p: round(float(pv[i, j]), 2) for i, p in enumerate(ps)}
+                for j, q in enumerate(self.quantities)}
+
+    def weight_percentiles(self, ps=PERCENTILES) -> Optional[Dict[int, float]]:
+        if self.weights_lb is None:
+            return None
+        return {p: round(float(v), 4) for p, v in zip(ps, np.percentile(self.weights_lb, ps))}
+
+    def summary(self) -> Dict[str, Any]:
+        return {"samples": self.samples, "confidence": self.confidence,
+                "totals": self.percentiles(), "weight_lb": self.weight_percentiles()}
+
+def simulate(ops: List[Dict[str, Any]],
+             quote: Dict[str, Any],
+             rates: Dict[str, float],
+             quantities: Any = None,
+             markup_percent: float = 15.0,
+             confidence_scores: Optional[Dict[str, float]] = None,
+             samples: int = 10_000,
+             max_rel_sigma: float = 0.25,
+             runtime_rel_sigma: float = 0.10,
+             seed: Optional[int] = None,
+             as_of: Any = None) -> SimulationResult:
+    """Sample uncertain inputs and price every sample in one pass.
+
+    `quote` supplies thickness_in, flat_size_width/height, bend_count and
+    material (the extracted values); `confidence_scores` is the resolver's
+    per-source dict (pdf/step/dxf).
+    """
+    if as_of is not None:
+        rates = rates_at(as_of, fallback=rates)
+    rng = np.random.default_rng(seed)
+    n = max(int(samples), 1)
+    # No extraction (manual entry): treat geometry as exact
+    conf = field_confidence(confidence_scores) if confidence_scores else \
+        {'thickness': 1.0, 'flat_size': 1.0, 'bend_count': 1.0}
+    sig = {k: max_rel_sigma * (1.0 - min(max(float(v), 0.0), 1.0)) for k, v in conf.items()}
+    q = as_quantities(quantities).astype(np.float64)
+
+    # Geometry samples
+    thickness = _sample(rng, _safe_num(quote.get('thickness_in')), sig['thickness'], n)
+    width = _sample(rng, _safe_num(quote.get('flat_size_width')), sig['flat_size'], n)
+    height = _sample(rng, _safe_num(quote.get('flat_size_height')), sig['flat_size'], n)
+    bends0 = int(_safe_num(quote.get('bend_count'), as_int=True))
+    bends = np.rint(_sample(rng, bends0, sig['bend_count'], n))
+
+    # Runtime per part: Form time scales with sampled bends, all ops with estimating noise.
+    # Summed per op in op order, as _line_items does, so unsampled inputs price identically.
+    form = next((r for r in ops if str(r.get("operation", "")).strip().lower() == "form"), None)
+    run_rate = rates["labor"] + rates["machine"]
+    rpp = np.zeros(n)                                                         # (n,)
+    for r in ops:
+        sec = _safe_num(r.get("time_sec"))
+        if r is form and bends0:
+            sec = np.where(bends == bends0, sec, (sec / bends0) * bends)
+        rpp = rpp + (sec / 60.0) * run_rate
+    if runtime_rel_sigma > 0:
+        rpp = rpp * np.clip(rng.normal(1.0, runtime_rel_sigma, n), 0.0, None)
+
+    total_setup_min, _, hw_items, _ = _line_items(ops, quote, rates)
+    subtotal = round(total_setup_min * rates["setup"], 2) + round2(rpp[:, None] * q)  # (n, Q)
+
+    # Adder rows in compute_pricing_table order; a repeated label keeps its
+    # first position and its last value
+    adders: Dict[str, Any] = {}
+    area = width * height
+    rate = _material_rate(quote)
+    for label, ppq, unit in hw_items:
+        if rate is not None and label == rate[0]:
+            # Material cost scales with the sampled blank volume (same order as _material_line)
+            adders[label] = rate[1] * (thickness * area) * rate[2] / _material_utilization(quote)
+        else:
+            adders[label] = ppq * unit
+    # Area-priced processes (entry or catalog per-sq-in rate) follow the sampled flat size
+    area0 = _flat_area(quote)
+    for opx in (quote.get("outside_processes") or []):
+        line = _osp_line(opx, area0)
+        if line is None:
+            continue
+        per_sqin = _osp_area_rate(opx)
+        adders[line[0]] = per_sqin * area if per_sqin > 0 else line[1]          # (n,) or scalar
+    for factor in adders.values():
+        f = np.asarray(factor, dtype=np.float64)
+        subtotal = subtotal + round2((f[:, None] if f.ndim else f) * q)
+
+    markup = round2(subtotal * (markup_percent / 100.0))
+    totals = round2(subtotal + markup)
+
+    dens = material_density(str(quote.get('material') or ''))
+    weights = dens * thickness * width * height if dens and area.any() and thickness.any() else None
+    return SimulationResult(quantities=q.astype(np.int64), totals=totals, weights_lb=weights,
+                            confidence=conf)
@@ -0,0 +1,119 @@
+# logic/pricing_sweep.py
+"""
+Vectorized what-if sweeps over rates and markup.
+
+The sweep evaluates a full grid of setup × labor × machine × markup scenarios
+in one broadcast pass. The result is a tensor of totals with shape
+(setup, labor, machine, markup, quantity). Each scenario is computed the
+same way as compute_pricing_table: cells are rounded to cents and summed in
+table order. The base scenario (all deltas 0) therefore reproduces the
+quote's Total row exactly.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
+from logic.pricing import _line_items, _safe_num, rates_at
+from logic.pricing_vector import as_quantities, round2
+
+AXES = ("setup", "labor", "machine", "markup")
+
+def pct_steps(spread: float = 10.0, steps: int = 5) -> np.ndarray:
+    """Evenly spaced percent deltas from -spread to +spread (always includes 0)."""
+    if steps <= 1 or not spread:
+        return np.zeros(1)
+    return np.unique(np.append(np.linspace(-spread, spread, steps), 0.0))
+
+@dataclass
+class SweepResult:
+    axes: Dict[str, np.ndarray]      # percent deltas per axis
+    values: Dict[str, np.ndarray]    # absolute rate / markup value per axis step
+    quantities: np.ndarray
+    totals: np.ndarray               # (setup, labor, machine, markup, qty)
+
+    @property
+    def scenarios(self) -> int:
+        return int(np.prod(self.totals.shape[:-1]))
+
+    @property
+    def base_index(self) -> tuple:
+        return tuple(int(np.flatnonzero(self.axes[a] == 0.0)[0]) for a in AXES)
+
+    @property
+    def base(self) -> np.ndarray:
+        """Totals per quantity with every delta at 0."""
+        return self.totals[self.base_index]
+
+    def delta(self) -> np.ndarray:
+        """Change in total vs the base scenario, same shape as totals."""
+        return self.totals - self.base
+
+    def tornado(self) -> List[Dict[str, Any]]:
+        """One-axis-at-a-time low/high totals per quantity (others held at base)."""
+        base_idx = self.base_index
+        rows = []
+        for k, axis in enumerate(AXES):
+            idx = list(base_idx)
+            idx[k] = slice(None)
+            line = self.totals[tuple(idx)]  # (steps, qty)
+            lo, hi = int(np.argmin(self.axes[axis])), int(np.argmax(self.axes[axis]))
+            rows.append({"axis": axis, "low_pct": float(self.axes[axis][lo]),
+                         "high_pct": float(self.axes[axis][hi]),
+                         "low": line[lo], "high": line[hi], "base": self.base})
+        return rows
+
+def sweep(ops: List[Dict[str, Any]],
+          quote: Dict[str, Any],
+          rates: Dict[str, float],
+          quantities: Any = None,
+          markup_percent: float = 15.0,
+          setup: Optional[Sequence[float]] = None,
+          labor: Optional[Sequence[float]] = None,
+          machine: Optional[Sequence[float]] = None,
+          markup: Optional[Sequence[float]] = None,
+          as_of: Any = None) -> SweepResult:
+    """Totals for every combination of percent deltas on each axis.
+
+    Axis arguments are percent changes (e.g. [-10, 0, 10]); omitted axes are
+    held at the base value. Markup deltas are relative (+10 on 20% -> 22%).
+    """
+    if as_of is not None:
+        rates = rates_at(as_of, fallback=rates)
+    axes = {a: np.unique(np.append(np.asarray(v if v is not None else [0.0], dtype=np.float64), 0.0))
+            for a, v in zip(AXES, (setup, labor, machine, markup))}
+    values = {
+        "setup": rates["setup"] * (1.0 + axes["setup"] / 100.0),
+        "labor": rates["labor"] * (1.0 + axes["labor"] / 100.0),
+        "machine": rates["machine"] * (1.0 + axes["machine"] / 100.0),
+        "markup": markup_percent * (1.0 + axes["markup"] / 100.0),
+    }
+    # Keep the base step bit-identical to the unswept inputs
+    for a, base in zip(AXES, (rates["setup"], rates["labor"], rates["machine"], markup_percent)):
+        values[a][axes[a] == 0.0] = base
+
+    q = as_quantities(quantities).astype(np.float64)
+    total_setup_min, _, hw_items, op_items = _line_items(ops, quote, rates)
+
+    # Setup row: (S,)
+    setup_row = round2(total_setup_min * values["setup"])
+    # Runtime per part, summed over ops in order like the dict path: (L, M)
+    lm = values["labor"][:, None] + values["machine"][None, :]
+    rpp = np.zeros(lm.shape)
+    for r in ops:
+        rpp = rpp + (_safe_num(r.get("time_sec")) / 60.0) * lm
+    runtime = round2(rpp[..., None] * q)                       # (L, M, Q)
+    # Adder rows don't depend on rates; keep dict semantics for repeated labels
+    adders: Dict[str, float] = {}
+    for label, ppq, unit in hw_items:
+        adders[label] = ppq * unit
+    for label, unit in op_items:
+        adders[label] = unit
+
+    subtotal = setup_row[:, None, None, None] + runtime[None, :, :, :]   # (S, L, M, Q)
+    for factor in adders.values():
+        subtotal = subtotal + round2(factor * q)
+    pct = values["markup"][None, None, None, :, None] / 100.0
+    sub = subtotal[:, :, :, None, :]                                     # (S, L, M, 1, Q)
+    mk = round2(sub * pct)
+    totals = round2(sub + mk)
+    return SweepResult(axes=axes, values=values, quantities=q.astype(np.int64), totals=totals)
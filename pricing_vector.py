@@ -0,0 +1,129 @@
+# logic/pricing_vector.py
+"""
+Vectorized pricing over arbitrary quantity arrays.
+
+Every table row (setup, runtime, hardware, outside process, subtotal,
+markup, total) is computed as a NumPy array in one pass, so a full price
+curve (e.g. qty 1..10,000) costs about the same as a handful of breaks.
+Arithmetic follows compute_pricing_table operation for operation, and
+rounding is done with round2(), which matches Python's round(x, 2) exactly.
+As a result, to_table() returns the same (table_data, summary) as the dict
+path for the same breaks.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from logic.pricing import _collect_adders_per_part, _line_items, rates_at
+
+DEFAULT_QUANTITIES = [1, 10, 25, 50]
+
+def round2(a: np.ndarray) -> np.ndarray:
+    """Round to cents exactly like Python's round(x, 2), elementwise.
+
+    np.round scales by 100 first, which can move values that sit next to a
+    half-cent boundary. Those few cells are re-rounded with Python's
+    correctly-rounded round(); all others already agree.
+    """
+    a = np.asarray(a, dtype=np.float64)
+    scaled = a * 100.0
+    out = np.rint(scaled) / 100.0
+    frac = np.abs(scaled - np.trunc(scaled))
+    near = np.abs(frac - 0.5) <= 1e-9 * np.maximum(np.abs(scaled), 1.0)
+    if near.any():
+        idx = np.flatnonzero(near)
+        flat_in, flat_out = a.reshape(-1), out.reshape(-1)
+        flat_out[idx] = [round(float(v), 2) for v in flat_in[idx]]
+    return out
+
+def as_quantities(quantities: Any) -> np.ndarray:
+    """int64 quantity vector, clamped to >= 1 like the dict path."""
+    if quantities is None or (not isinstance(quantities, np.ndarray) and not quantities):
+        quantities = DEFAULT_QUANTITIES
+    q = np.asarray(quantities)
+    if q.dtype == object:
+        q = np.array([int(v or 1) for v in q.reshape(-1)], dtype=np.int64)
+    return np.maximum(q.astype(np.int64).reshape(-1), 1)
+
+@dataclass
+class PriceCurve:
+    """Priced quantity vector. Row arrays are rounded cells, in table order."""
+    quantities: np.ndarray
+    rows: Dict[str, np.ndarray]
+    subtotal: np.ndarray      # sum of rounded cells (unrounded, as in the dict path)
+    markup: np.ndarray
+    total: np.ndarray
+    markup_percent: float
+    adders_breakdown: Dict[str, float]
+
+    @property
+    def markup_label(self) -> str:
+        return f"Markup ({self.markup_percent:.0f}%)"
+
+    @property
+    def unit_price(self) -> np.ndarray:
+        """Total per piece at each quantity."""
+        return self.total / self.quantities
+
+    def to_table(self) -> Tuple[dict, dict]:
+        """(table_data, summary) in the compute_pricing_table format."""
+        qs = self.quantities.tolist()
+        table_data: Dict[str, Dict[int, float]] = {}
+        for label, vals in self.rows.items():
+            table_data[label] = dict(zip(qs, vals.tolist()))
+        subtotal = dict(zip(qs, round2(self.subtotal).tolist()))
+        markup = dict(zip(qs, self.markup.tolist()))
+        total = dict(zip(qs, self.total.tolist()))
+        table_data["Subtotal"] = subtotal
+        table_data[self.markup_label] = markup
+        table_data["Total"] = total
+        summary = {
+            "quantities": qs,
+            "per_qty_ext_subtotal": dict(subtotal),
+            "markup_percent": round(self.markup_percent, 2),
+            "per_qty_markup": dict(markup),
+            "per_qty_grand": dict(total),
+            "adders_breakdown": self.adders_breakdown,
+        }
+        return table_data, summary
+
+def price_curve(ops: List[Dict[str, Any]],
+                quote: Dict[str, Any],
+                rates: Dict[str, float],
+                quantities: Any = None,
+                markup_percent: float = 0.0,
+                as_of: Any = None) -> PriceCurve:
+    """Price `quote` at every quantity in `quantities` (list or NumPy array)."""
+    if as_of is not None:
+        rates = rates_at(as_of, fallback=rates)
+    q = as_quantities(quantities)
+    qf = q.astype(np.float64)
+    total_setup_min, runtime_per_part, hw_items, op_items = _line_items(ops, quote, rates)
+
+    rows: Dict[str, np.ndarray] = {}
+    rows["Setup"] = np.full(q.shape, round(total_setup_min * rates["setup"], 2))
+    rows["Runtime"] = round2(runtime_per_part * qf)
+    for label, per_part_qty, unit in hw_items:
+        rows[label] = round2((per_part_qty * unit) * qf)
+    for label, unit in op_items:
+        rows[label] = round2(unit * qf)
+
+    # Accumulate row by row in table order so float sums match the dict path
+    subtotal = np.zeros(q.shape)
+    for vals in rows.values():
+        subtotal = subtotal + vals
+    markup = round2(subtotal * (markup_percent / 100.0))
+    total = round2(subtotal + markup)
+
+    _, adders_breakdown = _collect_adders_per_part(quote)
+    return PriceCurve(quantities=q, rows=rows, subtotal=subtotal, markup=markup, total=total,
+                      markup_percent=markup_percent, adders_breakdown=adders_breakdown)
+
+def compute_pricing_table_vec(ops: List[Dict[str, Any]],
+                              quote: Dict[str, Any],
+                              rates: Dict[str, float],
+                              quantities: Optional[Sequence[int]],
+                              markup_percent: float,
+                              as_of: Any = None) -> Tuple[dict, dict]:
+    """Drop-in for compute_pricing_table backed by the vectorized engine."""
+    return price_curve(ops, quote, rates, quantities, markup_percent, as_of).to_table()
@@ -1,5 +1,29 @@
-from taipy.gui import notify, navigate
-from logic.pricing import compute_pricing_table
+import threading
+from collections import OrderedDict
+from taipy.gui import notify, navigate, get_state_id
+from logic.pricing import rates_at
+from logic.pricing_model import PricingModel
+from logic.pricing_cache import get_pricing_cache, state_pricing_args
+from logic.pricing_sweep import pct_steps, sweep
+from logic.material_alternatives import explore_materials
+from core.catalog import get_catalog
+
+# Incremental pricing model per client session; the least recently used are evicted
+MAX_PRICING_MODELS = 64
+_pricing_models: "OrderedDict[str, PricingModel]" = OrderedDict()
+_pricing_models_lock = threading.Lock()
+
+def _pricing_model(state) -> PricingModel:
+    key = get_state_id(state)
+    with _pricing_models_lock:
+        model = _pricing_models.get(key)
+        if model is None:
+            model = _pricing_models[key] = PricingModel()
+            while len(_pricing_models) > MAX_PRICING_MODELS:
+                _pricing_models.popitem(last=False)
+        else:
+            _pricing_models.move_to_end(key)
+    return model
 
 def quote_breakdown_page(state):
     """Quote Breakdown page with pricing table"""
@@ -14,6 +38,19 @@ def quote_breakdown_page(state):
 <|Adjust Rates|button|on_action=on_adjust_rates|>
 <|Back to Part & Ops|button|on_action=on_back_to_part_ops|>
 <|View Summary|button|on_action=on_view_summary|class_name=primary|>
+
+## 🎚️ Sensitivity
+
+<|{sensitivity_spread}|number|label=± Percent|min=1|max=100|step=1|>
+<|Run What-If|button|on_action=on_run_sensitivity|>
+
+<|{sensitivity_table}|table|show_all=True|width=100%|>
+
+## 🧪 Material Alternatives
+
+<|Compare Materials|button|on_action=on_explore_materials|>
+
+<|{material_alternatives_table}|table|show_all=True|width=100%|>
 |>
 
 <style>
@@ -31,20 +68,30 @@ def quote_breakdown_page(state):
 </style>
 """
 
+    if not hasattr(state, 'sensitivity_spread'):
+        state.sensitivity_spread = 10.0
+    if not hasattr(state, 'sensitivity_table'):
+        state.sensitivity_table = []
+    if not hasattr(state, 'material_alternatives_table'):
+        state.material_alternatives_table = []
+
     # Generate pricing table if we have operations
     if hasattr(state, 'operations') and state.operations:
         try:
-            rates = {
-                "setup": getattr(state, 'rates_setup_per_min', 60.0),
-                "labor": getattr(state, 'rates_labor_per_min', 1.0),
-                "machine": getattr(state, 'rates_machine_per_min', 1.5)
-            }
-            quantities = [1, 10, 25, 50]
-            markup = getattr(state, 'pricing_markup_percent', 15.0)
-
-            table_data, summary = compute_pricing_table(
-                state.operations, state.quote, rates, quantities, markup
-            )
+            ops, quote, rates, quantities, markup, as_of = state_pricing_args(state)
+
+            def _reprice():
+                # Only rows whose inputs changed since the last render are re-derived
+                model = _pricing_model(state)
+                model.sync(ops, quote, rates_at(as_of, fallback=rates) if as_of is not None else rates,
+                           quantities, markup)
+                return model.table()
+
+            # Pin one reference-data snapshot for the whole pricing pass
+            with get_catalog().pinned():
+                table_data, summary = get_pricing_cache().pricing_table(
+                    ops, quote, rates, quantities, markup, as_of, compute=_reprice
+                )
 
             # Format table data for display
             formatted_table = []
@@ -92,6 +139,54 @@ def quote_breakdown_page(state):
 
     return page_md
 
+SENSITIVITY_LABELS = {"setup": "Setup rate", "labor": "Labor rate", "machine": "Machine rate", "markup": "Markup"}
+
+def on_run_sensitivity(state):
+    """Evaluate a ±x% grid over setup/labor/machine rates and markup in one pass"""
+    if not getattr(state, 'operations', None):
+        notify(state, "warning", "Add operations before running a what-if")
+        return
+    try:
+        ops, quote, rates, quantities, markup, as_of = state_pricing_args(state)
+        steps = pct_steps(float(state.sensitivity_spread or 10.0), 5)
+        with get_catalog().pinned():
+            result = sweep(ops, quote, rates, quantities, markup,
+                           setup=steps, labor=steps, machine=steps, markup=steps, as_of=as_of)
+
+        rows = [{"Scenario": "Base", **{str(q): f"${v:.2f}" for q, v in zip(quantities, result.base)}}]
+        for t in result.tornado():
+            for side in ("low", "high"):
+                label = f"{SENSITIVITY_LABELS[t['axis']]} {t[side + '_pct']:+.0f}%"
+                rows.append({"Scenario": label, **{
+                    str(q): f"${v:.2f} ({v - b:+.2f})" for q, v, b in zip(quantities, t[side], t["base"])}})
+        state.sensitivity_table = rows
+        notify(state, "info", f"Evaluated {result.scenarios:,} scenarios")
+    except Exception as e:
+        notify(state, "error", f"What-if failed: {str(e)}")
+
+def on_explore_materials(state):
+    """Price every catalog material × standard thickness at the current flat size"""
+    if not getattr(state, 'operations', None):
+        notify(state, "warning", "Add operations before comparing materials")
+        return
+    try:
+        ops, quote, rates, quantities, markup, as_of = state_pricing_args(state)
+        with get_catalog().pinned():
+            result = explore_materials(ops, quote, rates, quantities, markup, as_of=as_of)
+        if not result.combinations or not result.weight_lb.any():
+            notify(state, "warning", "Set the flat size before comparing materials")
+            return
+        rows = []
+        for alt in result.ranked()[:15]:
+            rows.append({"Material": alt["material"], "Thickness": f'{alt["thickness_in"]:.4f}"',
+                         "Weight (lb)": f'{alt["weight_lb"]:.3f}',
+                         "Material/Part": f'${alt["material_cost"]:.2f}',
+                         **{str(q): f"${v:.2f}" for q, v in alt["totals"].items()}})
+        state.material_alternatives_table = rows
+        notify(state, "info", f"Priced {result.combinations:,} material/thickness combinations")
+    except Exception as e:
+        notify(state, "error", f"Material comparison failed: {str(e)}")
+
 def on_adjust_rates(state):
     """Navigate to settings to adjust rates"""
     notify(state, "info", "Rate adjustment - navigating to settings")
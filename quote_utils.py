@@ -20,6 +20,31 @@ def validate_quote_number(qnum: str) -> bool:
     """Validate quote number format"""
     return bool(QNUM_RE.match(qnum.strip()))
 
+def quote_date(quote: Dict[str, Any]) -> Optional[dt.date]:
+    """Date a quote was priced: 'quote_date' if set, else from SQ-YYYYMMDD-NNN"""
+    raw = quote.get("quote_date")
+    if raw:
+        try:
+            return dt.date.fromisoformat(str(raw)[:10])
+        except ValueError:
+            pass
+    m = re.match(r"^SQ-(\d{8})-", str(quote.get("quote_number") or "").strip())
+    if m:
+        try:
+            return dt.datetime.strptime(m.group(1), "%Y%m%d").date()
+        except ValueError:
+            return None
+    return None
+
+def pricing_date(quote: Dict[str, Any]) -> Optional[dt.date]:
+    """as_of date for pricing: the quote's date if it is in the past, else None.
+
+    Today's quotes price at the session's rates; a reopened older quote
+    prices at the Rates history in effect on its date.
+    """
+    d = quote_date(quote)
+    return d if d is not None and d < dt.date.today() else None
+
 def normalize_quote_metadata(quote: Dict[str, Any]) -> None:
     """Normalize quote metadata fields"""
     quote.setdefault("quote_number", auto_quote_number())
@@ -0,0 +1,212 @@
+# core/reference_store.py
+"""
+Optional SQLite backend for the reference tables (via SQLAlchemy).
+
+Each table keeps the CSV's own columns (as TEXT, in header order) plus a
+row_id primary key, with an index on the resolved name column. A small
+meta table records the header order and a per-table version that the
+catalog uses instead of a file signature, so several workers can share
+one consistent store.
+
+Enable with SHOPQUOTE_REFERENCE_DB=<path.db> or ReferenceCatalog.use_store().
+"""
+from __future__ import annotations
+import csv, json, os, threading
+from typing import Any, Dict, List, Optional, Tuple
+from core.catalog import TABLE_FILES, build_table
+from core.io_files import candidate_paths_first
+
+try:
+    from sqlalchemy import (Column, Integer, MetaData, String, Table, Text, create_engine,
+                            delete, event, func, insert, select, update)
+    SQLALCHEMY_AVAILABLE = True
+except ImportError:  # optional dependency
+    SQLALCHEMY_AVAILABLE = False
+
+META_TABLE = "reference_meta"
+
+def _sql_name(table: str) -> str:
+    return f"ref_{table.lower()}"
+
+class ReferenceStore:
+    """SQLite-backed store for Materials, Operations, Hardware, OutsideProcess and Rates."""
+
+    def __init__(self, db_path: str):
+        if not SQLALCHEMY_AVAILABLE:
+            raise ImportError("sqlalchemy is required for the SQLite reference store")
+        self.db_path = os.path.abspath(db_path)
+        self.location = f"sqlite:///{self.db_path}"
+        self.engine = create_engine(self.location, future=True)
+
+        @event.listens_for(self.engine, "connect")
+        def _pragmas(dbapi_conn, _):
+            cur = dbapi_conn.cursor()
+            cur.execute("PRAGMA journal_mode=WAL")  # readers don't block the writer
+            cur.execute("PRAGMA synchronous=NORMAL")
+            cur.close()
+
+        self.metadata = MetaData()
+        self.meta = Table(META_TABLE, self.metadata,
+                          Column("name", String(64), primary_key=True),
+                          Column("fieldnames", Text, nullable=False),
+                          Column("version", Integer, nullable=False, default=0))
+        self.metadata.create_all(self.engine, tables=[self.meta])
+        self._tables: Dict[str, Table] = {}
+        self._lock = threading.Lock()
+
+    # ── Schema
+    def _table(self, name: str, fieldnames: Optional[List[str]] = None) -> Optional[Table]:
+        if name in self._tables and fieldnames is None:
+            return self._tables[name]
+        if fieldnames is None:
+            with self.engine.connect() as conn:
+                raw = conn.execute(select(self.meta.c.fieldnames).where(self.meta.c.name == name)).scalar()
+            if raw is None:
+                return None
+            fieldnames = json.loads(raw)
+        md = MetaData()
+        cols = [Column("row_id", Integer, primary_key=True, autoincrement=True)]
+        cols += [Column(f, Text, key=f"c{i}") for i, f in enumerate(fieldnames)]
+        tbl = Table(_sql_name(name), md, *cols)
+        self._tables[name] = tbl
+        return tbl
+
+    def _name_column(self, name: str, fieldnames: List[str]) -> Optional[str]:
+        cols = build_table(name, fieldnames, []).columns
+        return cols.get("name")
+
+    # ── Import / export
+    def import_csv(self, name: str, path: Optional[str] = None, batch_size: int = 5000) -> int:
+        """Bulk-load a [UFG]_sQL.csv file, replacing the table. Returns row count."""
+        path = path or candidate_paths_first(TABLE_FILES[name])
+        if not path:
+            raise FileNotFoundError(TABLE_FILES[name])
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            fieldnames = next(reader, [])
+            return self._replace(name, fieldnames, reader, batch_size)
+
+    def import_all(self) -> Dict[str, int]:
+        out = {}
+        for name in TABLE_FILES:
+            if candidate_paths_first(TABLE_FILES[name]):
+                out[name] = self.import_csv(name)
+        return out
+
+    def _replace(self, name: str, fieldnames: List[str], values, batch_size: int) -> int:
+        with self._lock, self.engine.begin() as conn:
+            old = self._table(name)
+            if old is not None:
+                old.drop(conn, checkfirst=True)
+            tbl = self._table(name, fieldnames)
+            tbl.create(conn)
+            name_col = self._name_column(name, fieldnames)
+            if name_col:
+                conn.exec_driver_sql(
+                    f'CREATE INDEX "ix_{tbl.name}_name" ON "{tbl.name}" ("{name_col}")')
+            keys = [c.key for c in tbl.columns if c.key != "row_id"]
+            count, batch = 0, []
+            for v in values:
+                batch.append({k: (v[i] if i < len(v) else "") for i, k in enumerate(keys)})
+                if len(batch) >= batch_size:
+                    conn.execute(insert(tbl), batch); count += len(batch); batch = []
+            if batch:
+                conn.execute(insert(tbl), batch); count += len(batch)
+            self._bump(conn, name, fieldnames)
+        return count
+
+    def export_csv(self, name: str, path: str) -> int:
+        """Write a table back out in the [UFG]_sQL.csv format. Returns row count."""
+        fieldnames, rows = self.load_rows(name)
+        tmp = path + ".tmp"
+        with open(tmp, "w", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, fieldnames=fieldnames, lineterminator="\n")
+            w.writeheader()
+            w.writerows(rows)
+        os.replace(tmp, path)
+        return len(rows)
+
+    # ── Reads
+    def signature(self, name: str) -> Optional[Tuple[str, int]]:
+        with self.engine.connect() as conn:
+            v = conn.execute(select(self.meta.c.version).where(self.meta.c.name == name)).scalar()
+        return None if v is None else ("db", int(v))
+
+    def load_rows(self, name: str) -> Tuple[List[str], List[Dict[str, str]]]:
+        tbl = self._table(name)
+        if tbl is None:
+            return [], []
+        cols = [c for c in tbl.columns if c.key != "row_id"]
+        with self.engine.connect() as conn:
+            res = conn.execute(select(*cols).order_by(tbl.c.row_id))
+            fieldnames = [c.name for c in cols]
+            rows = [dict(zip(fieldnames, (v if v is not None else "" for v in r))) for r in res]
+        return fieldnames, rows
+
+    def find(self, name: str, value: str) -> List[Dict[str, str]]:
+        """Exact lookup on the indexed name column."""
+        tbl = self._table(name)
+        if tbl is None:
+            return []
+        fieldnames = [c.name for c in tbl.columns if c.key != "row_id"]
+        name_col = self._name_column(name, fieldnames)
+        if not name_col:
+            return []
+        col = next(c for c in tbl.columns if c.name == name_col)
+        cols = [c for c in tbl.columns if c.key != "row_id"]
+        with self.engine.connect() as conn:
+            res = conn.execute(select(*cols).where(col == value).order_by(tbl.c.row_id))
+            return [dict(zip(fieldnames, r)) for r in res]
+
+    # ── Writes (used by the journaled writer when a store is active)
+    def apply_entry(self, name: str, entry: Dict[str, Any]) -> None:
+        """Apply one add/edit/delete entry (positional index, as in the journal)."""
+        tbl = self._table(name)
+        if tbl is None:
+            raise KeyError(f"{name} has not been imported into the reference store")
+        by_name = {c.name: c.key for c in tbl.columns if c.key != "row_id"}
+        with self._lock, self.engine.begin() as conn:
+            if entry["op"] == "add":
+                conn.execute(insert(tbl), {by_name[c]: str(v) for c, v in entry.get("values", {}).items()
+                                           if c in by_name})
+            else:
+                rid = conn.execute(select(tbl.c.row_id).order_by(tbl.c.row_id)
+                                   .offset(int(entry["index"])).limit(1)).scalar()
+                if rid is None:
+                    raise IndexError(f"Row {entry['index']} out of range for {name}")
+                if entry["op"] == "edit":
+                    vals = {by_name[c]: str(v) for c, v in entry.get("values", {}).items() if c in by_name}
+                    if vals:
+                        conn.execute(update(tbl).where(tbl.c.row_id == rid).values(**vals))
+                elif entry["op"] == "delete":
+                    conn.execute(delete(tbl).where(tbl.c.row_id == rid))
+            self._bump(conn, name)
+
+    def _bump(self, conn, name: str, fieldnames: Optional[List[str]] = None) -> None:
+        cur = conn.execute(select(self.meta.c.version).where(self.meta.c.name == name)).scalar()
+        if cur is None:
+            conn.execute(insert(self.meta), {"name": name, "fieldnames": json.dumps(fieldnames or []),
+                                             "version": 1})
+        else:
+            vals: Dict[str, Any] = {"version": cur + 1}
+            if fieldnames is not None:
+                vals["fieldnames"] = json.dumps(fieldnames)
+            conn.execute(update(self.meta).where(self.meta.c.name == name).values(**vals))
+
+    def row_count(self, name: str) -> int:
+        tbl = self._table(name)
+        if tbl is None:
+            return 0
+        with self.engine.connect() as conn:
+            return int(conn.execute(select(func.count()).select_from(tbl)).scalar() or 0)
+
+def store_from_env() -> Optional[ReferenceStore]:
+    """ReferenceStore for SHOPQUOTE_REFERENCE_DB, importing the CSVs on first use."""
+    db_path = os.environ.get("SHOPQUOTE_REFERENCE_DB")
+    if not db_path or not SQLALCHEMY_AVAILABLE:
+        return None
+    store = ReferenceStore(db_path)
+    for name in TABLE_FILES:
+        if store.signature(name) is None and candidate_paths_first(TABLE_FILES[name]):
+            store.import_csv(name)
+    return store
@@ -0,0 +1,276 @@
+# logic/repricing_job.py
+"""
+Background mass re-pricing of saved sessions.
+
+When the Rates table or the operation defaults change, every saved session
+under ~/.shopquote/sessions is priced twice:
+- "old" uses the markup stored in the session and the Rates history in
+  effect on the quote's date, falling back to the session's stored rates;
+- "new" uses the current catalog rates and, optionally, the catalog
+  setup/run defaults for each operation.
+
+Sessions are priced in chunks (batch pricing, optionally across a process
+pool). Results are appended to a diff report CSV with one row per session
+and quantity. A checkpoint file lets an interrupted run resume where it
+stopped. The checkpoint carries a fingerprint of the "new" pricing inputs
+(rates, op defaults, Rates history, cost tables, threshold). A run resumes only if they
+are unchanged; otherwise it starts over under a new run_id. Quotes whose total moved by more than `threshold_pct` are flagged.
+
+Sessions themselves are never modified.
+"""
+from __future__ import annotations
+import csv, hashlib, json, logging, os, threading, time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from logic.pricing_batch import price_batch_columnar
+from logic.quote_utils import pricing_date
+
+logger = logging.getLogger(__name__)
+
+QUANTITIES = [1, 10, 25, 50]
+REPORT_FIELDS = ["session", "quote_number", "quantity", "old_total", "new_total", "delta", "delta_pct", "flagged"]
+
+@dataclass
+class RepriceReport:
+    run_id: str
+    sessions: int = 0
+    priced: int = 0
+    skipped: int = 0
+    failed: int = 0
+    flagged: List[str] = field(default_factory=list)
+    seconds: float = 0.0
+    report_path: Optional[str] = None
+    resumed: bool = False
+
+    @property
+    def quotes_per_sec(self) -> float:
+        return self.priced / self.seconds if self.seconds else 0.0
+
+def current_pricing_inputs(ops_from_catalog: bool) -> Tuple[Dict[str, float], Dict[str, Tuple[Optional[float], Optional[float]]]]:
+    """Current catalog rates and {op name: (setup_min, sec_per_op)} as plain data for workers."""
+    from core.catalog import get_catalog  # local import keeps workers free of catalog loading
+    cat = get_catalog()
+    r = cat.rates()
+    rates = {"setup": float(r.setup or 0.0), "labor": float(r.labor or 0.0), "machine": float(r.machine or 0.0)}
+    defaults = {}
+    if ops_from_catalog:
+        for op in cat.operations():
+            per_op = op.sec_per_op if op.sec_per_op is not None else op.time_sec
+            defaults[op.name.strip().lower()] = (op.setup_min, per_op)
+    return rates, defaults
+
+def pricing_fingerprint(new_rates: Dict[str, float],
+                        op_defaults: Dict[str, Tuple[Optional[float], Optional[float]]],
+                        threshold_pct: float) -> str:
+    """Hash of everything a run's prices depend on, including the Rates history and cost tables."""
+    from core.catalog import get_catalog  # local import keeps workers free of catalog loading
+    cat = get_catalog()
+    h = hashlib.blake2b(digest_size=16)
+    h.update(json.dumps([new_rates, sorted(op_defaults.items()), threshold_pct], default=str).encode("utf-8"))
+    for name in ("Rates", "Materials", "Hardware", "OutsideProcess"):
+        h.update(json.dumps(list(cat.table(name).rows), separators=(",", ":")).encode("utf-8"))
+    return h.hexdigest()
+
+def _session_jobs(path: str, new_rates: Dict[str, float],
+                  op_defaults: Dict[str, Tuple[Optional[float], Optional[float]]]) -> Tuple[tuple, tuple, Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    quote = data.get("quote") or {}
+    ops = [dict(r) for r in (data.get("operations") or []) if isinstance(r, dict)]
+    saved = data.get("rates") or {}
+    old_rates = {"setup": float(saved.get("setup_per_min", 60.0)),
+                 "labor": float(saved.get("labor_per_min", 1.0)),
+                 "machine": float(saved.get("machine_per_min", 1.5))}
+    markup = float(saved.get("markup_percent", 15.0))
+    new_ops = ops
+    if op_defaults:
+        new_ops = []
+        for r in ops:
+            d = op_defaults.get(str(r.get("operation", "")).strip().lower())
+            if d:
+                r = dict(r)
+                if d[0] is not None:
+                    r["setup_min"] = d[0]
+                if d[1] is not None:
+                    r["time_sec"] = d[1] * max(int(r.get("ops") or 1), 1)
+            new_ops.append(r)
+    meta = {"quote_number": quote.get("quote_number", "")}
+    # Old side at the rates in effect on the quote's date; new side at today's
+    return (ops, quote, old_rates, QUANTITIES, markup, pricing_date(quote)), (new_ops, quote, new_rates, QUANTITIES, markup), meta
+
+def reprice_chunk(paths: List[str], new_rates: Dict[str, float],
+                  op_defaults: Dict[str, Tuple[Optional[float], Optional[float]]],
+                  threshold_pct: float) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Price a chunk of session files old vs new. Returns (report rows, failed paths)."""
+    jobs, metas, names, failed = [], [], [], []
+    for p in paths:
+        try:
+            old, new, meta = _session_jobs(p, new_rates, op_defaults)
+        except Exception as e:
+            logger.error(f"Could not read session {p}: {str(e)}")
+            failed.append(p)
+            continue
+        jobs += [old, new]
+        metas.append(meta)
+        names.append(Path(p).stem)
+    rows: List[Dict[str, Any]] = []
+    if not jobs:
+        return rows, failed
+    res = price_batch_columnar(jobs)
+    for k, name in enumerate(names):
+        old_t, new_t = res.totals(2 * k), res.totals(2 * k + 1)
+        for q, o, n in zip(QUANTITIES, old_t.tolist(), new_t.tolist()):
+            delta = round(n - o, 2)
+            pct = (delta / o * 100.0) if o else (0.0 if not delta else float("inf"))
+            rows.append({"session": name, "quote_number": metas[k]["quote_number"], "quantity": q,
+                         "old_total": o, "new_total": n, "delta": delta, "delta_pct": round(pct, 2),
+                         "flagged": abs(pct) > threshold_pct})
+    return rows, failed
+
+class RepricingJob:
+    """Re-prices every saved session and writes a diff report (resumable)."""
+
+    def __init__(self, session_dir: Optional[str] = None, report_dir: Optional[str] = None,
+                 threshold_pct: float = 5.0, processes: Optional[int] = None,
+                 chunk_size: int = 200, ops_from_catalog: bool = False):
+        home = Path.home() / ".shopquote"
+        self.session_dir = Path(session_dir or home / "sessions")
+        self.report_dir = Path(report_dir or home / "reprice")
+        self.threshold_pct = threshold_pct
+        self.processes = processes
+        self.chunk_size = chunk_size
+        self.ops_from_catalog = ops_from_catalog
+        self.progress: Dict[str, int] = {"done": 0, "total": 0}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_report: Optional[RepriceReport] = None
+
+    @property
+    def checkpoint_path(self) -> Path:
+        return self.report_dir / "reprice.checkpoint.json"
+
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """The interrupted run's checkpoint, if any."""
+        try:
+            with open(self.checkpoint_path, encoding="utf-8") as f:
+                cp = json.load(f)
+            return cp if isinstance(cp, dict) and cp.get("run_id") else None
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _save_checkpoint(self, run_id: str, fingerprint: str, done: List[str]) -> None:
+        tmp = str(self.checkpoint_path) + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"run_id": run_id, "fingerprint": fingerprint, "done": done, "saved_at": time.time()}, f)
+        os.replace(tmp, self.checkpoint_path)
+
+    def run(self, run_id: Optional[str] = None) -> RepriceReport:
+        """Re-price all sessions.
+
+        An interrupted run (or the same run_id) resumes if it was priced with
+        the same inputs; if rates, op defaults or cost tables changed since,
+        a new run starts.
+        """
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        new_rates, op_defaults = current_pricing_inputs(self.ops_from_catalog)
+        fingerprint = pricing_fingerprint(new_rates, op_defaults, self.threshold_pct)
+        cp = self._load_checkpoint()
+        if cp is not None and cp.get("fingerprint") != fingerprint:
+            logger.info(f"Pricing inputs changed since run {cp['run_id']}; starting a new run")
+            if run_id == cp["run_id"]:
+                run_id = None   # its report holds rows priced with the old inputs
+            cp = None
+        run_id = run_id or (cp or {}).get("run_id") or time.strftime("%Y%m%d-%H%M%S")
+        report_path = self.report_dir / f"reprice-{run_id}.csv"
+        done = list(cp.get("done", [])) if cp is not None and cp["run_id"] == run_id else []
+        done_set = set(done)
+        paths = sorted(str(p) for p in self.session_dir.glob("*.json"))
+        todo = [p for p in paths if Path(p).stem not in done_set]
+        report = RepriceReport(run_id=run_id, sessions=len(paths), skipped=len(paths) - len(todo),
+                               report_path=str(report_path), resumed=bool(done))
+        self.progress = {"done": report.skipped, "total": len(paths)}
+        chunks = [todo[i:i + self.chunk_size] for i in range(0, len(todo), self.chunk_size)]
+        start = time.perf_counter()
+
+        new_file = not report_path.exists()
+        with open(report_path, "a", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, fieldnames=REPORT_FIELDS, lineterminator="\n")
+            if new_file:
+                w.writeheader()
+
+            def consume(chunk: List[str], rows: List[Dict[str, Any]], failed: List[str]) -> None:
+                w.writerows(rows)
+                f.flush()
+                report.failed += len(failed)
+                report.priced += len(chunk) - len(failed)
+                report.flagged += sorted({r["session"] for r in rows if r["flagged"]})
+                done.extend(Path(p).stem for p in chunk)
+                self._save_checkpoint(run_id, fingerprint, done)
+                self.progress["done"] += len(chunk)
+
+            if self.processes and self.processes > 1 and len(chunks) > 1:
+                import multiprocessing as mp
+                from concurrent.futures import ProcessPoolExecutor
+                with ProcessPoolExecutor(max_workers=self.processes, mp_context=mp.get_context("spawn")) as pool:
+                    futures = [(c, pool.submit(reprice_chunk, c, new_rates, op_defaults, self.threshold_pct))
+                               for c in chunks]
+                    for chunk, fut in futures:
+                        if self._stop.is_set():
+                            pool.shutdown(cancel_futures=True)
+                            break
+                        consume(chunk, *fut.result())
+            else:
+                for chunk in chunks:
+                    if self._stop.is_set():
+                        break
+                    consume(chunk, *reprice_chunk(chunk, new_rates, op_defaults, self.threshold_pct))
+
+        report.seconds = time.perf_counter() - start
+        if not self._stop.is_set() and self.checkpoint_path.exists():
+            self.checkpoint_path.unlink()  # finished; nothing to resume
+        logger.info(f"Re-priced {report.priced} sessions ({report.quotes_per_sec:,.0f} quotes/sec), "
+                    f"{len(report.flagged)} flagged beyond {self.threshold_pct}%")
+        self.last_report = report
+        return report
+
+    # ── Background execution
+    def start(self, run_id: Optional[str] = None) -> "RepricingJob":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run_safe, args=(run_id,), name="repricing-job", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run_safe(self, run_id: Optional[str]) -> None:
+        try:
+            self.run(run_id)
+        except Exception as e:
+            logger.error(f"Re-pricing job failed: {str(e)}")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+# Global re-pricing job instance
+_job: Optional[RepricingJob] = None
+
+def start_repricing_on_change(threshold_pct: float = 5.0, processes: Optional[int] = None) -> RepricingJob:
+    """Start a background re-pricing run whenever Rates or Operations are reloaded"""
+    global _job
+    if _job is None:
+        from core.catalog import get_catalog
+        _job = RepricingJob(threshold_pct=threshold_pct, processes=processes)
+
+        def _on_change(change) -> None:
+            if change.table in ("Rates", "Operations") and change.old_version is not None:
+                _job.ops_from_catalog = _job.ops_from_catalog or change.table == "Operations"
+                if not _job.is_running():
+                    _job.start()
+
+        get_catalog().subscribe(_on_change)
+    return _job
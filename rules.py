@@ -10,6 +10,14 @@ DENSITY = {
 
 FERROUS_MATERIALS = {"CRS", "HRS", "SS", "STAINLESS", "STEEL"}
 
+# Materials catalog row priced for each short material code
+MATERIAL_CATALOG_NAMES = {
+    "CRS": "Cold-Rolled Steel (A1008/A1011)", "STEEL": "Cold-Rolled Steel (A1008/A1011)",
+    "HRS": "Hot-Rolled Steel (A36)", "SS": "304 Stainless Steel", "STAINLESS": "304 Stainless Steel",
+    "ALUMINUM": "Aluminum 5052-H32", "AL": "Aluminum 5052-H32",
+    "COPPER": "Copper (C110)", "BRASS": "Brass (C260)",
+}
+
 # Reference thickness set (inches) with optional gauge labels
 THICKNESS_BASE: List[Tuple[float, Optional[str]]] = [
     (0.0478, "18GA"),
@@ -21,6 +29,20 @@ THICKNESS_BASE: List[Tuple[float, Optional[str]]] = [
 
 MATERIAL_CHOICES = ["CRS", "ALUMINUM", "SS", "COPPER", "BRASS", "HRS"]
 
+# Bend K-factor (neutral axis offset / thickness) for air bending
+K_FACTOR = {
+    "CRS": 0.44, "HRS": 0.44, "STEEL": 0.44, "SS": 0.45, "STAINLESS": 0.45,
+    "ALUMINUM": 0.40, "AL": 0.40, "COPPER": 0.42, "BRASS": 0.42,
+}
+DEFAULT_K_FACTOR = 0.44
+
+# Standard press-brake tooling radii (inches)
+BEND_RADII: List[float] = [0.0156, 0.0313, 0.0625, 0.0938, 0.125, 0.1875, 0.25]
+
+# Bend angle grid (degrees) for BA/BD tables: 1°-150° in half degrees.
+# Sharper bends and hems fall outside and are computed exactly.
+BEND_ANGLES: List[float] = [a / 2 for a in range(2, 301)]
+
 def _inch_3(x: float) -> float:
     return float(f"{x:.3f}")
 
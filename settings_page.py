@@ -1,5 +1,7 @@
 from taipy.gui import notify
 from logic.session_manager import save_current_session, load_session_to_state, get_session_manager
+from core.table_view import DISPLAY_TABLES, get_table_view_engine
+from core.catalog_journal import get_reference_writer
 
 def settings_page(state):
     """Settings page with database management"""
@@ -31,7 +33,13 @@ def settings_page(state):
 ## 📊 Database Management
 
 ### {selected_database} Data ({table_row_count} rows)
-<|{current_table}|table|show_all=True|width=100%|height=400px|>
+<|{table_filter}|input|label=Filter|on_change=on_table_filter|change_delay=250|>
+<|{table_sort_by}|selector|lov={table_columns}|dropdown=True|on_change=on_table_sort|label=Sort By|>
+<|{current_table}|table|show_all=True|width=100%|height=400px|editable=True|on_edit=on_edit_row|on_add=on_add_row|on_delete=on_delete_row|on_action=on_table_select|>
+
+<|Prev|button|on_action=on_table_prev_page|>
+Page {table_page + 1} of {table_page_count}
+<|Next|button|on_action=on_table_next_page|>
 
 <|Add Row|button|on_action=on_add_row|>
 <|Edit Row|button|on_action=on_edit_row|>
@@ -97,6 +105,16 @@ def settings_page(state):
     if not hasattr(state, 'selected_database'):
         state.selected_database = "Materials"
 
+    # Table window settings
+    if not hasattr(state, 'table_page'):
+        state.table_page = 0
+    if not hasattr(state, 'table_page_size'):
+        state.table_page_size = 50
+    if not hasattr(state, 'table_filter'):
+        state.table_filter = ""
+    if not hasattr(state, 'table_sort_by'):
+        state.table_sort_by = ""
+
     # Load current table data
     load_table_data(state)
 
@@ -107,32 +125,32 @@ def settings_page(state):
     return page_md
 
 def load_table_data(state):
-    """Load table data based on selected database"""
+    """Load the visible page of the selected database (filtered/sorted server-side)"""
     try:
-        import os
-        import pandas as pd
-
-        data_dir = os.path.join(os.path.dirname(__file__), "..", "data")
-
-        if state.selected_database == "Materials":
-            df = pd.read_csv(os.path.join(data_dir, "Materials[UFG]_sQL.csv"))
-        elif state.selected_database == "Operations":
-            df = pd.read_csv(os.path.join(data_dir, "Operations[UFG]_sQL.csv"))
-        elif state.selected_database == "Hardware":
-            df = pd.read_csv(os.path.join(data_dir, "Hardware[UFG]_sQL.csv"))
-        elif state.selected_database == "Outside Process":
-            df = pd.read_csv(os.path.join(data_dir, "OutsideProcess[UFG]_sQL.csv"))
-        elif state.selected_database == "Rates":
-            df = pd.read_csv(os.path.join(data_dir, "Rates[UFG]_sQL.csv"))
-        else:
-            df = pd.DataFrame()
-
-        state.current_table = df.to_dict('records')
-        state.table_row_count = len(df)
+        page_size = getattr(state, 'table_page_size', 50)
+        sort_by = getattr(state, 'table_sort_by', "") or None
+        text = getattr(state, 'table_filter', "")
+        page = get_table_view_engine().page(
+            state.selected_database,
+            offset=getattr(state, 'table_page', 0) * page_size,
+            limit=page_size,
+            sort_by=sort_by,
+            filters={"*": text} if text else None,
+        )
+
+        state.current_table = page.rows
+        state.table_row_ids = page.row_ids
+        state.table_row_count = page.total
+        state.table_columns = page.columns
+        state.table_page = page.offset // page.limit
+        state.table_page_count = page.page_count
 
     except Exception as e:
         state.current_table = [{"Error": f"Failed to load {state.selected_database}: {str(e)}"}]
+        state.table_row_ids = []
         state.table_row_count = 0
+        state.table_page = 0
+        state.table_page_count = 1
 
 def on_save_rates(state):
     """Save rate configuration"""
@@ -151,23 +169,91 @@ def on_save_rates(state):
 
 def on_database_change(state):
     """Handle database selection change"""
+    state.table_page = 0
+    state.table_filter = ""
+    state.table_sort_by = ""
     load_table_data(state)
     notify(state, "info", f"Loaded {state.table_row_count} rows from {state.selected_database}")
 
-def on_add_row(state):
-    """Add new row to selected database"""
-    notify(state, "info", "Add row functionality - implemented in Phase 5")
-    # TODO: Implement add row modal/form in Phase 5
+def on_table_filter(state):
+    """Apply the table filter server-side"""
+    state.table_page = 0
+    load_table_data(state)
+
+def on_table_sort(state):
+    """Sort the table server-side"""
+    state.table_page = 0
+    load_table_data(state)
+
+def on_table_prev_page(state):
+    """Show the previous page"""
+    if state.table_page > 0:
+        state.table_page -= 1
+        load_table_data(state)
+
+def on_table_next_page(state):
+    """Show the next page"""
+    if state.table_page + 1 < getattr(state, 'table_page_count', 1):
+        state.table_page += 1
+        load_table_data(state)
+
+def _selected_row(state, payload):
+    """(catalog row index, row as displayed) for a table payload (or the last clicked row)
+
+    The displayed row lets the writer re-locate it if other edits moved it.
+    """
+    idx = (payload or {}).get("index", getattr(state, 'table_selected', None))
+    row_ids = getattr(state, 'table_row_ids', [])
+    if idx is None or not 0 <= int(idx) < len(row_ids):
+        return None, None
+    return row_ids[int(idx)], state.current_table[int(idx)]
 
-def on_edit_row(state):
-    """Edit selected row"""
-    notify(state, "info", "Edit row functionality - implemented in Phase 5")
-    # TODO: Implement edit row modal/form in Phase 5
+def on_table_select(state, var_name=None, payload=None):
+    """Remember the clicked row for Edit/Delete buttons"""
+    state.table_selected = (payload or {}).get("index")
 
-def on_delete_row(state):
+def on_add_row(state, var_name=None, payload=None):
+    """Add new row to selected database (journaled; CSV compacted in background)"""
+    try:
+        table = DISPLAY_TABLES.get(state.selected_database, state.selected_database)
+        get_reference_writer().add_row(table, {})
+        state.table_page = getattr(state, 'table_page_count', 1)  # clamped to the last page
+        load_table_data(state)
+        notify(state, "success", f"Row added to {state.selected_database}")
+    except Exception as e:
+        notify(state, "error", f"Error adding row: {str(e)}")
+
+def on_edit_row(state, var_name=None, payload=None):
+    """Edit a cell of the selected row"""
+    if not payload or "col" not in payload:
+        notify(state, "info", "Double-click a cell in the table to edit it")
+        return
+    try:
+        row_id, row = _selected_row(state, payload)
+        if row_id is None:
+            notify(state, "warning", "Select a row to edit")
+            return
+        table = DISPLAY_TABLES.get(state.selected_database, state.selected_database)
+        get_reference_writer().edit_row(table, row_id, {payload["col"]: payload.get("value", "")}, expect=row)
+        load_table_data(state)
+        notify(state, "success", f"Updated {payload['col']}")
+    except Exception as e:
+        notify(state, "error", f"Error editing row: {str(e)}")
+
+def on_delete_row(state, var_name=None, payload=None):
     """Delete selected row"""
-    notify(state, "warning", "Delete row functionality - implemented in Phase 5")
-    # TODO: Implement delete confirmation and row removal in Phase 5
+    try:
+        row_id, row = _selected_row(state, payload)
+        if row_id is None:
+            notify(state, "warning", "Select a row to delete")
+            return
+        table = DISPLAY_TABLES.get(state.selected_database, state.selected_database)
+        get_reference_writer().delete_row(table, row_id, expect=row)
+        state.table_selected = None
+        load_table_data(state)
+        notify(state, "warning", f"Row deleted from {state.selected_database}")
+    except Exception as e:
+        notify(state, "error", f"Error deleting row: {str(e)}")
 
 def on_refresh_table(state):
     """Refresh the current table data"""
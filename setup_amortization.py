@@ -0,0 +1,131 @@
+# logic/setup_amortization.py
+"""
+Cross-quote setup amortization.
+
+Open quotes often run the same op on the same material and thickness (a
+Laser nest, a brake setup). Each quote alone pays its full setup_min ×
+rates["setup"]. The optimizer instead:
+1. hashes every op setup into a bucket keyed by (op, material, thickness),
+   which is one pass over all ops with no pairwise comparison;
+2. splits each bucket into production batches of at most `max_batch`
+   quotes, longest setups first;
+3. runs each batch with one setup, at the longest setup among its members,
+   and charges that setup back to the members in proportion to their own
+   setup minutes.
+
+The report lists each batch and, per quote, its setup cost alone vs
+amortized and the savings.
+"""
+from __future__ import annotations
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from logic.assembly_pricing import SetupKey, setup_key
+from logic.pricing import _safe_num
+
+Job = Tuple[str, List[Dict[str, Any]], Dict[str, Any]]   # (quote_id, ops, quote); ids must be unique
+
+@dataclass
+class SetupBatch:
+    key: SetupKey
+    members: List[Tuple[str, float]]   # (quote_id, own setup_min), longest first
+
+    @property
+    def setup_min(self) -> float:
+        """One setup for the whole batch: the longest member setup."""
+        return self.members[0][1] if self.members else 0.0
+
+    @property
+    def standalone_min(self) -> float:
+        return sum(m for _, m in self.members)
+
+@dataclass
+class QuoteSavings:
+    quote_id: str
+    label: str = ""              # display name (quote number), not necessarily unique
+    setup_before: float = 0.0    # $ pricing the quote alone
+    setup_after: float = 0.0     # $ share of the batches it joined
+    shared_ops: int = 0          # op setups run in a batch with other quotes
+
+    @property
+    def savings(self) -> float:
+        return round(self.setup_before - self.setup_after, 2)
+
+    @property
+    def savings_pct(self) -> float:
+        return round(self.savings / self.setup_before * 100.0, 2) if self.setup_before else 0.0
+
+@dataclass
+class AmortizationPlan:
+    batches: List[SetupBatch]
+    quotes: Dict[str, QuoteSavings] = field(default_factory=dict)
+    setup_rate: float = 0.0
+
+    @property
+    def total_savings(self) -> float:
+        return round(sum(q.savings for q in self.quotes.values()), 2)
+
+    def shared_batches(self) -> List[SetupBatch]:
+        return [b for b in self.batches if len(b.members) > 1]
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Per-quote report rows, largest savings first."""
+        out = [{"quote_id": q.quote_id, "quote_number": q.label or q.quote_id,
+                "setup_before": round(q.setup_before, 2), "setup_after": round(q.setup_after, 2),
+                "savings": q.savings,
+                "savings_pct": q.savings_pct, "shared_ops": q.shared_ops}
+               for q in self.quotes.values()]
+        out.sort(key=lambda r: -r["savings"])
+        return out
+
+def optimize_setups(jobs: List[Job], rates: Dict[str, float],
+                    max_batch: Optional[int] = None) -> AmortizationPlan:
+    """Group op setups across quotes by (op, material, thickness) and amortize them."""
+    setup_rate = float(rates.get("setup", 0.0))
+    buckets: Dict[SetupKey, Dict[str, float]] = {}
+    plan = AmortizationPlan(batches=[], setup_rate=setup_rate)
+    for quote_id, ops, quote in jobs:
+        qs = plan.quotes.setdefault(quote_id, QuoteSavings(quote_id, str((quote or {}).get("quote_number") or "")))
+        for r in ops:
+            m = _safe_num(r.get("setup_min"))
+            if m <= 0:
+                continue
+            qs.setup_before += m * setup_rate
+            b = buckets.setdefault(setup_key(r, quote or {}), {})
+            b[quote_id] = b.get(quote_id, 0.0) + m
+
+    size = max(int(max_batch), 1) if max_batch else None
+    for key, members in buckets.items():
+        ordered = sorted(members.items(), key=lambda kv: -kv[1])
+        step = size or len(ordered)
+        for i in range(0, len(ordered), step):
+            batch = SetupBatch(key=key, members=ordered[i:i + step])
+            plan.batches.append(batch)
+            cost = batch.setup_min * setup_rate
+            total = batch.standalone_min
+            for quote_id, m in batch.members:
+                qs = plan.quotes[quote_id]
+                qs.setup_after += cost * (m / total)
+                if len(batch.members) > 1:
+                    qs.shared_ops += 1
+    return plan
+
+def jobs_from_sessions(session_dir: Optional[str] = None) -> List[Job]:
+    """(quote_id, ops, quote) for every saved session, keyed by session file name.
+
+    Quote numbers are only labels: new sessions start from the same default
+    number, so keying by it would merge unrelated quotes.
+    """
+    d = Path(session_dir or Path.home() / ".shopquote" / "sessions")
+    jobs: List[Job] = []
+    for p in sorted(d.glob("*.json")):
+        try:
+            with open(p, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        quote = data.get("quote") or {}
+        ops = [r for r in (data.get("operations") or []) if isinstance(r, dict)]
+        jobs.append((p.stem, ops, quote))
+    return jobs
@@ -0,0 +1,256 @@
+# core/shared_catalog.py
+"""
+Publish the reference catalog once into a read-only shared-memory segment.
+
+Numeric record fields are stored as float64 arrays (NaN = missing) and
+string fields as an int64 offset index into a UTF-8 string pool. Worker
+processes attach by name and read the arrays in place (no parsing, no copy).
+
+Segment layout: b"SQCT" | uint32 header length | JSON header | 8-byte
+aligned column blocks. The header records the publisher's PID, so a
+leftover segment is replaced only when its publisher is gone.
+"""
+from __future__ import annotations
+import dataclasses, json, os, struct, time
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional
+import numpy as np
+from core.catalog import (TABLE_FILES, HardwareRecord, MaterialRecord, OperationRecord,
+                          OutsideProcessRecord, RatesRecord, ReferenceCatalog, get_catalog)
+
+MAGIC = b"SQCT"
+DEFAULT_SEGMENT = "shopquote_catalog"
+
+RECORD_TYPES = {
+    "Materials": MaterialRecord,
+    "Operations": OperationRecord,
+    "Hardware": HardwareRecord,
+    "OutsideProcess": OutsideProcessRecord,
+    "Rates": RatesRecord,
+}
+
+def _field_kind(f: dataclasses.Field) -> str:
+    t = str(f.type)
+    if "str" in t: return "str"
+    if "int" in t: return "int"
+    return "float"
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+class _Segment(shared_memory.SharedMemory):
+    """SharedMemory whose finalizer tolerates column views that outlive close()."""
+
+    def __del__(self):
+        try:
+            self.close()
+        except (OSError, BufferError):
+            pass
+
+def _open_segment(name: str) -> shared_memory.SharedMemory:
+    """Attach without registering with the resource tracker (which would
+    otherwise unlink the publisher's segment when this process exits)."""
+    try:
+        return _Segment(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        from multiprocessing import resource_tracker
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args, **kwargs: None
+        try:
+            return _Segment(name=name)
+        finally:
+            resource_tracker.register = register
+
+def _read_header(buf: memoryview) -> Dict[str, Any]:
+    if bytes(buf[:4]) != MAGIC:
+        raise ValueError("not a ShopQuote catalog segment")
+    (hlen,) = struct.unpack_from("<I", buf, 4)
+    return json.loads(bytes(buf[8:8 + hlen]).decode("utf-8"))
+
+def _pid_alive(pid: Any) -> bool:
+    if not isinstance(pid, int) or pid <= 0:
+        return False
+    if os.name == "nt":
+        return True  # Windows frees a segment with its last handle, so an existing one is live
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def _segment_owner_alive(name: str) -> bool:
+    """True if an existing segment `name` belongs to a running publisher."""
+    try:
+        shm = _open_segment(name)
+    except FileNotFoundError:
+        return False
+    try:
+        return _pid_alive(_read_header(shm.buf).get("pid"))
+    except (ValueError, struct.error):
+        return False   # not ours or torn: nobody can be serving it
+    finally:
+        shm.close()
+
+class SharedTable:
+    """Zero-copy view of one published table."""
+
+    def __init__(self, buf: memoryview, name: str, meta: Dict[str, Any]):
+        self.name = name
+        self.record_type = RECORD_TYPES[name]
+        self.n = int(meta["n"])
+        self._kinds: Dict[str, str] = meta["kinds"]
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._offsets: Dict[str, np.ndarray] = {}
+        self._pools: Dict[str, memoryview] = {}
+        for field, spec in meta["cols"].items():
+            if self._kinds[field] == "str":
+                off = np.frombuffer(buf, dtype=np.int64, count=self.n + 1, offset=spec[0])
+                off.flags.writeable = False
+                self._offsets[field] = off
+                self._pools[field] = buf[spec[1]:spec[1] + spec[2]].toreadonly()
+            else:
+                arr = np.frombuffer(buf, dtype=np.float64, count=self.n, offset=spec[0])
+                arr.flags.writeable = False
+                self._arrays[field] = arr
+
+    def __len__(self) -> int:
+        return self.n
+
+    def column(self, field: str) -> np.ndarray:
+        """Read-only float64 array for a numeric field (NaN where missing)."""
+        return self._arrays[field]
+
+    def string(self, field: str, i: int) -> str:
+        off = self._offsets[field]
+        return bytes(self._pools[field][off[i]:off[i + 1]]).decode("utf-8")
+
+    def strings(self, field: str) -> List[str]:
+        off = self._offsets[field]
+        pool = bytes(self._pools[field])
+        return [pool[off[i]:off[i + 1]].decode("utf-8") for i in range(self.n)]
+
+    def records(self) -> List[Any]:
+        """Materialize typed catalog records (copies)."""
+        cols = {}
+        for field, kind in self._kinds.items():
+            if kind == "str":
+                cols[field] = self.strings(field)
+            else:
+                arr = self._arrays[field]
+                cols[field] = [None if np.isnan(v) else (int(v) if kind == "int" else float(v))
+                               for v in arr.tolist()]
+        return [self.record_type(**{f: cols[f][i] for f in self._kinds}) for i in range(self.n)]
+
+class SharedCatalog:
+    """Attached (or owned) shared-memory catalog segment."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool = False):
+        self.shm = shm
+        self.owner = owner
+        buf = shm.buf
+        try:
+            header = _read_header(buf)
+        except ValueError:
+            raise ValueError(f"{shm.name} is not a ShopQuote catalog segment") from None
+        self.version = header["version"]
+        self.published_at = header["published_at"]
+        self.pid = header.get("pid")
+        self.tables: Dict[str, SharedTable] = {n: SharedTable(buf, n, m) for n, m in header["tables"].items()}
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def table(self, name: str) -> SharedTable:
+        return self.tables[name]
+
+    def close(self) -> None:
+        """Detach (and unlink, if owned).
+
+        Columns a caller still holds stay readable: the mapping is then
+        released when the last of them and this object are dropped.
+        """
+        for t in self.tables.values():  # release exported buffers before closing
+            for pool in t._pools.values():
+                pool.release()
+            t._arrays.clear(); t._offsets.clear(); t._pools.clear()
+        try:
+            self.shm.close()
+        except BufferError:
+            pass    # views still exported; _Segment closes the mapping when they are gone
+        if self.owner:
+            self.shm.unlink()
+
+def publish_catalog(catalog: Optional[ReferenceCatalog] = None,
+                    name: str = DEFAULT_SEGMENT) -> SharedCatalog:
+    """Serialize every catalog table into a new shared-memory segment."""
+    catalog = catalog or get_catalog()
+    blocks: List[bytes] = []
+    tables_meta: Dict[str, Any] = {}
+    pos = 0  # offset relative to the data area; fixed up below
+    versions = []
+    for tname in TABLE_FILES:
+        tbl = catalog.table(tname)
+        versions.append(tbl.version)
+        recs = tbl.records
+        rtype = RECORD_TYPES[tname]
+        kinds = {f.name: _field_kind(f) for f in dataclasses.fields(rtype)}
+        cols: Dict[str, List[int]] = {}
+        for field, kind in kinds.items():
+            vals = [getattr(r, field) for r in recs]
+            if kind == "str":
+                enc = [str(v or "").encode("utf-8") for v in vals]
+                offsets = np.zeros(len(enc) + 1, dtype=np.int64)
+                np.cumsum([len(b) for b in enc], out=offsets[1:])
+                pool = b"".join(enc)
+                cols[field] = [pos, pos + _align(offsets.nbytes), len(pool)]
+                blocks.append(offsets.tobytes().ljust(_align(offsets.nbytes), b"\0"))
+                blocks.append(pool.ljust(_align(len(pool)), b"\0"))
+                pos += _align(offsets.nbytes) + _align(len(pool))
+            else:
+                arr = np.array([np.nan if v is None else float(v) for v in vals], dtype=np.float64)
+                cols[field] = [pos]
+                blocks.append(arr.tobytes())
+                pos += arr.nbytes
+        tables_meta[tname] = {"n": len(recs), "kinds": kinds, "cols": cols}
+
+    published_at = time.time()
+
+    def encode(base: int) -> bytes:
+        shifted = {t: dict(m, cols={f: [s[0] + base] + ([s[1] + base, s[2]] if len(s) == 3 else [])
+                                    for f, s in m["cols"].items()})
+                   for t, m in tables_meta.items()}
+        return json.dumps({"version": versions, "published_at": published_at, "pid": os.getpid(),
+                           "tables": shifted}).encode("utf-8")
+
+    # Header size depends on the base offset digits; iterate to a fixed point
+    base = _align(8 + len(encode(0)))
+    while _align(8 + len(encode(base))) > base:
+        base = _align(8 + len(encode(base)))
+    header = encode(base)
+    size = base + pos
+
+    try:
+        shm = _Segment(name=name, create=True, size=max(size, 1))
+    except FileExistsError:
+        if _segment_owner_alive(name):
+            raise FileExistsError(f"Catalog segment {name} is published by a running process") from None
+        # Left over from a publisher that exited without unlinking
+        stale = shared_memory.SharedMemory(name=name)
+        stale.close(); stale.unlink()
+        shm = _Segment(name=name, create=True, size=max(size, 1))
+    buf = shm.buf
+    buf[:4] = MAGIC
+    struct.pack_into("<I", buf, 4, len(header))
+    buf[8:8 + len(header)] = header
+    off = base
+    for b in blocks:
+        buf[off:off + len(b)] = b
+        off += len(b)
+    return SharedCatalog(shm, owner=True)
+
+def attach_catalog(name: str = DEFAULT_SEGMENT) -> SharedCatalog:
+    """Attach to a published segment (read-only use; does not copy)."""
+    return SharedCatalog(_open_segment(name))
@@ -1,5 +1,6 @@
 from taipy.gui import notify
 from logic.export_manager import get_export_manager
+from logic.pricing_cache import get_pricing_cache, state_pricing_args
 
 def summary_page(state):
     """Summary page with final quote information"""
@@ -49,16 +50,16 @@ Description: {quote.description}
 """
 
     # Prepare pricing data
-    if hasattr(state, 'pricing_table') and state.pricing_table:
-        # Extract pricing from the table data
+    if hasattr(state, 'operations') and state.operations:
+        # Same cached result the breakdown page rendered
         try:
-            pricing_data = {row['Operation']: row for row in state.pricing_table}
-            total_row = pricing_data.get('Total', {})
+            _, summary = get_pricing_cache().pricing_table(*state_pricing_args(state))
+            grand = summary.get('per_qty_grand', {})
 
-            state.pricing_1 = float(total_row.get('1', '$0.00').replace('$', ''))
-            state.pricing_10 = float(total_row.get('10', '$0.00').replace('$', ''))
-            state.pricing_25 = float(total_row.get('25', '$0.00').replace('$', ''))
-            state.pricing_50 = float(total_row.get('50', '$0.00').replace('$', ''))
+            state.pricing_1 = float(grand.get(1, 0.0))
+            state.pricing_10 = float(grand.get(10, 0.0))
+            state.pricing_25 = float(grand.get(25, 0.0))
+            state.pricing_50 = float(grand.get(50, 0.0))
         except:
             state.pricing_1 = 0.00
             state.pricing_10 = 0.00
@@ -97,22 +98,11 @@ def on_export_pdf(state):
         quote_data = dict(state.quote) if hasattr(state, 'quote') else {}
         operations = list(state.operations) if hasattr(state, 'operations') else []
 
-        # Get pricing data
+        # Get pricing data (shared pricing cache)
         pricing_data = {}
-        if hasattr(state, 'pricing_table') and state.pricing_table:
-            pricing_data = {
-                'per_qty_grand': {}
-            }
-            for row in state.pricing_table:
-                if row.get('Operation') == 'Total':
-                    for qty in [1, 10, 25, 50]:
-                        qty_str = str(qty)
-                        if qty_str in row:
-                            price_str = row[qty_str].replace('$', '').replace(',', '')
-                            try:
-                                pricing_data['per_qty_grand'][qty] = float(price_str)
-                            except ValueError:
-                                pricing_data['per_qty_grand'][qty] = 0.0
+        if operations:
+            _, _, rates, quantities, markup, as_of = state_pricing_args(state)
+            pricing_data = export_manager.pricing_data(operations, quote_data, rates, quantities, markup, as_of)
 
         # Export to PDF
         filepath = export_manager.export_to_pdf(quote_data, operations, pricing_data)
@@ -132,22 +122,11 @@ def on_export_txt(state):
         quote_data = dict(state.quote) if hasattr(state, 'quote') else {}
         operations = list(state.operations) if hasattr(state, 'operations') else []
 
-        # Get pricing data
+        # Get pricing data (shared pricing cache)
         pricing_data = {}
-        if hasattr(state, 'pricing_table') and state.pricing_table:
-            pricing_data = {
-                'per_qty_grand': {}
-            }
-            for row in state.pricing_table:
-                if row.get('Operation') == 'Total':
-                    for qty in [1, 10, 25, 50]:
-                        qty_str = str(qty)
-                        if qty_str in row:
-                            price_str = row[qty_str].replace('$', '').replace(',', '')
-                            try:
-                                pricing_data['per_qty_grand'][qty] = float(price_str)
-                            except ValueError:
-                                pricing_data['per_qty_grand'][qty] = 0.0
+        if operations:
+            _, _, rates, quantities, markup, as_of = state_pricing_args(state)
+            pricing_data = export_manager.pricing_data(operations, quote_data, rates, quantities, markup, as_of)
 
         # Export to TXT
         filepath = export_manager.export_to_txt(quote_data, operations, pricing_data)
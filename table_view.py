@@ -0,0 +1,111 @@
+# core/table_view.py
+"""
+Windowed, server-side filtered/sorted views over cached catalog tables.
+
+Only the requested page is copied out; filters and sort orders are cached
+as row-index lists keyed by table version, so paging is cheap.
+"""
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from core.catalog import CatalogTable, get_catalog
+
+# Settings page labels → catalog table names
+DISPLAY_TABLES: Dict[str, str] = {
+    "Materials": "Materials",
+    "Operations": "Operations",
+    "Hardware": "Hardware",
+    "Outside Process": "OutsideProcess",
+    "Rates": "Rates",
+}
+
+@dataclass(frozen=True)
+class TablePage:
+    rows: List[Dict[str, Any]]
+    total: int
+    offset: int
+    limit: int
+    columns: List[str]
+    row_ids: List[int]  # index of each page row in the catalog table
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-self.total // self.limit)) if self.limit else 1
+
+def _sort_key(v: Any) -> Tuple[int, Any]:
+    s = str(v if v is not None else "").strip()
+    try:
+        return (0, float(s))
+    except ValueError:
+        return (1, s.lower())
+
+class TableViewEngine:
+    """Offset/limit paging, column sort and substring filters over catalog tables."""
+
+    def __init__(self, max_cached_views: int = 32):
+        self.max_cached_views = max_cached_views
+        self._views: "OrderedDict[tuple, List[int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _indices(self, tbl: CatalogTable, sort_by: Optional[str], descending: bool,
+                 filters: Tuple[Tuple[str, str], ...]) -> Optional[List[int]]:
+        """Row order for a view, or None for the identity order (no filter/sort)."""
+        if not filters and not sort_by:
+            return None
+        key = (tbl.name, tbl.version, sort_by, descending, filters)
+        with self._lock:
+            idx = self._views.get(key)
+            if idx is not None:
+                self._views.move_to_end(key)
+                return idx
+        rows = tbl.rows
+        if filters:
+            needles = [(col, needle.lower()) for col, needle in filters]
+            idx = [i for i, r in enumerate(rows)
+                   if all(n in str(r.get(c, "") if c != "*" else " ".join(map(str, r.values()))).lower()
+                          for c, n in needles)]
+        else:
+            idx = list(range(len(rows)))
+        if sort_by:
+            idx.sort(key=lambda i: _sort_key(rows[i].get(sort_by)), reverse=descending)
+        with self._lock:
+            self._views[key] = idx
+            while len(self._views) > self.max_cached_views:
+                self._views.popitem(last=False)
+        return idx
+
+    def page(self, table: str, offset: int = 0, limit: int = 50,
+             sort_by: Optional[str] = None, descending: bool = False,
+             filters: Optional[Dict[str, str]] = None) -> TablePage:
+        """Return one window of `table`. Filter column "*" matches any column."""
+        tbl = get_catalog().table(DISPLAY_TABLES.get(table, table))
+        if sort_by and sort_by not in tbl.fieldnames:
+            sort_by = None
+        flt = tuple(sorted((c, str(v).strip()) for c, v in (filters or {}).items()
+                           if str(v or "").strip() and (c == "*" or c in tbl.fieldnames)))
+        idx = self._indices(tbl, sort_by, descending, flt)
+        total = len(tbl.rows) if idx is None else len(idx)
+        limit = max(int(limit or 0), 1)
+        offset = min(max(int(offset or 0), 0), max(total - 1, 0))
+        offset -= offset % limit
+        window = range(offset, min(offset + limit, total))
+        row_ids = list(window) if idx is None else [idx[i] for i in window]
+        rows = [dict(tbl.rows[i]) for i in row_ids]
+        return TablePage(rows=rows, total=total, offset=offset, limit=limit,
+                         columns=list(tbl.fieldnames), row_ids=row_ids)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._views.clear()
+
+# Global table view engine instance
+_engine: Optional[TableViewEngine] = None
+
+def get_table_view_engine() -> TableViewEngine:
+    """Get the global table view engine instance"""
+    global _engine
+    if _engine is None:
+        _engine = TableViewEngine()
+    return _engine
@@ -0,0 +1,74 @@
+"""
+Test setup: make the `core` / `logic` packages importable and give the
+parity tests a reproducible stream of random quotes.
+
+Modules name their package in their first line (`# core/x.py`). When the
+packages aren't importable as laid out, they are assembled in a temp dir
+from those headers, with the reference CSVs linked under data/.
+"""
+import os, random, re, sys, tempfile
+from pathlib import Path
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def _package_shim() -> None:
+    try:
+        import core.catalog, logic.pricing  # noqa: F401
+        return
+    except ImportError:
+        pass
+    base = Path(tempfile.mkdtemp(prefix="shopquote-tests-"))
+    for pkg in ("core", "logic", "data"):
+        (base / pkg).mkdir()
+    for pkg in ("core", "logic"):
+        (base / pkg / "__init__.py").touch()
+    for f in ROOT.glob("*.py"):
+        with open(f, encoding="utf-8") as fh:
+            m = re.match(r"# (core|logic)/(\w+\.py)", fh.readline())
+        if m:
+            os.symlink(f, base / m.group(1) / m.group(2))
+    for f in ROOT.glob("*.csv"):
+        os.symlink(f, base / "data" / f.name)
+    sys.path.insert(0, str(base))
+
+_package_shim()
+
+MATERIALS = ["Aluminum 5052-H32", "Aluminum 6061-T6", "SS", "CRS", "AL", None, "Unobtainium"]
+HARDWARE = ["051-15142-002", "1/4-20 HELI-COIL", "PEM-XYZ"]
+OUTSIDE = ["Anodize Type I Clear", "Anodize Type II Black", "Powder Coat", "Passivate"]
+
+def random_case(r: random.Random):
+    """(ops, quote, rates, quantities, markup_percent) with catalog and ad-hoc items."""
+    # Shop-style values (tenths of a minute, whole rates) land on half cents often
+    ops = [{"operation": name, "setup_min": r.choice([0, round(r.uniform(0, 60), 1)]),
+            "time_sec": r.choice([0, round(r.uniform(0, 300), r.choice([0, 1, 2]))])}
+           for name in r.choices(["Laser", "Form", "Deburr", "PEM", "Weld", "Tapping"], k=r.randint(0, 12))]
+    quote = {"material": r.choice(MATERIALS),
+             "thickness_in": r.choice([0, 0.063, 0.125, r.uniform(0.02, 0.5)]),
+             "flat_size_width": r.uniform(1, 40) if r.random() < 0.85 else 0,
+             "flat_size_height": r.uniform(1, 40) if r.random() < 0.85 else 0,
+             "bend_count": r.choice([0, r.randint(1, 8)])}
+    if r.random() < 0.5:
+        quote["material_utilization"] = r.choice([0.7, 1, 0, 2])
+    quote["hardware"] = [dict({"type": r.choice(HARDWARE), "qty": r.randint(1, 6)},
+                              **({"unit_cost": r.uniform(0, 2)} if r.random() < 0.5 else {}))
+                         for _ in range(r.randint(0, 3))]
+    outside = []
+    for _ in range(r.randint(0, 4)):
+        d, k = {"name": r.choice(OUTSIDE)}, r.random()
+        if k < 0.3:
+            d["unit_cost_per_part"] = r.uniform(0, 5)
+        elif k < 0.6:
+            d["unit_cost_per_sqin"] = r.uniform(0, 0.5)
+        outside.append(d)
+    quote["outside_processes"] = outside
+    rates = {"setup": r.choice([75.0, 82.5, r.uniform(40, 120)]), "labor": float(r.randint(40, 120)),
+             "machine": r.choice([275.0, r.uniform(50, 300)])}
+    quantities = r.sample([1, 2, 5, 10, 25, 50, 100, 250, 1000], r.randint(1, 5))
+    return ops, quote, rates, quantities, r.choice([0, 15, 22.5, 30])
+
+@pytest.fixture(scope="session")
+def cases():
+    """1,500 reproducible random quotes."""
+    return [random_case(random.Random(i)) for i in range(1500)]
@@ -0,0 +1,49 @@
+import json
+import pytest
+from logic.assembly_pricing import AssemblyNode, AssemblyPricer, assembly_from_dict, assembly_to_dict
+from logic.pricing import compute_pricing_table
+
+def test_single_node_matches_pricing_table(cases):
+    for ops, quote, rates, quantities, markup in cases:
+        pricer = AssemblyPricer([AssemblyNode("part", ops=ops, quote=quote)])
+        table, summary = pricer.pricing_table(rates, quantities, markup)
+        expected, _ = compute_pricing_table(ops, quote, rates, quantities, markup)
+        assert table == expected
+
+def test_child_quantity_scales_lines_and_shares_setups():
+    rates = {"setup": 75.0, "labor": 80.0, "machine": 275.0}
+    part = {"ops": [{"operation": "Laser", "setup_min": 10, "time_sec": 30}],
+            "quote": {"material": "CRS", "thickness_in": 0.06, "hardware": [{"type": "PEM", "qty": 2, "unit_cost": 0.5}]}}
+    pricer = AssemblyPricer([AssemblyNode("top", children=[("a", 3), ("b", 1)]),
+                             AssemblyNode("a", **part), AssemblyNode("b", **part)])
+    table, summary = pricer.pricing_table(rates, [1], 0.0)
+    assert table["HW-[PEM(8)]"][1] == 4.0                 # 4 units × 2 PEMs × $0.50
+    assert not any(label.startswith("HW-[PEM(2)") for label in table)
+    assert summary["setup_min_shared"] == 10 and summary["setup_min_unshared"] == 20
+    assert table["Runtime"][1] == pytest.approx(4 * 0.5 * 355.0, abs=0.01)
+
+def test_hardware_rows_merge_by_type_with_total_pieces():
+    rates = {"setup": 75.0, "labor": 80.0, "machine": 275.0}
+    hw = lambda qty: {"hardware": [{"type": "PEM", "qty": qty, "unit_cost": 0.5}]}
+    pricer = AssemblyPricer([AssemblyNode("top", quote=hw(4), children=[("a", 2)]), AssemblyNode("a", quote=hw(2))])
+    table, _ = pricer.pricing_table(rates, [1, 10], 0.0)
+    assert [label for label in table if label.startswith("HW-")] == ["HW-[PEM(8)]"]   # 4 + 2 × 2
+    assert table["HW-[PEM(8)]"] == {1: 4.0, 10: 40.0}
+
+def test_dict_round_trip():
+    data = {"root": "frame",
+            "nodes": {"frame": {"ops": [{"operation": "Weld", "setup_min": 30, "time_sec": 240}], "quote": {},
+                                "children": [{"name": "rail", "qty": 2}, {"name": "bracket", "qty": 4}]},
+                      "rail": {"ops": [{"operation": "Laser", "setup_min": 10, "time_sec": 45}],
+                               "quote": {"material": "CRS", "thickness_in": 0.125, "flat_size_width": 30,
+                                         "flat_size_height": 4}, "children": []},
+                      "bracket": {"ops": [{"operation": "Form", "setup_min": 8, "time_sec": 12}],
+                                  "quote": {"material": "CRS", "thickness_in": 0.125,
+                                            "hardware": [{"type": "PEM", "qty": 2, "unit_cost": 0.3}]},
+                                  "children": []}}}
+    pricer = assembly_from_dict(json.loads(json.dumps(data)))
+    assert assembly_to_dict(pricer) == data
+    again = assembly_from_dict(assembly_to_dict(pricer))
+    rates = {"setup": 75.0, "labor": 80.0, "machine": 275.0}
+    assert again.pricing_table(rates, [1, 5], 20.0) == pricer.pricing_table(rates, [1, 5], 20.0)
+    assert pricer.cost().counts == {"frame": 1, "rail": 2, "bracket": 4}
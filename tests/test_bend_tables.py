@@ -0,0 +1,46 @@
+import numpy as np
+from logic.bend_tables import BendTable, bend_allowance, get_bend_table
+from logic.estimator import calc_ba, calc_ba_array, calc_bd, calc_bd_array
+
+K = 0.44
+
+def _exact(a, r, t):
+    ba = calc_ba_array(a, r, K, t)
+    return ba, calc_bd_array(a, r, t, ba)
+
+def test_array_helpers_match_scalar_formulas():
+    rng = np.random.default_rng(3)
+    a, r, t = rng.uniform(1, 150, 200), rng.uniform(0.01, 0.3, 200), rng.uniform(0.02, 0.25, 200)
+    ba, bd = _exact(a, r, t)
+    assert ba.tolist() == [calc_ba(*x, K, y) for x, y in zip(zip(a, r), t)]
+    assert bd.tolist() == [calc_bd(x, y, z, w) for x, y, z, w in zip(a, r, t, ba)]
+
+def test_interpolation_inside_grid():
+    table = BendTable(K)
+    rng = np.random.default_rng(24)
+    n = 20_000
+    a = rng.uniform(table.angles[0], table.angles[-1], n)
+    r = rng.uniform(table.radii[0], table.radii[-1], n)
+    t = rng.uniform(table.thicknesses[0], table.thicknesses[-1], n)
+    ba, bd = table.lookup(a, r, t)
+    exact_ba, exact_bd = _exact(a, r, t)
+    assert np.abs(ba - exact_ba).max() < 1e-12        # BA is linear in every axis
+    assert np.abs(bd - exact_bd).max() < 2e-4         # documented 0.0002" BD tolerance
+    # Grid points come back as stored
+    ga, gr, gt = table.angles[[0, 179, -1]], table.radii[[0, 3, -1]], table.thicknesses[[0, 2, -1]]
+    ba, bd = table.lookup(ga, gr, gt)
+    assert bd.tolist() == [table.bd[0, 0, 0], table.bd[2, 3, 179], table.bd[-1, -1, -1]]
+
+def test_outside_grid_is_exact():
+    table = BendTable(K)
+    a = np.array([0.5, 90.0, 160.0, 90.0, 90.0])
+    r = np.array([0.06, 0.001, 0.06, 0.5, 0.06])
+    t = np.array([0.06, 0.06, 0.06, 0.06, 1.0])
+    ba, bd = table.lookup(a, r, t)
+    exact_ba, exact_bd = _exact(a, r, t)
+    assert ba.tolist() == exact_ba.tolist() and bd.tolist() == exact_bd.tolist()
+
+def test_tables_shared_per_k_factor():
+    assert get_bend_table(k_factor=K) is get_bend_table(k_factor=K)
+    ba, bd = bend_allowance(90.0, 0.0625, 0.06, k_factor=K)
+    assert bd.shape == () and float(bd) > 0
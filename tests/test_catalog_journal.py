@@ -0,0 +1,51 @@
+import random
+import pytest
+from core.catalog import ReferenceCatalog, build_table
+from core.catalog_journal import ChunkedRows, ReferenceWriter, _read_entries, apply_entries, journal_path
+
+def test_chunked_rows_match_list_edits():
+    r = random.Random(4)
+    ref = list(range(2000))
+    rows = ChunkedRows(ref)
+    for _ in range(3000):
+        k = r.random()
+        if k < 0.4 and ref:
+            i = r.randrange(len(ref)); v = r.random()
+            ref[i] = v; rows = rows.replaced(i, v)
+        elif k < 0.7 or not ref:
+            v = r.random(); ref.append(v); rows = rows.appended(v)
+        else:
+            i = r.randrange(len(ref)); del ref[i]; rows = rows.deleted(i)
+    assert list(rows) == ref and len(rows) == len(ref)
+    assert rows[-1] == ref[-1] and rows[5:40:3] == ref[5:40:3]
+
+def test_edit_leaves_previous_version_unchanged():
+    fields = ["hardware_name", "unit_cost", "default_qty"]
+    tbl = build_table("Hardware", fields, [{"hardware_name": f"P{i}", "unit_cost": "1", "default_qty": "1"}
+                                           for i in range(1500)])
+    new = apply_entries(tbl, [{"op": "edit", "index": 700, "values": {"unit_cost": "2.5"}},
+                              {"op": "delete", "index": 0},
+                              {"op": "add", "values": {"hardware_name": "NEW", "unit_cost": "3"}}], version=2)
+    assert tbl.rows[700]["unit_cost"] == "1" and tbl.records[700].unit_cost == 1.0
+    assert new.rows[699]["unit_cost"] == "2.5" and new.records[699].unit_cost == 2.5
+    assert len(new.rows) == len(new.records) == 1500
+    assert new.rows[-1]["hardware_name"] == new.records[-1].name == "NEW"
+
+def test_stale_index_is_relocated_or_rejected(tmp_path):
+    fields = ["hardware_name", "unit_cost", "default_qty"]
+    rows = [{"hardware_name": f"P{i}", "unit_cost": "1", "default_qty": "1"} for i in range(1500)]
+    catalog = ReferenceCatalog(check_interval=1e9)
+    catalog.publish(build_table("Hardware", fields, rows, path=str(tmp_path / "Hardware.csv")))
+    writer = ReferenceWriter(catalog, compact_delay=60)
+    seen = dict(catalog.table("Hardware").rows[700])
+
+    writer.delete_row("Hardware", 0, expect=catalog.table("Hardware").rows[0])  # another session
+    writer.edit_row("Hardware", 700, {"unit_cost": "2.5"}, expect=seen)
+    tbl = catalog.table("Hardware")
+    assert tbl.rows[699]["hardware_name"] == "P700" and tbl.rows[699]["unit_cost"] == "2.5"
+    assert tbl.rows[700]["unit_cost"] == "1"
+
+    with pytest.raises(ValueError):
+        writer.delete_row("Hardware", 699, expect=seen)  # changed since it was read
+    assert len(catalog.table("Hardware").rows) == 1499
+    assert _read_entries(journal_path(tbl.path))[-1]["row"]["hardware_name"] == "P700"
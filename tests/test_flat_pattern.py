@@ -0,0 +1,26 @@
+import pytest
+from logic.flat_pattern import MAX_BEND_ANGLE, Bend, BendAngleError, FlatPattern
+
+FLANGES = {"width": [2.0, 3.0, 2.0], "height": [5.0]}
+
+def test_non_hem_angle_above_table_is_rejected():
+    with pytest.raises(BendAngleError):
+        FlatPattern(FLANGES, [Bend(179.4, 0.06), Bend(90, 0.06)], 0.06)
+
+def test_hem_and_table_edge_are_accepted():
+    fp = FlatPattern(FLANGES, [Bend(MAX_BEND_ANGLE, 0.06), Bend(179.4, 0.06, type="HEM"), Bend(180, 0.06)], 0.06)
+    assert fp.width > 0
+
+def test_rejected_edit_leaves_pattern_unchanged():
+    bends = [Bend(90, 0.06), Bend(90, 0.06)]
+    fp = FlatPattern(FLANGES, bends, 0.06)
+    width = fp.width
+    with pytest.raises(BendAngleError):
+        fp.sync([Bend(90, 0.06), Bend(179, 0.06)])
+    with pytest.raises(BendAngleError):
+        fp.sync([Bend(90, 0.06), Bend(90, 0.06), Bend(170, 0.06)])
+    with pytest.raises(BendAngleError):
+        fp.set_bend(1, angle=160.0)
+    with pytest.raises(BendAngleError):
+        fp.add_bend(Bend(155, 0.06))
+    assert fp.bends == bends and len(fp.deductions) == 2 and fp.width == width
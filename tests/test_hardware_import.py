@@ -0,0 +1,19 @@
+import pytest
+from core.hardware_import import import_hardware
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+def test_merge_into_file_without_name_column_is_rejected(tmp_path):
+    src = _write(tmp_path / "vendor.csv", "SKU,Each\nPEM-1,0.10\n")
+    dest = _write(tmp_path / "Hardware.csv", "color,weight\nred,1\n")
+    with pytest.raises(ValueError, match="no part-name column"):
+        import_hardware(src, dest=dest)
+    assert (tmp_path / "Hardware.csv").read_text(encoding="utf-8") == "color,weight\nred,1\n"
+
+def test_merge_keeps_existing_names(tmp_path):
+    src = _write(tmp_path / "vendor.csv", "SKU,Each\nPEM-1,0.10\nPEM-2,0.20\n")
+    dest = _write(tmp_path / "Hardware.csv", "hardware_name,unit_cost,default_qty\nPEM-1,0.05,1\n")
+    report = import_hardware(src, dest=dest)
+    assert report.accepted == 1 and report.duplicates == 1
@@ -0,0 +1,23 @@
+import random
+from logic.material_alternatives import explore_materials
+from logic.pricing import compute_pricing_table
+
+def test_cells_match_rematerialed_quote(cases):
+    r = random.Random(21)
+    checked = 0
+    for ops, quote, rates, quantities, markup in cases[:300]:
+        alt = explore_materials(ops, quote, rates, quantities, markup)
+        cells = [(m, t) for m in range(len(alt.materials)) for t in range(len(alt.thicknesses))]
+        for m, t in r.sample(cells, min(4, len(cells))):
+            requote = dict(quote, material=alt.materials[m], thickness_in=float(alt.thicknesses[t]))
+            table, _ = compute_pricing_table(ops, requote, rates, quantities, markup)
+            assert alt.totals[m, t].tolist() == [table["Total"][q] for q in quantities]
+            checked += 1
+    assert checked > 500
+
+def test_ranked_is_cheapest_first():
+    ops = [{"operation": "Laser", "setup_min": 10, "time_sec": 30}]
+    quote = {"flat_size_width": 12, "flat_size_height": 8}
+    alt = explore_materials(ops, quote, {"setup": 75.0, "labor": 80.0, "machine": 275.0}, [1, 10], 15.0)
+    totals = [row["totals"][10] for row in alt.ranked(10)]
+    assert len(totals) == alt.combinations and totals == sorted(totals)
@@ -0,0 +1,11 @@
+import pytest
+from core import cost_index
+from logic.pricing import compute_pricing_table
+
+def test_catalog_errors_are_not_swallowed(monkeypatch):
+    def broken():
+        raise RuntimeError("bad Materials CSV")
+    monkeypatch.setattr(cost_index, "get_cost_index", broken)
+    quote = {"material": "CRS", "thickness_in": 0.06, "flat_size_width": 10, "flat_size_height": 5}
+    with pytest.raises(RuntimeError, match="bad Materials CSV"):
+        compute_pricing_table([], quote, {"setup": 75.0, "labor": 80.0, "machine": 275.0}, [1], 0)
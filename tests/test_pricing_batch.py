@@ -0,0 +1,16 @@
+from logic.pricing import compute_pricing_table
+from logic.pricing_batch import price_batch, price_batch_columnar
+
+def test_batch_matches_pricing_table(cases):
+    res = price_batch_columnar(cases)
+    assert len(res) == len(cases)
+    for i, (ops, quote, rates, quantities, markup) in enumerate(cases):
+        expected = compute_pricing_table(ops, quote, rates, quantities, markup)
+        assert res.table(i) == expected
+        assert res.totals(i).tolist() == list(expected[0]["Total"].values())
+
+def test_repeated_breaks_and_empty_jobs():
+    rates = {"setup": 75.0, "labor": 80.0, "machine": 275.0}
+    ops = [{"operation": "Laser", "setup_min": 12.5, "time_sec": 33}]
+    jobs = [(ops, {}, rates, [10, 1, 10], 15), ([], {}, rates, None, 0), (ops, {}, rates, [0], 30)]
+    assert price_batch(jobs) == [compute_pricing_table(*job) for job in jobs]
@@ -0,0 +1,28 @@
+import numpy as np
+from logic.pricing_breaks import BreakSolver
+
+RATES = {"setup": 75.0, "labor": 80.0, "machine": 275.0}
+
+def test_zero_cost_quote():
+    solver = BreakSolver([], {}, RATES, 15.0)
+    assert solver.break_quantities() == [1]
+    ladder = solver.ladder(4, min_qty=10)
+    assert ladder.breaks == [10] and ladder.unit_prices == [0.0] and ladder.max_overcharge == 0.0
+    assert solver.quantity_below(0.0) == 1
+
+def test_setup_only_quote():
+    solver = BreakSolver([{"operation": "Laser", "setup_min": 30, "time_sec": 0}], {}, RATES, 15.0)
+    breaks = solver.break_quantities()
+    assert breaks[0] == 1 and breaks == sorted(set(breaks))
+    ladder = solver.ladder(3, max_qty=1000)
+    assert len(ladder.breaks) == 3 and np.isfinite(ladder.max_overcharge)
+
+def test_crossover_lands_on_the_exact_curve(cases):
+    for ops, quote, rates, _, markup in cases[:150]:
+        solver = BreakSolver(ops, quote, rates, markup, max_qty=2000)
+        if solver.model.setup <= 0:
+            continue
+        u = solver.unit_prices(np.arange(1, 2001))
+        target = float(u[0] + u[-1]) / 2
+        q = solver.quantity_below(target)
+        assert q is not None and u[q - 1] <= target and (q == 1 or u[q - 2] > target)
@@ -0,0 +1,42 @@
+from datetime import date
+from types import SimpleNamespace
+from logic import pricing_cache
+from logic.export_manager import ExportManager
+from logic.pricing import compute_pricing_table
+from logic.pricing_cache import PricingCache, get_pricing_cache, pricing_key, state_pricing_args
+from logic.pricing_model import PricingModel
+from logic.quote_utils import auto_quote_number
+
+STATE = SimpleNamespace(
+    operations=[{"operation": "Laser", "setup_min": 10, "time_sec": 30},
+                {"operation": "Form", "setup_min": 12.5, "time_sec": 7.3}],
+    quote={"thickness_in": 0.125, "flat_size_width": 10, "flat_size_height": 5, "material": "CRS",
+           "hardware": [{"type": "PEM-XYZ", "qty": 2, "unit_cost": 0.35}]},
+    rates_setup_per_min=75.0, rates_labor_per_min=80.0, rates_machine_per_min=275.0,
+    pricing_markup_percent=22.5)
+
+def test_breakdown_render_is_a_summary_and_export_hit(monkeypatch, tmp_path):
+    monkeypatch.setattr(pricing_cache, "_pricing_cache", PricingCache(watch_rates=False))
+    cache = get_pricing_cache()
+    ops, quote, rates, quantities, markup, _ = state_pricing_args(STATE)
+
+    # Breakdown page: priced by the incremental model on a miss
+    def _reprice():
+        model = PricingModel()
+        model.sync(ops, quote, rates, quantities, markup)
+        return model.table()
+    rendered = cache.pricing_table(ops, quote, rates, quantities, markup, compute=_reprice)
+    assert rendered == compute_pricing_table(ops, quote, rates, quantities, markup)
+
+    # Summary page and export read the same entry
+    assert cache.pricing_table(*state_pricing_args(STATE)) is rendered
+    exported = ExportManager(str(tmp_path)).pricing_data(ops, quote, rates, quantities, markup)
+    assert exported is rendered[1]
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 1
+
+def test_reopened_quote_prices_at_its_date():
+    old = SimpleNamespace(**dict(vars(STATE), quote=dict(STATE.quote, quote_number="SQ-20200115-004")))
+    today = SimpleNamespace(**dict(vars(STATE), quote=dict(STATE.quote, quote_number=auto_quote_number())))
+    assert state_pricing_args(old)[5] == date(2020, 1, 15)
+    assert state_pricing_args(today)[5] is None
+    assert pricing_key(*state_pricing_args(old)) != pricing_key(*state_pricing_args(STATE))
@@ -0,0 +1,47 @@
+from decimal import ROUND_HALF_UP, Decimal
+from logic.pricing import compute_pricing_table
+from logic.pricing_cents import format_cents, price_cents
+
+RATES = {"setup": 75.0, "labor": 80.0, "machine": 275.0}
+
+def cents(x) -> int:
+    return int((Decimal(x) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+def test_rows_track_pricing_table_and_sum_exactly(cases):
+    for ops, quote, rates, quantities, markup in cases:
+        t = price_cents(ops, quote, rates, quantities, markup)
+        expected, _ = compute_pricing_table(ops, quote, rates, quantities, markup)
+        assert list(t.all_rows()) == list(expected)
+        for label, vals in t.rows.items():
+            # The float path rounds half-cents either way; a row is never off by more
+            assert all(abs(int(c) - round(expected[label][int(q)] * 100)) <= 1
+                       for q, c in zip(t.quantities, vals)), label
+        assert (t.subtotal == sum(t.rows.values())).all()
+        assert (t.total == t.subtotal + t.markup).all()
+
+def test_half_cents_round_up_exactly():
+    ops = [{"operation": "Laser", "setup_min": 0.3, "time_sec": 2.7}]
+    quote = {"hardware": [{"type": "PEM-XYZ", "qty": 1, "unit_cost": 1.005}]}
+    t = price_cents(ops, quote, RATES, [1, 3, 1000], 12.5)
+    q = [1, 3, 1000]
+    hw = [label for label in t.rows if label.startswith("HW-")][0]
+    assert t.rows["Setup"].tolist() == [cents(Decimal("0.3") * 75)] * 3
+    assert t.rows["Runtime"].tolist() == [cents(Decimal("2.7") / 60 * 355 * n) for n in q]
+    assert t.rows[hw].tolist() == [cents(Decimal("1.005") * n) for n in q]
+    assert t.markup.tolist() == [cents(Decimal(int(s)) / 100 * Decimal("0.125")) for s in t.subtotal]
+
+def test_huge_quantities_stay_exact():
+    ops = [{"operation": "Laser", "setup_min": 0, "time_sec": 300}]
+    t = price_cents(ops, {}, RATES, [10 ** 9], 0)
+    assert int(t.rows["Runtime"][0]) == cents(Decimal(300) / 60 * 355 * 10 ** 9)
+    # Subtotal × markup basis points would wrap int64 (7.5e15 cents × 3000)
+    ops = [{"operation": "Laser", "setup_min": 1e12, "time_sec": 0}]
+    t = price_cents(ops, {}, RATES, [1, 10 ** 9], 30.0)
+    subtotal = Decimal(10 ** 12) * 75
+    assert int(t.subtotal[0]) == cents(subtotal)
+    assert int(t.markup[0]) == cents(subtotal * Decimal("0.3"))
+    assert int(t.total[0]) == cents(subtotal * Decimal("1.3"))
+
+def test_format_cents():
+    assert format_cents(123456789) == "$1,234,567.89"
+    assert format_cents(-5) == "-$0.05"
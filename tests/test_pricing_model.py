@@ -0,0 +1,28 @@
+from logic.pricing import compute_pricing_table
+from logic.pricing_model import PricingModel
+
+def test_model_matches_pricing_table(cases):
+    for ops, quote, rates, quantities, markup in cases:
+        model = PricingModel(ops, quote, rates, quantities, markup)
+        assert model.table() == compute_pricing_table(ops, quote, rates, quantities, markup)
+
+def test_sync_matches_pricing_table(cases):
+    model = PricingModel()
+    for ops, quote, rates, quantities, markup in cases:
+        model.sync(ops, quote, rates, quantities, markup)
+        assert model.table() == compute_pricing_table(ops, quote, rates, quantities, markup)
+
+def test_op_edits_match_pricing_table(cases):
+    for (ops, quote, rates, quantities, markup), (other, *_) in zip(cases, cases[1:]):
+        model = PricingModel(ops, quote, rates, quantities, markup)
+        edited = list(ops)
+        for i, row in enumerate(other[:len(ops)]):
+            edited[i] = row
+            model.set_op(i, row)
+        for row in other[len(ops):]:
+            edited.append(row)
+            model.add_op(row)
+        if edited:
+            edited.pop(0)
+            model.remove_op(0)
+        assert model.table() == compute_pricing_table(edited, quote, rates, quantities, markup)
@@ -0,0 +1,28 @@
+import numpy as np
+from logic.pricing import compute_pricing_table
+from logic.pricing_montecarlo import simulate
+
+def test_zero_sigma_matches_pricing_table(cases):
+    for ops, quote, rates, quantities, markup in cases:
+        table, _ = compute_pricing_table(ops, quote, rates, quantities, markup)
+        res = simulate(ops, quote, rates, quantities, markup, samples=4, runtime_rel_sigma=0, seed=1)
+        expected = [table["Total"][int(q)] for q in res.quantities]
+        assert res.totals.shape == (4, len(expected))
+        assert (res.totals == np.array(expected)).all(), quote
+
+def test_no_form_op_and_no_bends():
+    ops = [{"operation": "Laser", "setup_min": 10, "time_sec": 30}]
+    quote = {"thickness_in": 0.125, "flat_size_width": 10, "flat_size_height": 5, "bend_count": 0}
+    rates = {"setup": 75.0, "labor": 80.0, "machine": 275.0}
+    res = simulate(ops, quote, rates, [1, 10], samples=8, runtime_rel_sigma=0, seed=0)
+    table, _ = compute_pricing_table(ops, quote, rates, [1, 10], 15.0)
+    assert (res.totals == [table["Total"][1], table["Total"][10]]).all()
+
+def test_duplicate_outside_process_label_keeps_last_value():
+    quote = {"thickness_in": 0.1, "flat_size_width": 10, "flat_size_height": 10,
+             "outside_processes": [{"name": "Paint", "unit_cost_per_sqin": 0.1},
+                                   {"name": "Paint", "unit_cost_per_part": 3.0}]}
+    rates = {"setup": 75.0, "labor": 80.0, "machine": 275.0}
+    table, _ = compute_pricing_table([], quote, rates, [1], 15.0)
+    res = simulate([], quote, rates, [1], samples=4, max_rel_sigma=0, runtime_rel_sigma=0)
+    assert (res.totals[:, 0] == table["Total"][1]).all()
@@ -0,0 +1,36 @@
+import itertools
+import random
+import numpy as np
+from logic.pricing import compute_pricing_table
+from logic.pricing_sweep import AXES, pct_steps, sweep
+
+STEPS = [-10.0, 0.0, 12.5]
+
+def _totals(ops, quote, result, idx, quantities):
+    v = {a: float(result.values[a][i]) for a, i in zip(AXES, idx)}
+    table, _ = compute_pricing_table(ops, quote, {"setup": v["setup"], "labor": v["labor"], "machine": v["machine"]},
+                                     quantities, v["markup"])
+    return [table["Total"][q] for q in quantities]
+
+def test_base_and_grid_cells_match_pricing_table(cases):
+    r = random.Random(17)
+    grid = list(itertools.product(range(len(STEPS)), repeat=len(AXES)))
+    for ops, quote, rates, quantities, markup in cases[:300]:
+        result = sweep(ops, quote, rates, quantities, markup, setup=STEPS, labor=STEPS, machine=STEPS, markup=STEPS)
+        assert result.totals.shape == (3, 3, 3, 3, len(quantities))
+        assert result.base.tolist() == _totals(ops, quote, result, result.base_index, quantities)
+        for idx in r.sample(grid, 6):
+            assert result.totals[idx].tolist() == _totals(ops, quote, result, idx, quantities)
+
+def test_tornado_moves_one_axis():
+    ops = [{"operation": "Laser", "setup_min": 12.0, "time_sec": 45}]
+    rates = {"setup": 75.0, "labor": 80.0, "machine": 275.0}
+    result = sweep(ops, {}, rates, [1, 10], 20.0, labor=pct_steps(10, 5), markup=[-50, 50])
+    rows = {t["axis"]: t for t in result.tornado()}
+    assert list(rows) == list(AXES)
+    assert (rows["setup"]["low"] == rows["setup"]["base"]).all()       # not swept
+    assert rows["labor"]["low_pct"] == -10 and rows["labor"]["high_pct"] == 10
+    assert (rows["labor"]["low"] < rows["labor"]["base"]).all() and (rows["labor"]["high"] > rows["labor"]["base"]).all()
+    high = compute_pricing_table(ops, {}, rates, [1, 10], 30.0)[0]["Total"]
+    assert rows["markup"]["high"].tolist() == [high[1], high[10]]
+    assert np.array_equal(result.delta()[result.base_index], np.zeros(2))
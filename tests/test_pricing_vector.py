@@ -0,0 +1,22 @@
+import numpy as np
+from logic.pricing import compute_pricing_table
+from logic.pricing_vector import as_quantities, compute_pricing_table_vec, price_curve, round2
+
+def test_vector_matches_pricing_table(cases):
+    for ops, quote, rates, quantities, markup in cases:
+        assert compute_pricing_table_vec(ops, quote, rates, quantities, markup) == \
+            compute_pricing_table(ops, quote, rates, quantities, markup)
+
+def test_round2_matches_python_round():
+    vals = np.concatenate([np.arange(0, 100_000) / 1000.0, np.arange(1, 10_000) * 0.005 + 1e-12,
+                           [0.125, 0.375, 2.675, 1.005, 1e12 + 0.005, -0.125, -2.675]])
+    assert round2(vals).tolist() == [round(float(v), 2) for v in vals]
+
+def test_quantities_default_and_clamp():
+    assert as_quantities(None).tolist() == [1, 10, 25, 50]
+    assert as_quantities([0, -3, 7]).tolist() == [1, 1, 7]
+    assert as_quantities(np.array([], dtype=np.int64)).tolist() == []
+
+def test_empty_quote_prices_to_zero():
+    curve = price_curve([], {}, {"setup": 75.0, "labor": 80.0, "machine": 275.0}, [1, 10], 25.0)
+    assert curve.total.tolist() == [0.0, 0.0]
@@ -0,0 +1,31 @@
+import json
+from logic.repricing_job import RepricingJob, current_pricing_inputs, pricing_fingerprint
+
+def _sessions(tmp_path, n=3):
+    d = tmp_path / "sessions"
+    d.mkdir()
+    for i in range(n):
+        (d / f"s{i}.json").write_text(json.dumps({
+            "quote": {"quote_number": f"Q{i}"},
+            "operations": [{"operation": "Laser", "setup_min": 10 + i, "time_sec": 30}],
+            "rates": {"setup_per_min": 1.0, "labor_per_min": 1.0, "machine_per_min": 1.0}}))
+    return d
+
+def _checkpoint(job, fingerprint):
+    job.report_dir.mkdir(parents=True, exist_ok=True)
+    job.checkpoint_path.write_text(json.dumps({"run_id": "old", "fingerprint": fingerprint,
+                                               "done": ["s0", "s1"]}))
+
+def test_resumes_when_inputs_match(tmp_path):
+    job = RepricingJob(session_dir=str(_sessions(tmp_path)), report_dir=str(tmp_path / "reports"))
+    _checkpoint(job, pricing_fingerprint(*current_pricing_inputs(False), job.threshold_pct))
+    report = job.run()
+    assert (report.run_id, report.resumed, report.skipped, report.priced) == ("old", True, 2, 1)
+
+def test_starts_over_when_inputs_changed(tmp_path):
+    job = RepricingJob(session_dir=str(_sessions(tmp_path)), report_dir=str(tmp_path / "reports"))
+    _checkpoint(job, "priced-under-other-rates")
+    for run_id in (None, "old"):
+        report = job.run(run_id)
+        assert report.run_id != "old" and not report.resumed and report.priced == 3
+        _checkpoint(job, "priced-under-other-rates")
@@ -0,0 +1,15 @@
+import json
+from logic.setup_amortization import jobs_from_sessions, optimize_setups
+
+def test_sessions_sharing_a_quote_number_stay_separate(tmp_path):
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.json").write_text(json.dumps({
+            "quote": {"quote_number": "SQ-20250101-001", "material": "CRS", "thickness_in": 0.06},
+            "operations": [{"operation": "Laser", "setup_min": 10, "time_sec": 30}]}))
+    jobs = jobs_from_sessions(str(tmp_path))
+    assert [j[0] for j in jobs] == ["a", "b"]
+    plan = optimize_setups(jobs, {"setup": 60.0})
+    rows = {r["quote_id"]: r for r in plan.rows()}
+    assert rows["a"]["setup_before"] == rows["b"]["setup_before"] == 600.0
+    assert rows["a"]["quote_number"] == "SQ-20250101-001"
+    assert plan.total_savings == 600.0
@@ -0,0 +1,27 @@
+import os
+import pytest
+from core.catalog import ReferenceCatalog
+from core.shared_catalog import attach_catalog, publish_catalog
+
+@pytest.fixture
+def published():
+    owner = publish_catalog(ReferenceCatalog(), name=f"shopquote_test_{os.getpid()}")
+    yield owner
+    owner.close()
+
+def test_columns_are_read_only(published):
+    col = attach_catalog(published.name).table("Hardware").column("unit_cost")
+    with pytest.raises(ValueError):
+        col[0] = 0.0
+
+def test_close_while_a_column_is_held(published):
+    sc = attach_catalog(published.name)
+    col = sc.table("Hardware").column("unit_cost")
+    expected = float(col[0])
+    sc.close()
+    assert float(col[0]) == expected
+
+def test_live_publisher_segment_is_not_replaced(published):
+    with pytest.raises(FileExistsError):
+        publish_catalog(ReferenceCatalog(), name=published.name)
+    assert attach_catalog(published.name).pid == os.getpid()